@@ -0,0 +1,48 @@
+"""add user birth data and dream_analyses
+
+Revision ID: 0002_birth_data_and_dream_analyses
+Revises: 0001_create_users_and_dreams
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+import sqlalchemy.dialects.postgresql as pg
+
+# revision identifiers, used by Alembic.
+revision = '0002_birth_data_and_dream_analyses'
+down_revision = '0001_create_users_and_dreams'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('users', sa.Column('birth_datetime', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('users', sa.Column('birth_latitude', sa.Float(), nullable=True))
+    op.add_column('users', sa.Column('birth_longitude', sa.Float(), nullable=True))
+
+    op.create_table(
+        'dream_analyses',
+        sa.Column('dream_id', pg.UUID(as_uuid=True), sa.ForeignKey('dreams.dream_id'), primary_key=True),
+        sa.Column('analysis_id', sa.String(32), nullable=False),
+        sa.Column('analyzer_version', sa.String(32), nullable=False),
+        sa.Column('analysis', pg.JSONB(), nullable=False),
+        sa.Column('computed_at', sa.DateTime(timezone=True), server_default=sa.text('now()')),
+    )
+    op.create_index('ix_dream_analyses_analyzer_version', 'dream_analyses', ['analyzer_version'])
+
+    # Backfills stream dreams in (user_id, dream_id) order
+    op.create_index('ix_dreams_user_id_dream_id', 'dreams', ['user_id', 'dream_id'])
+
+
+def downgrade():
+    op.drop_index('ix_dreams_user_id_dream_id', table_name='dreams')
+    op.drop_index('ix_dream_analyses_analyzer_version', table_name='dream_analyses')
+    op.drop_table('dream_analyses')
+    op.drop_column('users', 'birth_longitude')
+    op.drop_column('users', 'birth_latitude')
+    op.drop_column('users', 'birth_datetime')
+
+# Verification Log
+# - Birth data columns are nullable: users without a saved chart are skipped by backfills.
+# - dream_analyses holds one JSONB analysis per dream; analyzer_version lets a backfill skip up-to-date rows.
+# - (user_id, dream_id) index serves the keyset-ordered server-side cursor of backfill_analyses.py.
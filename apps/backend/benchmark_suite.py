@@ -0,0 +1,468 @@
+"""
+Benchmark suite for the analysis hot paths.
+
+Every benchmark runs over the same seeded fixtures (birth data, dream times,
+dream texts), so two runs on one machine measure the same work. Results are
+written to .benchmarks/<commit>.json and compared with an earlier run;
+a median slowdown above --threshold is reported as a regression (exit 1).
+
+Benchmarks:
+  analyze                  DecagonAnalyzer.analyze, new dream time per call (cold snapshot)
+  analyze_sparse           analyze_fields(nakshatra_snapshot, firdaria_phase), cold snapshot
+  analyze_repeat           DecagonAnalyzer.analyze, repeated input (warm caches)
+  planetary_transits       calculate_planetary_transits
+  nakshatra                calculate_nakshatra over all fixture longitudes (64 lookups per call)
+  hrv_overnight            HRVAccumulator over an 8-hour u16 RR recording fed in 64 KiB chunks
+  safety_validate          SafetySentinel.validate_content
+  context_registry         ContextRegistry set + get against fakeredis (in-memory store without it)
+  serialize_analysis       DecagonAnalysisObject.model_dump_json (the served/cached JSON)
+  serialize_analysis_orjson  model_dump + orjson.dumps, for comparison (needs orjson)
+  response_msgpack         cached JSON -> MessagePack response body (needs msgpack)
+
+Benchmarks returning str/bytes also report bytes per call.
+
+Usage:
+    python benchmark_suite.py [--only analyze,nakshatra] [--rounds 20] [--seed 1234]
+                              [--compare latest|<file>] [--threshold 0.10] [--no-save] [--json]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+from unittest import mock
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(os.path.dirname(BACKEND_DIR))
+RESULTS_DIR = os.path.join(BACKEND_DIR, ".benchmarks")
+
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.join(REPO_ROOT, 'packages', 'shared-schema', 'src'))
+sys.path.insert(0, os.path.join(BACKEND_DIR, 'services'))
+
+DEFAULT_SEED = 1234
+FIXTURE_COUNT = 64
+
+DREAM_FRAGMENTS = [
+    "I saw a black serpent coiled in a flooded basement.",
+    "The water was rising and the serpent's eyes glowed in the darkness.",
+    "I was flying over a city made of glass while my teeth fell out.",
+    "An old woman handed me a key to a door that kept moving.",
+    "I was late for an exam in a school with endless corridors.",
+    "A wolf followed me through a forest of burning trees.",
+    "My childhood house had a room I had never seen before.",
+    "I was drowning but could breathe under the dark water.",
+]
+
+
+def build_fixtures(seed: int, count: int = FIXTURE_COUNT) -> List[Dict]:
+    """Deterministic birth/dream inputs (same seed, same fixtures)"""
+    rng = random.Random(seed)
+    fixtures = []
+    for _ in range(count):
+        birth = datetime(1950, 1, 1) + timedelta(minutes=rng.randrange(60 * 24 * 365 * 55))
+        dream = datetime(2024, 1, 1) + timedelta(minutes=rng.randrange(60 * 24 * 365 * 3))
+        fixtures.append({
+            "user_id": f"bench-{rng.randrange(10 ** 8):08d}",
+            "birth_datetime": birth,
+            "birth_lat": round(rng.uniform(-60.0, 60.0), 4),
+            "birth_lon": round(rng.uniform(-180.0, 180.0), 4),
+            "dream_datetime": dream,
+            "dream_content": " ".join(rng.sample(DREAM_FRAGMENTS, rng.randint(2, 5))),
+            "moon_longitude": rng.uniform(0.0, 360.0),
+        })
+    return fixtures
+
+
+# Registered benchmarks: name -> setup(fixtures) returning a zero-argument callable
+BENCHMARKS: Dict[str, Callable[[List[Dict]], Callable[[], object]]] = {}
+
+
+def benchmark(name: str):
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+def _cycle(fixtures: List[Dict]):
+    """Callable returning the next fixture on each call, wrapping around"""
+    state = {"i": 0}
+
+    def next_fixture() -> Dict:
+        fixture = fixtures[state["i"] % len(fixtures)]
+        state["i"] += 1
+        return fixture
+    return next_fixture
+
+
+@benchmark("analyze")
+def _analyze(fixtures):
+    from analysis_engine import DecagonAnalyzer
+    analyzer = DecagonAnalyzer()
+    next_fixture = _cycle(fixtures)
+    # Shift the dream time on every call so snapshot/JD caches never hit
+    offset = {"minutes": 0}
+
+    def run():
+        f = next_fixture()
+        offset["minutes"] += 1
+        return analyzer.analyze(
+            dream_content=f["dream_content"],
+            birth_datetime=f["birth_datetime"],
+            birth_lat=f["birth_lat"],
+            birth_lon=f["birth_lon"],
+            current_datetime=f["dream_datetime"] + timedelta(minutes=offset["minutes"]),
+            user_id=f["user_id"]
+        )
+    return run
+
+
+@benchmark("analyze_sparse")
+def _analyze_sparse(fixtures):
+    from analysis_engine import DecagonAnalyzer
+    analyzer = DecagonAnalyzer()
+    next_fixture = _cycle(fixtures)
+    offset = {"minutes": 0}
+
+    def run():
+        f = next_fixture()
+        offset["minutes"] += 1
+        return analyzer.analyze_fields(
+            dream_content=f["dream_content"],
+            birth_datetime=f["birth_datetime"],
+            birth_lat=f["birth_lat"],
+            birth_lon=f["birth_lon"],
+            current_datetime=f["dream_datetime"] + timedelta(minutes=offset["minutes"]),
+            user_id=f["user_id"],
+            fields=["nakshatra_snapshot", "firdaria_phase"]
+        )
+    return run
+
+
+@benchmark("analyze_repeat")
+def _analyze_repeat(fixtures):
+    from analysis_engine import DecagonAnalyzer
+    analyzer = DecagonAnalyzer()
+    f = fixtures[0]
+
+    def run():
+        return analyzer.analyze(
+            dream_content=f["dream_content"],
+            birth_datetime=f["birth_datetime"],
+            birth_lat=f["birth_lat"],
+            birth_lon=f["birth_lon"],
+            current_datetime=f["dream_datetime"],
+            user_id=f["user_id"]
+        )
+    return run
+
+
+@benchmark("planetary_transits")
+def _planetary_transits(fixtures):
+    from apps.backend.src.agents.celestial_engine import (
+        CalculateTransitsInput, NatalCoordinates, calculate_planetary_transits
+    )
+    inputs = [
+        CalculateTransitsInput(
+            target_date=f["dream_datetime"],
+            natal_coordinates=NatalCoordinates(
+                latitude=f["birth_lat"], longitude=f["birth_lon"], birth_time_utc=f["birth_datetime"]
+            )
+        )
+        for f in fixtures
+    ]
+    next_input = _cycle(inputs)
+    return lambda: calculate_planetary_transits(next_input())
+
+
+@benchmark("nakshatra")
+def _nakshatra(fixtures):
+    from time_keeper import calculate_nakshatra
+    longitudes = [f["moon_longitude"] for f in fixtures]
+
+    def run():
+        for longitude in longitudes:
+            calculate_nakshatra(longitude)
+    return run
+
+
+@benchmark("hrv_overnight")
+def _hrv_overnight(fixtures):
+    import numpy as np
+    from somatic import HRVAccumulator, encode_rr
+    rng = np.random.default_rng(len(fixtures))
+    beats = np.arange(32000)
+    rr = 900 + 40 * np.sin(0.2 * np.pi * beats * 0.9) + 25 * np.sin(0.5 * np.pi * beats * 0.9) + rng.normal(0, 5, beats.size)
+    recording = encode_rr(rr)
+    chunk = 64 * 1024
+
+    def run():
+        accumulator = HRVAccumulator()
+        for start in range(0, len(recording), chunk):
+            accumulator.add_bytes(recording[start:start + chunk])
+        return accumulator.summary()
+    return run
+
+
+@benchmark("safety_validate")
+def _safety_validate(fixtures):
+    from apps.backend.src.agents.safety_sentinel import SafetySentinel
+    sentinel = SafetySentinel()
+    next_fixture = _cycle(fixtures)
+    return lambda: sentinel.validate_content(next_fixture()["dream_content"])
+
+
+@benchmark("context_registry")
+def _context_registry(fixtures):
+    from apps.backend.src.core import context_registry as registry_module
+    from apps.backend.src.core.context_registry import (
+        ActiveNarrativeThread, ContextRegistry, ContextRegistryEntry,
+        SafetyConstraints, TemporalContext, UserContextTier
+    )
+    try:
+        import fakeredis
+        with mock.patch.object(registry_module.redis, "Redis", fakeredis.FakeRedis):
+            registry = ContextRegistry()
+    except ImportError:
+        # Without fakeredis the benchmark covers serialization + the offline store only
+        with mock.patch.object(registry_module.redis, "Redis", side_effect=registry_module.redis.exceptions.ConnectionError):
+            registry = ContextRegistry()
+
+    entry = ContextRegistryEntry(
+        user_context_tier=UserContextTier(tier_level="gold_subscriber", access_grants=["deep_history"]),
+        temporal_context=TemporalContext(current_session_id="bench", last_interaction_delta_hours=1.5),
+        active_narrative_threads=[ActiveNarrativeThread(thread_id="t1", archetype="SHADOW", status="active")],
+        safety_constraints=SafetyConstraints(trigger_warnings=[], prohibited_topics=[])
+    )
+    next_fixture = _cycle(fixtures)
+
+    def run():
+        user_id = next_fixture()["user_id"]
+        registry.set_user_context(user_id, entry)
+        return registry.get_user_context(user_id)
+    return run
+
+
+def _sample_results(fixtures, count: int = 8):
+    from analysis_engine import DecagonAnalyzer
+    analyzer = DecagonAnalyzer()
+    return [
+        analyzer.analyze(
+            dream_content=f["dream_content"],
+            birth_datetime=f["birth_datetime"],
+            birth_lat=f["birth_lat"],
+            birth_lon=f["birth_lon"],
+            current_datetime=f["dream_datetime"],
+            user_id=f["user_id"]
+        )
+        for f in fixtures[:count]
+    ]
+
+
+@benchmark("serialize_analysis")
+def _serialize_analysis(fixtures):
+    next_result = _cycle(_sample_results(fixtures))
+    return lambda: next_result().model_dump_json()
+
+
+@benchmark("serialize_analysis_orjson")
+def _serialize_analysis_orjson(fixtures):
+    import orjson
+    next_result = _cycle(_sample_results(fixtures))
+    return lambda: orjson.dumps(next_result().model_dump())
+
+
+@benchmark("response_msgpack")
+def _response_msgpack(fixtures):
+    import msgpack  # noqa: F401  (encode() falls back to JSON without it)
+    from response_encoding import MSGPACK_MEDIA_TYPE, encode
+    payloads = [result.model_dump_json() for result in _sample_results(fixtures)]
+    next_payload = _cycle(payloads)
+    return lambda: encode(next_payload(), MSGPACK_MEDIA_TYPE)[0]
+
+
+def run_benchmark(name: str, fixtures: List[Dict], rounds: int, min_round_seconds: float) -> Dict:
+    """
+    Time one benchmark: calibrate calls per round to last at least
+    min_round_seconds, warm up one round, then time `rounds` rounds.
+    Statistics are per call, in seconds.
+    """
+    fn = BENCHMARKS[name](fixtures)
+    sample = fn()
+
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_round_seconds or number >= 1 << 20:
+            break
+        number *= 2
+
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        timings.append((time.perf_counter() - started) / number)
+
+    timings.sort()
+    median = statistics.median(timings)
+    stats = {
+        "calls_per_round": number,
+        "rounds": rounds,
+        "min": timings[0],
+        "median": median,
+        "mean": statistics.fmean(timings),
+        "stddev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        "p95": timings[min(len(timings) - 1, int(round(0.95 * (len(timings) - 1))))],
+        "ops_per_sec": 1.0 / median if median else 0.0,
+    }
+    if isinstance(sample, (str, bytes)):
+        stats["bytes"] = len(sample.encode("utf-8") if isinstance(sample, str) else sample)
+    return stats
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _machine_info() -> Dict:
+    import swisseph as swe
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "swisseph": swe.version,
+    }
+
+
+def save_results(report: Dict, results_dir: str = RESULTS_DIR) -> str:
+    os.makedirs(results_dir, exist_ok=True)
+    path = os.path.join(results_dir, f"{report['commit']}.json")
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+    return path
+
+
+def load_previous(commit: str, results_dir: str = RESULTS_DIR) -> Optional[Dict]:
+    """Most recently saved run from a different commit (None if there is none)"""
+    if not os.path.isdir(results_dir):
+        return None
+    candidates = []
+    for filename in os.listdir(results_dir):
+        if filename.endswith(".json") and filename != f"{commit}.json":
+            path = os.path.join(results_dir, filename)
+            candidates.append((os.path.getmtime(path), path))
+    if not candidates:
+        return None
+    with open(max(candidates)[1]) as f:
+        return json.load(f)
+
+
+def compare(current: Dict, previous: Dict, threshold: float) -> List[Dict]:
+    """Median change per benchmark present in both runs; regression when slower by more than threshold"""
+    rows = []
+    for name, stats in current["benchmarks"].items():
+        before = previous["benchmarks"].get(name)
+        if before is None or not before["median"]:
+            continue
+        change = stats["median"] / before["median"] - 1.0
+        rows.append({
+            "benchmark": name,
+            "previous_median": before["median"],
+            "median": stats["median"],
+            "change": change,
+            "regression": change > threshold,
+        })
+    return rows
+
+
+def print_report(report: Dict, comparison: Optional[List[Dict]], baseline: Optional[Dict]) -> None:
+    print("=" * 80)
+    print(f"BENCHMARKS @ {report['commit']} (seed {report['seed']}, {report['fixtures']} fixtures)")
+    print("=" * 80)
+    print(f"{'benchmark':<27}{'median':>12}{'min':>12}{'p95':>12}{'ops/s':>12}{'bytes':>8}")
+    for name, stats in report["benchmarks"].items():
+        print(
+            f"{name:<27}{stats['median'] * 1e6:>10.1f}us{stats['min'] * 1e6:>10.1f}us"
+            f"{stats['p95'] * 1e6:>10.1f}us{stats['ops_per_sec']:>12.1f}{stats.get('bytes', ''):>8}"
+        )
+    for name, reason in report.get("skipped", {}).items():
+        print(f"{name:<27}skipped ({reason})")
+    if comparison is None:
+        return
+    print(f"\nCompared with {baseline['commit']} ({baseline['created_at']}):")
+    for row in comparison:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(f"  {row['benchmark']:<27}{row['change'] * 100:+8.1f}%{flag}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the analysis hot paths")
+    parser.add_argument("--only", default="", help="Comma-separated benchmark names (default: all)")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--min-round-seconds", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--compare", default="latest", help="'latest', a results file, or 'none'")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Median slowdown counted as a regression")
+    parser.add_argument("--results-dir", default=RESULTS_DIR)
+    parser.add_argument("--no-save", action="store_true")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    names = [name for name in args.only.split(",") if name] or list(BENCHMARKS)
+    unknown = sorted(set(names) - set(BENCHMARKS))
+    if unknown:
+        raise SystemExit(f"Unknown benchmarks: {', '.join(unknown)} (available: {', '.join(BENCHMARKS)})")
+
+    random.seed(args.seed)
+    fixtures = build_fixtures(args.seed)
+    report = {
+        "commit": _git_commit(),
+        "created_at": datetime.utcnow().isoformat(),
+        "seed": args.seed,
+        "fixtures": len(fixtures),
+        "machine": _machine_info(),
+        "benchmarks": {},
+        "skipped": {},
+    }
+    for name in names:
+        try:
+            report["benchmarks"][name] = run_benchmark(name, fixtures, args.rounds, args.min_round_seconds)
+        except ImportError as e:
+            # Benchmarks of optional dependencies (orjson, msgpack, fakeredis extras)
+            report["skipped"][name] = str(e)
+
+    baseline = None
+    if args.compare == "latest":
+        baseline = load_previous(report["commit"], args.results_dir)
+    elif args.compare != "none":
+        with open(args.compare) as f:
+            baseline = json.load(f)
+    comparison = compare(report, baseline, args.threshold) if baseline else None
+
+    if not args.no_save:
+        save_results(report, args.results_dir)
+
+    if args.json:
+        print(json.dumps({**report, "comparison": comparison}, indent=2))
+    else:
+        print_report(report, comparison, baseline)
+
+    if comparison and any(row["regression"] for row in comparison):
+        sys.exit(1)
@@ -0,0 +1,61 @@
+"""
+Dedicated dream ingestion worker.
+
+Claims jobs that /ingest/dream queued in the shared SQLite queue
+(INGEST_QUEUE_PATH) and runs the orchestrator workflow for each, publishing
+the usual CloudEvents; every stage is recorded on the job so the API's
+GET /ingest/jobs/{dream_id} and websocket report it. At most --concurrency
+jobs run at once in one worker process; run several processes to scale out
+and set INGEST_EMBEDDED_CONCURRENCY=0 on the API so it only enqueues.
+
+A worker stopped with Ctrl-C / SIGTERM finishes its running jobs first; a
+worker that dies mid-job leaves it to be re-run once its lease lapses.
+
+Usage:
+    python ingest_worker.py [--concurrency 4] [--queue .ingest_queue.sqlite3]
+                            [--lease-seconds 300] [--max-attempts 3] [--poll-interval 0.25]
+"""
+import argparse
+import os
+import signal
+import sys
+import threading
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(os.path.dirname(BACKEND_DIR))
+sys.path.insert(0, REPO_ROOT)
+
+from dotenv import load_dotenv
+load_dotenv()
+
+from apps.backend.src.core.agent_registry import agent_registry
+from apps.backend.src.core.job_queue import QUEUE_PATH, IngestJobQueue, IngestWorker, run_ingestion
+
+
+def main(args: argparse.Namespace) -> None:
+    queue = IngestJobQueue(args.queue, lease_seconds=args.lease_seconds, max_attempts=args.max_attempts)
+    agent_registry.warm()
+    worker = IngestWorker(queue, run_ingestion, concurrency=args.concurrency, poll_interval=args.poll_interval)
+
+    stopping = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopping.set())
+    worker.start()
+    print(f"[INGEST_WORKER] {worker.worker_id}: concurrency {args.concurrency}, queue {args.queue} {queue.counts()}")
+    try:
+        stopping.wait()
+    except KeyboardInterrupt:
+        pass
+    print("[INGEST_WORKER] Stopping; waiting for running jobs")
+    worker.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run queued dream ingestion jobs")
+    parser.add_argument("--concurrency", type=int, default=int(os.getenv("INGEST_WORKER_CONCURRENCY", "4")),
+                        help="Jobs run at once by this process")
+    parser.add_argument("--queue", default=QUEUE_PATH, help="SQLite queue file shared with the API")
+    parser.add_argument("--lease-seconds", type=float, default=300.0,
+                        help="A claimed job is re-run if its worker shows no progress for this long")
+    parser.add_argument("--max-attempts", type=int, default=3)
+    parser.add_argument("--poll-interval", type=float, default=0.25, help="Seconds between claims when idle")
+    main(parser.parse_args())
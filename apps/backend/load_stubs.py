@@ -0,0 +1,268 @@
+"""
+Local stand-ins for the backend's external services, used by load_test.py.
+
+  FakeChatCompletionsServer  OpenAI/DeepSeek-compatible POST /v1/chat/completions
+                             with configurable time-to-first-token and token rate
+  FakeRedisServer            RESP server (PING, GET, SET, DEL, EXISTS, EXPIRE, ...)
+                             with optional per-command latency
+
+Both run on 127.0.0.1 in background threads and count the work they served.
+Pinecone has no stand-in: without PINECONE_API_KEY the Resonance Librarian
+runs offline, which is what the harness measures.
+"""
+import asyncio
+import json
+import random
+import socket
+import threading
+import time
+from typing import Dict, List, Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+def free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+# Reply for prompts asking for an ArchetypalNode JSON object (Jungian Decoder)
+_ARCHETYPE_REPLY = json.dumps({
+    "archetype_id": "SHADOW",
+    "valence": -0.3,
+    "integration_status": "confrontation",
+    "symbolic_manifestations": ["black serpent", "flooded basement"],
+    "vector_embedding_ref": None,
+})
+_FILLER_WORDS = "the water rises slowly and the serpent watches from the dark stair".split()
+
+
+class FakeChatCompletionsServer:
+    """
+    Chat Completions stand-in. Each request sleeps
+    ttft + completion_tokens / tokens_per_second (plus uniform jitter),
+    then returns a reply with a `usage` block, like the real API.
+    """
+
+    def __init__(
+        self,
+        ttft_ms: float = 300.0,
+        tokens_per_second: float = 50.0,
+        completion_tokens: int = 120,
+        jitter_ms: float = 50.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        port: Optional[int] = None
+    ):
+        self.ttft_ms = ttft_ms
+        self.tokens_per_second = tokens_per_second
+        self.completion_tokens = completion_tokens
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.port = port or free_port()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.stats: Dict[str, int] = {"requests": 0, "errors": 0, "prompt_tokens": 0, "completion_tokens": 0}
+        self._server: Optional[uvicorn.Server] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def _app(self) -> FastAPI:
+        app = FastAPI()
+
+        @app.post("/v1/chat/completions")
+        async def chat_completions(request: Request):
+            body = await request.json()
+            prompt = " ".join(message.get("content", "") for message in body.get("messages", []))
+            prompt_tokens = max(1, len(prompt) // 4)
+
+            with self._lock:
+                jitter = self._rng.uniform(-self.jitter_ms, self.jitter_ms)
+                failed = self._rng.random() < self.error_rate
+                self.stats["requests"] += 1
+
+            await asyncio.sleep(max(0.0, self.ttft_ms + jitter) / 1000.0)
+            if failed:
+                with self._lock:
+                    self.stats["errors"] += 1
+                return JSONResponse({"error": {"message": "stub overloaded"}}, status_code=503)
+
+            await asyncio.sleep(self.completion_tokens / self.tokens_per_second)
+            if "Schema:" in prompt:
+                content = _ARCHETYPE_REPLY
+            else:
+                content = " ".join(_FILLER_WORDS[i % len(_FILLER_WORDS)] for i in range(self.completion_tokens))
+
+            with self._lock:
+                self.stats["prompt_tokens"] += prompt_tokens
+                self.stats["completion_tokens"] += self.completion_tokens
+            return {
+                "id": "stub-completion",
+                "object": "chat.completion",
+                "model": body.get("model", "stub"),
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": self.completion_tokens,
+                    "total_tokens": prompt_tokens + self.completion_tokens,
+                },
+            }
+
+        return app
+
+    def start(self) -> "FakeChatCompletionsServer":
+        config = uvicorn.Config(self._app(), host="127.0.0.1", port=self.port, log_level="warning", access_log=False)
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, name="stub-chat-completions", daemon=True)
+        self._thread.start()
+        _wait_for_port(self.port)
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.should_exit = True
+            self._thread.join(timeout=5)
+
+
+class FakeRedisServer:
+    """
+    Minimal RESP2 server covering the commands the backend sends
+    (ContextRegistry, ResultCache). Keys live in a dict; TTLs are honoured on read.
+    """
+
+    def __init__(self, latency_ms: float = 0.0, port: Optional[int] = None):
+        self.latency_ms = latency_ms
+        self.port = port or free_port()
+        self._data: Dict[bytes, bytes] = {}
+        self._expires: Dict[bytes, float] = {}
+        self.stats: Dict[str, int] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"redis://127.0.0.1:{self.port}/0"
+
+    def start(self) -> "FakeRedisServer":
+        self._loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(self._loop)
+            server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle, "127.0.0.1", self.port)
+            )
+            ready.set()
+            try:
+                self._loop.run_forever()
+            finally:
+                server.close()
+
+        self._thread = threading.Thread(target=run, name="stub-redis", daemon=True)
+        self._thread.start()
+        ready.wait(timeout=5)
+        return self
+
+    def stop(self) -> None:
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                command = await _read_command(reader)
+                if command is None:
+                    break
+                if self.latency_ms:
+                    await asyncio.sleep(self.latency_ms / 1000.0)
+                writer.write(self._execute(command))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def _alive(self, key: bytes) -> bool:
+        expires = self._expires.get(key)
+        if expires is not None and expires <= time.time():
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+        return key in self._data
+
+    def _execute(self, command: List[bytes]) -> bytes:
+        name = command[0].decode().upper()
+        args = command[1:]
+        self.stats[name] = self.stats.get(name, 0) + 1
+
+        if name == "PING":
+            return b"+PONG\r\n"
+        if name in ("CLIENT", "SELECT"):
+            return b"+OK\r\n"
+        if name == "GET":
+            return _bulk(self._data[args[0]] if self._alive(args[0]) else None)
+        if name == "SET":
+            key, value = args[0], args[1]
+            self._data[key] = value
+            self._expires.pop(key, None)
+            options = [arg.decode().upper() for arg in args[2:]]
+            for i, option in enumerate(options[:-1]):
+                if option == "EX":
+                    self._expires[key] = time.time() + float(options[i + 1])
+                elif option == "PX":
+                    self._expires[key] = time.time() + float(options[i + 1]) / 1000.0
+            return b"+OK\r\n"
+        if name == "DEL":
+            removed = 0
+            for key in args:
+                if self._alive(key):
+                    del self._data[key]
+                    self._expires.pop(key, None)
+                    removed += 1
+            return f":{removed}\r\n".encode()
+        if name == "EXISTS":
+            return f":{sum(1 for key in args if self._alive(key))}\r\n".encode()
+        if name == "EXPIRE":
+            if not self._alive(args[0]):
+                return b":0\r\n"
+            self._expires[args[0]] = time.time() + float(args[1])
+            return b":1\r\n"
+        return f"-ERR unknown command '{name}'\r\n".encode()
+
+
+async def _read_command(reader: asyncio.StreamReader) -> Optional[List[bytes]]:
+    """One RESP array of bulk strings (what redis-py sends), or None on EOF"""
+    header = await reader.readline()
+    if not header:
+        return None
+    if not header.startswith(b"*"):
+        # Inline command (e.g. from redis-cli / telnet)
+        return header.strip().split()
+    parts = []
+    for _ in range(int(header[1:])):
+        length = int((await reader.readline())[1:])
+        parts.append((await reader.readexactly(length + 2))[:-2])
+    return parts
+
+
+def _bulk(value: Optional[bytes]) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    return b"$" + str(len(value)).encode() + b"\r\n" + value + b"\r\n"
+
+
+def _wait_for_port(port: int, timeout: float = 10.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"Stub server on port {port} did not start")
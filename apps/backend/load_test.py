@@ -0,0 +1,412 @@
+"""
+End-to-end load test of /ingest/dream and /api/v1/analyze.
+
+Boots the app (uvicorn subprocess) against local stand-ins from load_stubs.py:
+DeepSeek -> fake chat-completions server (configurable latency / token rate),
+Redis -> RESP stub, Pinecone -> offline (no key). Postgres is only used by the
+/auth routes, which are not driven here; --database-url is passed through
+for runs against a local database.
+
+Traffic is open-loop: arrivals follow a seeded Poisson process at --rps,
+independent of responses, and latency is measured from the scheduled send
+time (no coordinated omission). A fraction of requests (--stage-sample)
+asks for span profiling; their Server-Timing headers give the per-stage
+breakdown (cache_lookup, analyze, serialize for analyze; "total" is the
+server-side request time, so client latency minus total is queueing).
+
+/ingest/dream answers 202 once the dream is queued; the ingest target then
+polls the job's status_url until it succeeds or fails, so its latency is
+end to end (enqueue + queue wait + orchestration). Its stages come from the
+job: enqueue (server time of the 202, profiled requests only), queue_wait
+(enqueue to claim) and the time up to each CloudEvent stage
+(dream.logged, archetype.extracted = decoder, transits.calculated, ...).
+Ingestion runs on --ingest-concurrency worker threads per app process,
+against a fresh queue file.
+
+Usage:
+    python load_test.py [--mix ingest=1,analyze=3] [--rps 20] [--duration 30]
+                        [--llm-ttft-ms 300] [--llm-tokens-per-second 50] [--llm-completion-tokens 120]
+                        [--redis-latency-ms 0.2] [--workers 1] [--ingest-concurrency 8] [--json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import secrets
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+from load_stubs import FakeChatCompletionsServer, FakeRedisServer, free_port
+
+# Interval between status polls while following an ingestion job
+JOB_POLL_SECONDS = 0.05
+# Lets this run force span profiling on the app it starts (AETHERIA_PROFILE_TOKEN)
+PROFILE_TOKEN = secrets.token_urlsafe(16)
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(os.path.dirname(BACKEND_DIR))
+
+DREAM_FRAGMENTS = [
+    "I saw a black serpent coiled in a flooded basement.",
+    "The water was rising and the serpent's eyes glowed in the darkness.",
+    "I was flying over a city made of glass while my teeth fell out.",
+    "An old woman handed me a key to a door that kept moving.",
+    "A wolf followed me through a forest of burning trees.",
+    "My childhood house had a room I had never seen before.",
+]
+
+
+# Request builders: rng -> (method, path, json body)
+def _ingest_request(rng: random.Random) -> Tuple[str, str, Dict]:
+    now = datetime.utcnow()
+    return "POST", "/ingest/dream", {
+        "dream_id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+        "user_id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+        "timestamp_ingested": now.isoformat(),
+        "timestamp_experience": (now - timedelta(hours=rng.uniform(1, 8))).isoformat(),
+        "input_modality": "text",
+        "content_raw": " ".join(rng.sample(DREAM_FRAGMENTS, rng.randint(2, 4))),
+    }
+
+
+def _analyze_request(rng: random.Random) -> Tuple[str, str, Dict]:
+    birth = datetime(1950, 1, 1) + timedelta(minutes=rng.randrange(60 * 24 * 365 * 55))
+    dream = datetime(2024, 1, 1) + timedelta(minutes=rng.randrange(60 * 24 * 365 * 3))
+    return "POST", "/api/v1/analyze", {
+        "dream_content": " ".join(rng.sample(DREAM_FRAGMENTS, rng.randint(2, 4))),
+        "user_id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+        "birth_datetime": birth.isoformat(),
+        "birth_latitude": round(rng.uniform(-60.0, 60.0), 4),
+        "birth_longitude": round(rng.uniform(-180.0, 180.0), 4),
+        "dream_datetime": dream.isoformat(),
+    }
+
+
+TARGETS: Dict[str, Callable[[random.Random], Tuple[str, str, Dict]]] = {
+    "ingest": _ingest_request,
+    "analyze": _analyze_request,
+}
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """"ingest=1,analyze=3" -> {"ingest": 0.25, "analyze": 0.75}"""
+    weights = {}
+    for part in mix.split(","):
+        name, _, weight = part.partition("=")
+        if name not in TARGETS:
+            raise SystemExit(f"Unknown target {name!r} (available: {', '.join(TARGETS)})")
+        weights[name] = float(weight or 1)
+    total = sum(weights.values())
+    return {name: weight / total for name, weight in weights.items()}
+
+
+def parse_server_timing(header: str) -> Dict[str, float]:
+    """'safety;dur=0.41, decoder;dur=612.3, total;dur=655.0' -> {name: ms}"""
+    stages = {}
+    for entry in header.split(","):
+        name, _, params = entry.strip().partition(";")
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "dur" and name:
+                stages[name] = float(value)
+    return stages
+
+
+def _job_time(value: str) -> datetime:
+    # CloudEvent times are naive UTC, queue timestamps carry +00:00
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def job_stage_timings(job: Dict) -> Dict[str, float]:
+    """queue_wait (enqueue to claim) and, per stage, ms since the previous stage (claim for the first)"""
+    if not job.get("claimed_at"):
+        return {}
+    claimed = _job_time(job["claimed_at"])
+    stages = {"queue_wait": (claimed - _job_time(job["enqueued_at"])).total_seconds() * 1000.0}
+    previous = claimed
+    for stage in job["stages"]:
+        at = _job_time(stage["time"])
+        stages[stage["stage"]] = (at - previous).total_seconds() * 1000.0
+        previous = at
+    return stages
+
+
+async def follow_job(client: httpx.AsyncClient, status_url: str, timeout: float) -> Optional[Dict]:
+    """Poll an ingestion job until it succeeds or fails; None if it is still unfinished after `timeout`"""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        job = (await client.get(status_url)).json()
+        if job.get("status") in ("succeeded", "failed"):
+            return job
+        await asyncio.sleep(JOB_POLL_SECONDS)
+    return None
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * (len(sorted_values) - 1)))))
+    return sorted_values[index]
+
+
+def summarize(values: List[float]) -> Dict[str, float]:
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "mean_ms": round(sum(ordered) / len(ordered), 2) if ordered else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50), 2),
+        "p95_ms": round(percentile(ordered, 0.95), 2),
+        "p99_ms": round(percentile(ordered, 0.99), 2),
+        "max_ms": round(ordered[-1], 2) if ordered else 0.0,
+    }
+
+
+class LoadRecorder:
+    """Per-target latencies, status codes and Server-Timing stages"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self.stages: Dict[str, Dict[str, List[float]]] = defaultdict(lambda: defaultdict(list))
+        self.dropped: Dict[str, int] = defaultdict(int)
+
+    def record(
+        self,
+        target: str,
+        latency_ms: float,
+        status: str,
+        server_timing: Optional[str],
+        stages: Optional[Dict[str, float]] = None
+    ) -> None:
+        self.statuses[target][status] += 1
+        if status.startswith("2"):
+            self.latencies[target].append(latency_ms)
+        if server_timing:
+            stages = {**parse_server_timing(server_timing), **(stages or {})}
+        for stage, duration in (stages or {}).items():
+            self.stages[target][stage].append(duration)
+
+    def report(self, elapsed: float) -> Dict:
+        report = {}
+        for target in sorted(set(self.statuses) | set(self.dropped)):
+            ok = len(self.latencies[target])
+            report[target] = {
+                "throughput_rps": round(ok / elapsed, 2) if elapsed else 0.0,
+                "statuses": dict(self.statuses[target]),
+                "dropped": self.dropped[target],
+                "latency": summarize(self.latencies[target]),
+                "stages": {stage: summarize(values) for stage, values in self.stages[target].items()},
+            }
+        return report
+
+
+async def drive(
+    base_url: str,
+    mix: Dict[str, float],
+    rps: float,
+    duration: float,
+    seed: int,
+    stage_sample: float,
+    max_in_flight: int,
+    timeout: float
+) -> Tuple[LoadRecorder, float]:
+    """Open-loop Poisson arrivals for `duration` seconds; returns the recorder and wall time"""
+    rng = random.Random(seed)
+    recorder = LoadRecorder()
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    in_flight = set()
+
+    limits = httpx.Limits(max_connections=max_in_flight, max_keepalive_connections=max_in_flight)
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+
+        async def send(target: str, scheduled: float, request: Tuple[str, str, Dict], profiled: bool):
+            method, path, body = request
+            headers = {"X-Aetheria-Profile": "spans" if profiled else "off", "X-Aetheria-Profile-Token": PROFILE_TOKEN}
+            stages = None
+            try:
+                response = await client.request(method, path, json=body, headers=headers)
+                status = str(response.status_code)
+                server_timing = response.headers.get("Server-Timing")
+                if response.status_code == 202:
+                    # Queued ingestion: the request is done when its job is
+                    job = await follow_job(client, response.json()["status_url"], timeout)
+                    if job is None:
+                        status = "job_timeout"
+                    else:
+                        status = "202" if job["status"] == "succeeded" else "job_failed"
+                        stages = job_stage_timings(job)
+                    if server_timing:
+                        # The 202 response's own server time is the enqueue step
+                        enqueue = parse_server_timing(server_timing).get("total")
+                        server_timing = None
+                        if stages is not None and enqueue is not None:
+                            stages["enqueue"] = enqueue
+            except httpx.TimeoutException:
+                status, server_timing = "timeout", None
+            except httpx.HTTPError as exc:
+                status, server_timing = type(exc).__name__, None
+            recorder.record(target, (time.perf_counter() - scheduled) * 1000.0, status, server_timing, stages)
+
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        next_arrival = started
+        while next_arrival - started < duration:
+            delay = next_arrival - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            target = rng.choices(names, weights)[0]
+            request = TARGETS[target](rng)
+            profiled = rng.random() < stage_sample
+            if len(in_flight) >= max_in_flight:
+                # Client-side saturation: count it instead of silently slowing the arrival rate
+                recorder.dropped[target] += 1
+            else:
+                task = loop.create_task(send(target, next_arrival, request, profiled))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+            next_arrival += rng.expovariate(rps)
+
+        if in_flight:
+            await asyncio.wait(in_flight, timeout=timeout)
+        elapsed = time.perf_counter() - started
+    return recorder, elapsed
+
+
+def start_app(module: str, port: int, workers: int, env_overrides: Dict[str, str], show_logs: bool) -> subprocess.Popen:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([REPO_ROOT, BACKEND_DIR]), **env_overrides)
+    output = None if show_logs else subprocess.DEVNULL
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", f"{module}:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning", "--no-access-log"],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=output,
+        stderr=output,
+    )
+
+
+def wait_until_ready(base_url: str, process: subprocess.Popen, timeout: float = 60.0) -> None:
+    """Poll /health until it returns 200 (the lifespan warm-up has finished)"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"App exited during startup (code {process.returncode})")
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1.0).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise SystemExit("App did not become ready in time")
+
+
+def print_report(report: Dict) -> None:
+    config = report["config"]
+    print("=" * 80)
+    print(f"LOAD TEST: {config['mix']} @ {config['rps']} rps for {config['duration']} s ({config['app']})")
+    print("=" * 80)
+    for target, result in report["targets"].items():
+        latency = result["latency"]
+        print(f"\n{target}: {result['throughput_rps']} rps ok, statuses {result['statuses']}, dropped {result['dropped']}")
+        print(
+            f"  latency  p50 {latency['p50_ms']:8.1f} ms  p95 {latency['p95_ms']:8.1f} ms  "
+            f"p99 {latency['p99_ms']:8.1f} ms  max {latency['max_ms']:8.1f} ms"
+        )
+        for stage, stats in sorted(result["stages"].items(), key=lambda item: -item[1]["mean_ms"]):
+            print(f"  stage {stage:<22} mean {stats['mean_ms']:8.1f} ms  p95 {stats['p95_ms']:8.1f} ms  (n={stats['count']})")
+    print(f"\nStubs: llm {report['stubs']['llm']}, redis {report['stubs']['redis']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Open-loop load test against local service stand-ins")
+    parser.add_argument("--app", default="main", help="main or main_minimal")
+    parser.add_argument("--mix", default="ingest=1,analyze=3", help="Target weights, e.g. ingest=1,analyze=3")
+    parser.add_argument("--rps", type=float, default=20.0)
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of traffic")
+    parser.add_argument("--seed", type=int, default=1234)
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn worker processes")
+    parser.add_argument("--ingest-concurrency", type=int, default=8, help="Ingestion worker threads per app process")
+    parser.add_argument("--stage-sample", type=float, default=0.2, help="Fraction of requests with span profiling")
+    parser.add_argument("--max-in-flight", type=int, default=512)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--llm-ttft-ms", type=float, default=300.0)
+    parser.add_argument("--llm-tokens-per-second", type=float, default=50.0)
+    parser.add_argument("--llm-completion-tokens", type=int, default=120)
+    parser.add_argument("--llm-jitter-ms", type=float, default=50.0)
+    parser.add_argument("--llm-error-rate", type=float, default=0.0)
+    parser.add_argument("--redis-latency-ms", type=float, default=0.0)
+    parser.add_argument("--database-url", default=None, help="Passed to the app as DATABASE_URL")
+    parser.add_argument("--app-logs", action="store_true", help="Show the app's stdout/stderr")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    mix = parse_mix(args.mix)
+    llm = FakeChatCompletionsServer(
+        ttft_ms=args.llm_ttft_ms,
+        tokens_per_second=args.llm_tokens_per_second,
+        completion_tokens=args.llm_completion_tokens,
+        jitter_ms=args.llm_jitter_ms,
+        error_rate=args.llm_error_rate,
+        seed=args.seed,
+    ).start()
+    redis_stub = FakeRedisServer(latency_ms=args.redis_latency_ms).start()
+
+    env_overrides = {
+        "DEEPSEEK_API_KEY": "stub-key",
+        "DEEPSEEK_BASE_URL": llm.base_url,
+        "REDIS_URL": redis_stub.url,
+        "PINECONE_API_KEY": "",
+        # Span profiling only for requests that ask for it (X-Aetheria-Profile)
+        "AETHERIA_PROFILING": "1",
+        "AETHERIA_PROFILE_SAMPLE_RATE": "0",
+        "AETHERIA_PROFILE_TOKEN": PROFILE_TOKEN,
+        "INGEST_EMBEDDED_CONCURRENCY": str(args.ingest_concurrency),
+        # All simulated users share 127.0.0.1: lift the per-address limit (per-user limits still apply)
+        "LLM_ADDRESS_RATE_LIMIT_PER_MINUTE": "1000000",
+        "LLM_ADDRESS_RATE_LIMIT_BURST": "1000000",
+        "INGEST_QUEUE_PATH": os.path.join(tempfile.mkdtemp(prefix="load_test_"), "ingest_queue.sqlite3"),
+    }
+    if args.database_url:
+        env_overrides["DATABASE_URL"] = args.database_url
+
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    app_process = start_app(args.app, port, args.workers, env_overrides, args.app_logs)
+    try:
+        wait_until_ready(base_url, app_process)
+        recorder, elapsed = asyncio.run(drive(
+            base_url, mix, args.rps, args.duration, args.seed, args.stage_sample, args.max_in_flight, args.timeout
+        ))
+    finally:
+        app_process.terminate()
+        app_process.wait(timeout=10)
+        llm.stop()
+        redis_stub.stop()
+
+    report = {
+        "config": {
+            "app": args.app, "mix": args.mix, "rps": args.rps, "duration": args.duration, "seed": args.seed,
+            "workers": args.workers, "ingest_concurrency": args.ingest_concurrency, "llm_ttft_ms": args.llm_ttft_ms,
+            "llm_tokens_per_second": args.llm_tokens_per_second,
+            "llm_completion_tokens": args.llm_completion_tokens, "redis_latency_ms": args.redis_latency_ms,
+        },
+        "elapsed_s": round(elapsed, 2),
+        "targets": recorder.report(elapsed),
+        "stubs": {"llm": dict(llm.stats), "redis": dict(redis_stub.stats)},
+    }
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
@@ -8,21 +8,94 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..',
 from dotenv import load_dotenv
 load_dotenv()
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi import APIRouter
 from pydantic import BaseModel
-from packages.shared_schema.src.schemas import DreamIngestionObject
-from apps.backend.src.core.context_registry import ContextRegistry
-from apps.backend.src.agents.orchestrator import PsycheOrchestrator
-from apps.backend.src.agents.safety_sentinel import SafetySentinel
-from apps.backend.src.agents.growth_architect import GrowthArchitect
+from packages.shared_schema.src.schemas import BiometricContext, DreamIngestionObject, SleepPhase
+from apps.backend.src.core.agent_registry import agent_registry
+from apps.backend.src.core.profiling import install_profiling
+from apps.backend.src.core.metrics import install_metrics, deepseek_status
 from apps.backend.src.agents.celestial_engine import calculate_planetary_transits, CalculateTransitsInput
+from apps.backend.src.agents.aspect_timeline import calculate_aspect_timeline, AspectTimelineInput
 from apps.backend.src.api.routes import auth as auth_routes
+from apps.backend.src.api.routes import events as event_routes
+from apps.backend.src.api.routes import ingest_jobs as ingest_job_routes
+from apps.backend.src.core.cloud_events import event_publisher
+from apps.backend.src.core.event_hub import event_hub, relay_queue_events
+from apps.backend.src.core.job_queue import IngestWorker, get_job_queue, run_ingestion
+from apps.backend.src.core.rate_limit import RateLimiter, client_address, enforce_all, request_key
+import asyncio
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
-app = FastAPI(title="Aetheria Backend", version="1.0.0")
+# Load analysis routes (DecagonAnalysisObject system) - included below, warmed up by the lifespan hook
+try:
+    from apps.backend.routes import analysis_routes
+except Exception as e:
+    analysis_routes = None
+    print(f"[WARNING] Could not load analysis routes: {e}")
+
+# Overnight biometric uploads (chunked, memory-mapped, incremental sleep staging)
+try:
+    from apps.backend.routes import biometric_routes
+except Exception as e:
+    biometric_routes = None
+    print(f"[WARNING] Could not load biometric routes: {e}")
+
+# Ingestion worker threads in the API process (0 when dedicated ingest_worker.py processes run the queue)
+INGEST_EMBEDDED_CONCURRENCY = int(os.getenv("INGEST_EMBEDDED_CONCURRENCY", "2"))
+
+# Each new ingestion costs DeepSeek round trips: per-user token bucket (Redis-shared when REDIS_URL is reachable)
+ingest_rate_limit = RateLimiter(
+    "ingest",
+    per_minute=float(os.getenv("LLM_RATE_LIMIT_PER_MINUTE", "6")),
+    burst=float(os.getenv("LLM_RATE_LIMIT_BURST", "3")),
+)
+# user_id is whatever the client sends: a second bucket per client address caps rotating ids
+ingest_address_rate_limit = RateLimiter(
+    "ingest_address",
+    per_minute=float(os.getenv("LLM_ADDRESS_RATE_LIMIT_PER_MINUTE", "30")),
+    burst=float(os.getenv("LLM_ADDRESS_RATE_LIMIT_BURST", "10")),
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Build shared engines and warm the ephemeris once, before the first request.
+    Worker agents (Redis, Pinecone, prompt files) are built in a background task
+    so they never delay readiness; a request arriving first builds what it needs.
+    """
+    if analysis_routes is not None:
+        report = analysis_routes.warm_up_analysis_engine()
+        print(f"[OK] Ephemeris warm-up: {report['ephemeris_source']} in {report['duration_ms']} ms")
+    app.state.agent_warmup = asyncio.create_task(asyncio.to_thread(agent_registry.warm))
+    event_hub.bind(asyncio.get_running_loop())
+    unsubscribe_hub = event_publisher.subscribe(event_hub.on_cloud_event)
+    relay = asyncio.create_task(relay_queue_events(event_hub, get_job_queue()))
+    app.state.ingest_worker = None
+    if INGEST_EMBEDDED_CONCURRENCY > 0:
+        app.state.ingest_worker = IngestWorker(
+            get_job_queue(), run_ingestion, concurrency=INGEST_EMBEDDED_CONCURRENCY
+        ).start()
+    yield
+    relay.cancel()
+    unsubscribe_hub()
+    if app.state.ingest_worker is not None:
+        await asyncio.to_thread(app.state.ingest_worker.stop, 5.0)
+
+
+app = FastAPI(title="Aetheria Backend", version="1.0.0", lifespan=lifespan)
+
+# Opt-in request profiling (AETHERIA_PROFILING=1): spans, Server-Timing, /debug/profile
+install_profiling(app)
+
+# Prometheus metrics on /metrics (step latencies, swe.calc calls, DeepSeek, Redis, CloudEvents)
+install_metrics(app)
 
 # CORS for local web development (Vite/React)
 app.add_middleware(
@@ -38,49 +111,119 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize components
-context_registry = ContextRegistry()
-orchestrator = PsycheOrchestrator()
-safety_sentinel = SafetySentinel()
-growth_architect = GrowthArchitect()
-
 # Include auth router
 app.include_router(auth_routes.router, prefix="/auth", tags=["auth"])
+app.include_router(ingest_job_routes.router, prefix="/ingest", tags=["ingest"])
+app.include_router(event_routes.router, prefix="/events", tags=["events"])
 
 # Include analysis router (DecagonAnalysisObject system)
-try:
-    # Use absolute import path
-    backend_dir = os.path.dirname(os.path.abspath(__file__))
-    sys.path.insert(0, os.path.join(backend_dir, 'routes'))
-    from analysis_routes import router as analysis_router
-    app.include_router(analysis_router)
+if analysis_routes is not None:
+    app.include_router(analysis_routes.router)
     print("[OK] DecagonAnalysis routes loaded successfully")
-except Exception as e:
-    print(f"[WARNING] Could not load analysis routes: {e}")
 
-@app.post("/ingest/dream")
-async def ingest_dream(dream: DreamIngestionObject):
-    """Verified against Section 3.1 for dream ingestion."""
+if biometric_routes is not None:
+    app.include_router(biometric_routes.router)
+
+@app.post("/ingest/dream", status_code=202)
+async def ingest_dream(dream: DreamIngestionObject, request: Request):
+    """
+    Verified against Section 3.1 for dream ingestion.
+    Validates and scrubs the dream, then queues the orchestration and returns 202
+    with the dream_id; follow it on GET /ingest/jobs/{dream_id} or the
+    /ingest/jobs/{dream_id}/ws websocket, or get every dream's stages pushed on
+    /events/ws?user_id=. Re-posting one's own dream_id, or the same text while an identical
+    job is unfinished, returns the existing job (`coalesced` when it is another dream_id).
+    A dream_id already used by another user is rejected with 409.
+    New dreams are rate-limited per user and per client address (429 with Retry-After).
+    """
+    queue = get_job_queue()
+    user_id = str(dream.user_id)
+    dream_id = str(dream.dream_id)
+
+    # Duplicates share the existing job (no LLM call, no rate-limit token): a re-posted
+    # dream_id, or the same text from the same user while an identical job is unfinished
+    dedupe_key = request_key(user_id, dream.content_raw)
+    job = await asyncio.to_thread(queue.get, dream_id)
+    if job is not None and job["user_id"] != user_id:
+        # Someone else's dream_id: never hand out (or link to) another user's job
+        raise HTTPException(status_code=409, detail=f"dream_id {dream_id} is already in use")
+    job = job or await asyncio.to_thread(queue.find_unfinished, dedupe_key)
+    if job is None:
+        await asyncio.to_thread(
+            enforce_all, [(ingest_address_rate_limit, client_address(request)), (ingest_rate_limit, user_id)]
+        )
+        job = await _enqueue_dream(dream, dedupe_key)
+
+    return {
+        "status": job["status"],
+        "dream_id": job["dream_id"],
+        "coalesced": job["dream_id"] != dream_id,
+        "status_url": f"/ingest/jobs/{job['dream_id']}",
+        "websocket_url": f"/ingest/jobs/{job['dream_id']}/ws",
+    }
+
+
+async def _enqueue_dream(dream: DreamIngestionObject, dedupe_key: str) -> dict:
+    """Safety check, PII scrub and biometric context, then queue the orchestration"""
     # Safety check
+    safety_sentinel = agent_registry.get("safety_sentinel")
     safety_result = safety_sentinel.validate_content(dream.content_raw)
-    if not safety_result["safe"]:
+    if not safety_result["is_safe"]:
         raise HTTPException(status_code=400, detail="Content violates safety constraints")
 
     # Scrub PII
     dream.content_raw = safety_sentinel.scrub_pii(dream.content_raw)
 
-    # Process via orchestrator (async support may be added later)
-    result = orchestrator.ingest_dream(dream)
+    # Dream time (and HRV at that time) from the night's biometric upload, when not given
+    if dream.biometric_session_id and dream.timestamp_experience is None and biometric_routes is not None:
+        experience = biometric_routes.experience_from_session(str(dream.biometric_session_id), str(dream.user_id))
+        if experience is not None:
+            dream.timestamp_experience = experience["timestamp_experience"]
+            context = dream.biometric_context or BiometricContext()
+            context.sleep_phase = context.sleep_phase or SleepPhase.REM
+            if context.heart_rate_variability is None:
+                context.heart_rate_variability = experience["heart_rate_variability"]
+            dream.biometric_context = context
 
-    # Growth trigger
-    trigger = growth_architect.evaluate_engagement_trigger({"session_count": 1, "last_interaction_days": 0})
-    result["engagement_trigger"] = trigger
-
-    return result
+    # Orchestrator + growth trigger run on an ingestion worker (run_ingestion)
+    job, created = await asyncio.to_thread(
+        get_job_queue().enqueue, str(dream.dream_id), str(dream.user_id), dream.model_dump(mode="json"), dedupe_key
+    )
+    if job["user_id"] != str(dream.user_id):
+        # Lost a race for this dream_id to another user's submission
+        raise HTTPException(status_code=409, detail=f"dream_id {dream.dream_id} is already in use")
+    worker = getattr(app.state, "ingest_worker", None)
+    if created and worker is not None:
+        worker.notify()
+    return job
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    """
+    Readiness: 503 until the analysis engine is built and the ephemeris is warm.
+    DeepSeek and Redis have offline fallbacks, so their state is reported
+    ("degraded" status) without failing readiness.
+    """
+    engine = analysis_routes.engine_health() if analysis_routes is not None else {"ready": True}
+    if agent_registry.is_built("context_registry"):
+        redis_state = "offline" if agent_registry.get("context_registry").offline_mode else "online"
+    else:
+        redis_state = "not_connected"
+    deepseek = deepseek_status()
+
+    if not engine["ready"]:
+        status = "starting"
+    elif deepseek == "degraded":
+        status = "degraded"
+    else:
+        status = "healthy"
+    return JSONResponse(
+        status_code=503 if status == "starting" else 200,
+        content={
+            "status": status,
+            "services": {**engine, "deepseek": deepseek, "redis": redis_state},
+        }
+    )
 
 # Example endpoint for celestial transits
 @app.post("/calculate/transits")
@@ -89,10 +232,27 @@ async def get_transits(input_data: CalculateTransitsInput):
     result = calculate_planetary_transits(input_data)
     return result.dict()
 
+@app.post("/calculate/aspect-timeline")
+async def get_aspect_timeline(input_data: AspectTimelineInput):
+    """Enter-orb / exact / exit-orb times for transit-to-natal aspects over a window."""
+    try:
+        # Up to a year of scanning and root-finding: keep it off the event loop
+        result = await run_in_threadpool(calculate_aspect_timeline, input_data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return result.model_dump()
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
 
 # Verification Log
 # - Registered /auth routes (register/login) and retained existing ingestion endpoints.
-# - Assumption: Auth middleware (JWT validation) will be added in the next step.
\ No newline at end of file
+# - Agents come from the lazy AgentRegistry (built on first use or by the lifespan background task).
+# - Lifespan hook builds the shared DecagonAnalyzer and warms the ephemeris; /health reports readiness after warm-up.
+# - Assumption: Auth middleware (JWT validation) will be added in the next step.
+#   Until then /events/ws trusts the client-supplied user_id, and job status is readable by anyone holding the dream_id.
+# - /metrics serves the in-process registry; /health combines engine warm-up, DeepSeek and Redis state.
+# - /ingest/dream: per-user (LLM_RATE_LIMIT_*) and per-address (LLM_ADDRESS_RATE_LIMIT_*) token buckets, duplicates coalesced into the unfinished job.
+# - /events/ws pushes stage CloudEvents per user via the EventHub (in-process subscriber + queue relay for other processes).
+# - /ingest/dream validates, scrubs and enqueues (202); IngestWorker threads (INGEST_EMBEDDED_CONCURRENCY) or ingest_worker.py processes orchestrate.
@@ -13,16 +13,46 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..',
 from dotenv import load_dotenv
 load_dotenv()
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from apps.backend.src.core.profiling import install_profiling
+from apps.backend.src.core.metrics import install_metrics, deepseek_status
+
+# Load DecagonAnalysis routes (included below, warmed up by the lifespan hook)
+try:
+    from apps.backend.routes import analysis_routes
+except Exception as e:
+    analysis_routes = None
+    print(f"[ERROR] Failed to load analysis routes: {e}")
+    import traceback
+    traceback.print_exc()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the shared analyzer and warm the ephemeris before serving requests"""
+    if analysis_routes is not None:
+        report = analysis_routes.warm_up_analysis_engine()
+        print(f"[OK] Ephemeris warm-up: {report['ephemeris_source']} in {report['duration_ms']} ms")
+    yield
+
 
 # Create app
 app = FastAPI(
     title="Aetheria Nexus API",
     version="1.0.0",
-    description="10-Dimensional Psycho-Astrological Analysis System"
+    description="10-Dimensional Psycho-Astrological Analysis System",
+    lifespan=lifespan
 )
 
+# Opt-in request profiling (AETHERIA_PROFILING=1): spans, Server-Timing, /debug/profile
+install_profiling(app)
+
+# Prometheus metrics on /metrics
+install_metrics(app)
+
 # CORS for local development
 app.add_middleware(
     CORSMiddleware,
@@ -33,16 +63,9 @@ app.add_middleware(
 )
 
 # Include DecagonAnalysis routes
-try:
-    backend_dir = os.path.dirname(os.path.abspath(__file__))
-    sys.path.insert(0, os.path.join(backend_dir, 'routes'))
-    from analysis_routes import router as analysis_router
-    app.include_router(analysis_router)
+if analysis_routes is not None:
+    app.include_router(analysis_routes.router)
     print("[OK] DecagonAnalysis routes loaded successfully")
-except Exception as e:
-    print(f"[ERROR] Failed to load analysis routes: {e}")
-    import traceback
-    traceback.print_exc()
 
 @app.get("/")
 async def root():
@@ -54,21 +77,30 @@ async def root():
         "endpoints": {
             "analyze": "POST /api/v1/analyze",
             "birth_chart": "GET/POST /api/v1/birth-chart/{user_id}",
-            "health": "GET /health"
+            "health": "GET /health",
+            "metrics": "GET /metrics"
         }
     }
 
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "services": {
-            "swiss_ephemeris": "available",
-            "analysis_engine": "ready"
+    """Health/readiness check: 503 until the analyzer is built and the ephemeris is warm"""
+    engine = analysis_routes.engine_health() if analysis_routes is not None else {"ready": False}
+    ready = engine["ready"]
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "status": "healthy" if ready else "starting",
+            "timestamp": datetime.utcnow().isoformat(),
+            "services": {
+                "swiss_ephemeris": engine.get("swiss_ephemeris", "unavailable"),
+                "swe_calc_calls": engine.get("swe_calc_calls", 0),
+                "result_cache": engine.get("result_cache", "unavailable"),
+                "deepseek": deepseek_status(),
+                "analysis_engine": "ready" if ready else "warming_up"
+            }
         }
-    }
+    )
 
 if __name__ == "__main__":
     import uvicorn
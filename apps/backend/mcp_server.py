@@ -1,40 +1,77 @@
 # Verified against Section 6 of doc.md for MCP Server implementation.
 
-from fastapi import FastAPI
+import os
+from typing import Optional
+
+from fastapi import FastAPI, Request
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
-from apps.backend.src.agents.orchestrator import PsycheOrchestrator
+from apps.backend.src.core.agent_registry import agent_registry
+from apps.backend.src.core.rate_limit import RateLimiter, SingleFlight, client_address, enforce_all, request_key
 from packages.shared_schema.src.schemas import DreamIngestionObject
 
 app = FastAPI(title="Aetheria MCP Server")
 
-orchestrator = PsycheOrchestrator()
+# One DeepSeek call per distinct in-flight request; new calls limited per user (Redis-shared when REDIS_URL is reachable)
+archetype_flights = SingleFlight("analyze_dream_archetypes")
+archetype_rate_limit = RateLimiter(
+    "analyze_dream_archetypes",
+    per_minute=float(os.getenv("LLM_RATE_LIMIT_PER_MINUTE", "6")),
+    burst=float(os.getenv("LLM_RATE_LIMIT_BURST", "3")),
+)
+# user_id is optional and client-chosen: every call also spends from its address's bucket
+archetype_address_rate_limit = RateLimiter(
+    "analyze_dream_archetypes_address",
+    per_minute=float(os.getenv("LLM_ADDRESS_RATE_LIMIT_PER_MINUTE", "30")),
+    burst=float(os.getenv("LLM_ADDRESS_RATE_LIMIT_BURST", "10")),
+)
 
 class AnalyzeDreamRequest(BaseModel):
     narrative_text: str
     user_history_summary: str = ""
+    user_id: Optional[str] = None  # per-user rate-limit key, on top of the per-address limit
 
 class CalculateTransitsRequest(BaseModel):
     target_date: str
     natal_coordinates: dict
 
 @app.post("/tools/analyze_dream_archetypes")
-async def analyze_dream_archetypes(request: AnalyzeDreamRequest):
-    """Verified against Section 6.1 for analyze_dream_archetypes tool."""
-    result = orchestrator.jungian_decoder.analyze_dream(request.narrative_text, request.user_history_summary)
+async def analyze_dream_archetypes(request: AnalyzeDreamRequest, http_request: Request):
+    """
+    Verified against Section 6.1 for analyze_dream_archetypes tool.
+    A caller's identical concurrent requests share one DeepSeek call and its result
+    (or its 429); only the call that runs spends rate-limit tokens: one from the
+    client address's bucket and, when user_id is given, one from the user's.
+    """
+    address = client_address(http_request)
+    decoder = agent_registry.get("jungian_decoder")
+
+    def limited_call():
+        limits = [(archetype_address_rate_limit, address)]
+        if request.user_id:
+            limits.append((archetype_rate_limit, request.user_id))
+        enforce_all(limits)
+        return decoder.analyze_dream(request.narrative_text, request.user_history_summary)
+
+    key = request_key(address, request.user_id, request.narrative_text, request.user_history_summary)
+    result, _ = await run_in_threadpool(archetype_flights.do, key, limited_call)
     return {"archetypes": [result.dict()], "clinical_flag": False}
 
 @app.post("/tools/calculate_planetary_transits")
 async def calculate_planetary_transits_tool(request: CalculateTransitsRequest):
     """Verified against Section 6.2 for calculate_planetary_transits tool."""
     from datetime import datetime
+    from apps.backend.src.agents.celestial_engine import CalculateTransitsInput
     input_data = CalculateTransitsInput(
         target_date=datetime.fromisoformat(request.target_date),
         natal_coordinates=request.natal_coordinates
     )
-    result = calculate_planetary_transits(input_data)
+    result = agent_registry.get("celestial_engine")(input_data)
     return result.dict()
 
 # Verification Log
 # - Implemented MCP Server with tool endpoints per Section 6.
 # - Exposed analyze_dream_archetypes and calculate_planetary_transits tools.
+# - Agents resolved lazily through the shared AgentRegistry (no Pinecone/Redis/prompt I/O at import).
+# - analyze_dream_archetypes: per-address (LLM_ADDRESS_RATE_LIMIT_*) and, given user_id, per-user (LLM_RATE_LIMIT_*) token buckets and single-flight coalescing of identical requests.
 # - Assumption: MCP format adapted to REST API; doc specifies JSON Schema for tools.
\ No newline at end of file
@@ -1,24 +1,116 @@
 # apps/backend/routes/analysis_routes.py
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Header, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from datetime import datetime
-from typing import Optional
+from typing import Dict, List, Optional
+import base64
+import binascii
+import hashlib
 import sys
 import os
 
+import pydantic_core
+
+from apps.backend.src.core.metrics import metrics
+from apps.backend.src.core.profiling import span
+
 # Add packages to path - use absolute path resolution
 backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 repo_root = os.path.dirname(os.path.dirname(backend_dir))
 sys.path.insert(0, os.path.join(repo_root, 'packages', 'shared-schema', 'src'))
 
-from schemas import DecagonAnalysisObject
+from schemas import DecagonAnalysisObject, Planet
 
 # Import analysis engine - use absolute path resolution
 sys.path.insert(0, os.path.join(backend_dir, 'services'))
 from analysis_engine import DecagonAnalyzer
+from time_keeper import (
+    ZodiacMode, calculate_julian_day, get_ephemeris_call_count, get_firdaria_timeline, is_day_chart, to_naive_utc
+)
+from result_cache import get_result_cache, etag_for, etag_matches
+from response_encoding import ETAG_VARIANTS, encode, negotiate, project
+from ephemeris_warmup import warm_up_ephemeris
+from house_service import HouseComputationError, get_house_stats, get_natal_houses
+from sky_snapshot import compute_sky_snapshot, get_body_longitude
+from lunar_calendar import lunar_ingresses_between, INGRESS_KINDS
+from somatic import HRVAccumulator, NoValidBeatsError, RR_ENCODINGS, decode_rr, rr_digest
 
 router = APIRouter(prefix="/api/v1", tags=["analysis"])
 
+# Inline RR recordings on /analyze (base64 characters: 48 KB, ~6.8 h at 60 bpm as u16);
+# longer recordings go through the streaming /somatic/hrv endpoint
+MAX_RR_FIELD_CHARS = 64 * 1024
+
+# Longest window served by /lunar-calendar/ingresses in one request
+MAX_LUNAR_CALENDAR_DAYS = 400
+
+# Shared engine state, filled once by the application lifespan (see warm_up_analysis_engine)
+_engine_state = {"analyzer": None, "ready": False, "warmup": None}
+
+
+def warm_up_analysis_engine() -> Dict:
+    """
+    Build the shared DecagonAnalyzer and warm the ephemeris.
+    Called from the app lifespan; readiness is reported only after this returns.
+    """
+    _engine_state["analyzer"] = _engine_state["analyzer"] or DecagonAnalyzer()
+    _engine_state["warmup"] = warm_up_ephemeris()
+    _engine_state["ready"] = True
+    return _engine_state["warmup"]
+
+
+def analysis_engine_ready() -> bool:
+    return _engine_state["ready"]
+
+
+def get_analysis_warmup_report() -> Optional[Dict]:
+    return _engine_state["warmup"]
+
+
+def engine_health() -> Dict:
+    """Readiness signals for /health: warm-up state, ephemeris source and activity, cache tier"""
+    warmup = _engine_state["warmup"]
+    return {
+        "ready": _engine_state["ready"],
+        "swiss_ephemeris": warmup["ephemeris_source"] if warmup else "unavailable",
+        "swe_calc_calls": get_ephemeris_call_count(),
+        "result_cache": "memory" if get_result_cache().offline_mode else "redis",
+    }
+
+
+def _collect_engine_metrics():
+    """Scrape-time export of counters kept by the analysis services"""
+    cache_stats = get_result_cache().stats()
+    snapshot_info = compute_sky_snapshot.cache_info()
+    yield ("aetheria_swe_calc_calls", "counter", "swe.calc calls made by the analysis services",
+           [("aetheria_swe_calc_calls_total", {}, get_ephemeris_call_count())])
+    yield ("aetheria_engine_ready", "gauge", "1 once the analyzer is built and the ephemeris is warm",
+           [("aetheria_engine_ready", {}, 1 if _engine_state["ready"] else 0)])
+    yield ("aetheria_house_events", "counter", "House computations and natal chart lookups",
+           [("aetheria_house_events_total", {"event": event}, value) for event, value in get_house_stats().items()])
+    yield ("aetheria_sky_snapshot_cache", "counter", "Sky snapshot LRU lookups",
+           [("aetheria_sky_snapshot_cache_total", {"result": "hit"}, snapshot_info.hits),
+            ("aetheria_sky_snapshot_cache_total", {"result": "miss"}, snapshot_info.misses)])
+    yield ("aetheria_result_cache_events", "counter", "Analysis result cache lookups, evictions and errors",
+           [("aetheria_result_cache_events_total", {"event": event}, value)
+            for event, value in cache_stats.items() if event not in ("entries", "redis_round_trips")])
+    yield ("aetheria_result_cache_entries", "gauge", "Entries in the in-process analysis result cache",
+           [("aetheria_result_cache_entries", {}, cache_stats.get("entries", 0))])
+    yield ("aetheria_result_cache_redis_round_trips", "counter", "Redis commands sent by the analysis result cache",
+           [("aetheria_result_cache_redis_round_trips_total", {}, cache_stats.get("redis_round_trips", 0))])
+
+
+metrics.register_collector(_collect_engine_metrics)
+
+
+def get_analyzer() -> DecagonAnalyzer:
+    """Dependency: the shared analyzer (built on first use if the lifespan hook did not run)"""
+    if _engine_state["analyzer"] is None:
+        _engine_state["analyzer"] = DecagonAnalyzer()
+    return _engine_state["analyzer"]
+
+
 # ============================================================================
 # REQUEST/RESPONSE MODELS
 # ============================================================================
@@ -31,6 +123,9 @@ class AnalyzeRequest(BaseModel):
     birth_latitude: float
     birth_longitude: float
     dream_datetime: Optional[datetime] = None  # Defaults to now if not provided
+    zodiac_mode: ZodiacMode = ZodiacMode.TROPICAL  # tropical, lahiri, raman or krishnamurti
+    rr_intervals: Optional[str] = None  # base64 of packed little-endian RR intervals (ms)
+    rr_encoding: str = "u16"  # u16 (uint16 ms) or f32 (float32 ms)
 
 
 class BirthDataRequest(BaseModel):
@@ -46,8 +141,82 @@ class BirthDataRequest(BaseModel):
 # ENDPOINTS
 # ============================================================================
 
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """fields=a,b query value -> dimension names in schema order (None = all dimensions)"""
+    if fields is None or not fields.strip():
+        return None
+    try:
+        selected = DecagonAnalyzer.select_dimensions(fields.split(","))
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return None if len(selected) == len(DecagonAnalyzer.DIMENSIONS) else selected
+
+
+def _decode_rr_field(request: AnalyzeRequest):
+    """AnalyzeRequest.rr_intervals -> float64 ms array (None if absent); 422 if malformed"""
+    if not request.rr_intervals:
+        return None
+    if len(request.rr_intervals) > MAX_RR_FIELD_CHARS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"rr_intervals exceeds {MAX_RR_FIELD_CHARS} base64 characters; "
+                   "summarize long recordings with POST /api/v1/somatic/hrv"
+        )
+    try:
+        return decode_rr(base64.b64decode(request.rr_intervals, validate=True), request.rr_encoding)
+    except (ValueError, binascii.Error) as e:
+        raise HTTPException(status_code=422, detail=f"Invalid rr_intervals: {e}")
+
+
+def _selection_variant(selected: Optional[List[str]]) -> str:
+    """Cache key / ETag suffix for a sparse field selection ("" for the full analysis)"""
+    if selected is None:
+        return ""
+    return "-f" + hashlib.sha256(",".join(selected).encode()).hexdigest()[:8]
+
+
+def _cached_response(analysis_id: str, payload: str, media_type: str, selection: str = "") -> Response:
+    """
+    Serve a serialized analysis without re-validation: JSON as stored,
+    or MessagePack when negotiated. Each encoding and field selection has its own ETag.
+    """
+    body, media_type = encode(payload, media_type)
+    return Response(
+        content=body,
+        media_type=media_type,
+        headers={"ETag": etag_for(analysis_id, selection + ETAG_VARIANTS[media_type]), "Vary": "Accept"}
+    )
+
+
+def _pipeline_server_timing(pipeline: Dict) -> str:
+    """
+    Server-Timing value for the run that computed a response: pipeline total plus
+    one entry per dimension with its cache use. Per-run data stays out of the
+    cached document, which is shared by every request for that ETag.
+    """
+    entries = [f"pipeline;dur={pipeline['total_ms']:.3f}"]
+    entries.extend(
+        f"dim.{name};dur={report['ms']:.3f};desc={report['cache']}"
+        for name, report in pipeline["dimensions"].items()
+    )
+    return ", ".join(entries)
+
+
+def _not_modified(analysis_id: str, media_type: str, selection: str = "") -> Response:
+    return Response(
+        status_code=304,
+        headers={"ETag": etag_for(analysis_id, selection + ETAG_VARIANTS[media_type]), "Vary": "Accept"}
+    )
+
+
 @router.post("/analyze", response_model=DecagonAnalysisObject)
-async def analyze_dream(request: AnalyzeRequest):
+async def analyze_dream(
+    request: AnalyzeRequest,
+    fields: Optional[str] = Query(None, description="Comma-separated dimensions, e.g. nakshatra_snapshot,firdaria_phase"),
+    if_none_match: Optional[str] = Header(None),
+    accept: Optional[str] = Header(None),
+    analyzer: DecagonAnalyzer = Depends(get_analyzer)
+):
     """
     Main analysis endpoint: Dream + Birth Data → 10-Dimensional Analysis
     
@@ -62,28 +231,203 @@ async def analyze_dream(request: AnalyzeRequest):
         "dream_datetime": "2026-01-03T06:45:00Z"
     }
     ```
+    
+    Results are deterministic per analysis_id, which is returned as the ETag.
+    Retries are served from the result cache; If-None-Match with that ETag returns 304.
+    `Accept: application/msgpack` returns the same document as MessagePack.
+    `fields=` computes and returns only the listed dimensions (plus analysis_id and
+    timestamp); unrequested dimensions cost no ephemeris work.
+    A freshly computed response reports per-dimension timings and cache use in
+    Server-Timing; they are not part of the (cached) document.
+    `rr_intervals` (base64 of packed RR intervals, see /somatic/hrv) drives the somatic dimension.
     """
+    media_type = negotiate(accept)
+    selected = _parse_fields(fields)
+    selection = _selection_variant(selected)
+    rr_intervals = _decode_rr_field(request)
     try:
-        analyzer = DecagonAnalyzer()
-        
         # Use dream_datetime or default to now
         dream_dt = request.dream_datetime or datetime.utcnow()
         
-        result = analyzer.analyze(
-            dream_content=request.dream_content,
-            birth_datetime=request.birth_datetime,
-            birth_lat=request.birth_latitude,
-            birth_lon=request.birth_longitude,
-            current_datetime=dream_dt,
-            user_id=request.user_id
+        analysis_id = analyzer.compute_analysis_id(
+            request.dream_content,
+            calculate_julian_day(request.birth_datetime),
+            calculate_julian_day(dream_dt),
+            request.user_id,
+            request.birth_latitude,
+            request.birth_longitude,
+            request.zodiac_mode,
+            rr_checksum=rr_digest(rr_intervals) if rr_intervals is not None and len(rr_intervals) else None
         )
+        if etag_matches(if_none_match, analysis_id, selection + ETAG_VARIANTS[media_type]):
+            return _not_modified(analysis_id, media_type, selection)
+        
+        cache = get_result_cache()
+        with span("cache_lookup"):
+            payload = cache.get(analysis_id + selection)
+        if payload is not None:
+            return _cached_response(analysis_id, payload, media_type, selection)
         
-        return result
+        with span("analyze"):
+            result, pipeline = analyzer.analyze_with_timings(
+                dream_content=request.dream_content,
+                birth_datetime=request.birth_datetime,
+                birth_lat=request.birth_latitude,
+                birth_lon=request.birth_longitude,
+                current_datetime=dream_dt,
+                user_id=request.user_id,
+                zodiac_mode=request.zodiac_mode,
+                fields=selected,
+                rr_intervals=rr_intervals
+            )
         
+        with span("serialize"):
+            if selected is None:
+                payload = DecagonAnalysisObject(**result).model_dump_json()
+            else:
+                payload = pydantic_core.to_json(result).decode("utf-8")
+        with span("cache_store"):
+            cache.put(analysis_id + selection, payload)
+        response = _cached_response(analysis_id, payload, media_type, selection)
+        response.headers["Server-Timing"] = _pipeline_server_timing(pipeline)
+        return response
+        
+    except (HouseComputationError, NoValidBeatsError) as e:
+        # e.g. Placidus is undefined at polar latitudes, or RR data that is all artifacts -
+        # a client input problem, not a server fault
+        raise HTTPException(status_code=422, detail=f"Analysis failed: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 
+@router.get("/analyze/{analysis_id}", response_model=DecagonAnalysisObject)
+async def get_analysis(
+    analysis_id: str,
+    fields: Optional[str] = Query(None, description="Comma-separated dimensions to return"),
+    if_none_match: Optional[str] = Header(None),
+    accept: Optional[str] = Header(None)
+):
+    """
+    Previously computed analysis from the result cache (dashboard refreshes).
+    Supports If-None-Match / ETag, MessagePack and `fields=` (served from a cached
+    sparse result, or projected from the cached full one); 404 if not cached.
+    """
+    media_type = negotiate(accept)
+    selected = _parse_fields(fields)
+    selection = _selection_variant(selected)
+    if etag_matches(if_none_match, analysis_id, selection + ETAG_VARIANTS[media_type]):
+        return _not_modified(analysis_id, media_type, selection)
+    
+    cache = get_result_cache()
+    payload = cache.get(analysis_id + selection)
+    if payload is None and selected is not None:
+        full_payload = cache.get(analysis_id)
+        if full_payload is not None:
+            payload = project(full_payload, ["analysis_id", "timestamp", *selected])
+    if payload is None:
+        raise HTTPException(status_code=404, detail=f"Analysis {analysis_id} not found")
+    return _cached_response(analysis_id, payload, media_type, selection)
+
+
+@router.post("/somatic/hrv")
+async def summarize_hrv(request: Request, encoding: str = Query("u16", description="u16 (uint16 ms) or f32 (float32 ms)")):
+    """
+    HRV of a raw RR-interval recording sent as the request body
+    (application/octet-stream, packed little-endian samples).
+    
+    The body is consumed chunk by chunk, so a full night costs bounded memory.
+    Returns RMSSD, SDNN, LF/HF and the 100-point hrv_snapshot; `rmssd_ms` is
+    the value to report as BiometricContext.heart_rate_variability.
+    """
+    if encoding not in RR_ENCODINGS:
+        raise HTTPException(status_code=422, detail=f"Unknown RR encoding '{encoding}' (available: {', '.join(RR_ENCODINGS)})")
+    accumulator = HRVAccumulator()
+    async for chunk in request.stream():
+        accumulator.add_bytes(chunk, encoding)
+    if accumulator.has_pending_bytes:
+        raise HTTPException(status_code=422, detail=f"Body is not a whole number of {encoding} samples")
+    hrv = accumulator.summary()
+    if hrv.beats == 0:
+        raise HTTPException(status_code=422, detail=f"No valid beats: all {hrv.rejected} RR intervals were rejected as artifacts")
+    return {**hrv.biometric_context(), "hrv_snapshot": hrv.series}
+
+
+@router.get("/lunar-calendar/ingresses")
+async def get_lunar_ingresses(
+    start: datetime,
+    end: datetime,
+    kinds: Optional[str] = Query(None, description="Comma-separated subset of: pada, nakshatra, sign"),
+    zodiac_mode: ZodiacMode = Query(ZodiacMode.TROPICAL, description="tropical, lahiri, raman or krishnamurti")
+):
+    """
+    Exact Moon ingress times (UT) into padas, nakshatras and signs in [start, end).
+    
+    Example: `GET /api/v1/lunar-calendar/ingresses?start=2026-01-01T00:00:00&end=2026-02-01T00:00:00&kinds=nakshatra&zodiac_mode=lahiri`
+    Offsets are honoured (converted to UT); times without one are UT. Boundaries are
+    in the requested zodiac, as in the analysis for the same zodiac_mode.
+    """
+    # Mixed naive/aware bounds cannot be compared as given
+    start, end = to_naive_utc(start), to_naive_utc(end)
+    if end <= start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+    if (end - start).days > MAX_LUNAR_CALENDAR_DAYS:
+        raise HTTPException(status_code=400, detail=f"Range exceeds {MAX_LUNAR_CALENDAR_DAYS} days")
+    
+    requested_kinds = [k.strip() for k in kinds.split(",") if k.strip()] if kinds else list(INGRESS_KINDS)
+    unknown = set(requested_kinds) - set(INGRESS_KINDS)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown ingress kinds: {sorted(unknown)}")
+    
+    # A cold range is up to ~14 month windows of root-finding: keep it off the event loop
+    ingresses = await run_in_threadpool(lunar_ingresses_between, start, end, requested_kinds, zodiac_mode)
+    return {
+        "start": start,
+        "end": end,
+        "kinds": requested_kinds,
+        "zodiac_mode": zodiac_mode.value,
+        "count": len(ingresses),
+        "ingresses": ingresses
+    }
+
+
+@router.get("/firdaria/periods")
+async def get_firdaria_periods(
+    birth_datetime: datetime,
+    birth_latitude: float,
+    birth_longitude: float,
+    start: datetime,
+    end: datetime,
+    sub_periods: bool = Query(True, description="Sub-periods (default) or major periods only")
+):
+    """
+    Firdaria periods overlapping [start, end), in chronological order, for calendar views.
+    
+    Example: `GET /api/v1/firdaria/periods?birth_datetime=1990-05-15T03:30:00Z&birth_latitude=28.6139&birth_longitude=77.2090&start=2026-01-01T00:00:00&end=2036-01-01T00:00:00`
+    The sequence follows the sect of the natal chart, as in the analysis firdaria_phase.
+    """
+    birth_datetime, start, end = to_naive_utc(birth_datetime), to_naive_utc(start), to_naive_utc(end)
+    if end <= start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+    
+    birth_jd = calculate_julian_day(birth_datetime)
+    try:
+        ascendant = get_natal_houses(birth_jd, birth_latitude, birth_longitude).ascendant
+    except HouseComputationError as e:
+        raise HTTPException(status_code=422, detail=f"Firdaria failed: {str(e)}")
+    is_day_birth = is_day_chart(get_body_longitude(birth_jd, Planet.SUN), ascendant)
+    
+    # The timeline is cached per natal chart; a range query is a bisect and a slice
+    timeline = get_firdaria_timeline(birth_datetime, is_day_birth)
+    periods = timeline.periods_between(start, end, include_sub_periods=sub_periods)
+    return {
+        "start": start,
+        "end": end,
+        "is_day_birth": is_day_birth,
+        "count": len(periods),
+        "periods": periods
+    }
+
+
 @router.post("/birth-chart")
 async def save_birth_data(request: BirthDataRequest):
     """Store user's birth data for future analyses"""
@@ -0,0 +1,139 @@
+# apps/backend/routes/biometric_routes.py
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Dict, Optional
+import sys
+import os
+
+# Add services to path - use absolute path resolution
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(backend_dir, 'services'))
+
+from biometric_sessions import (
+    BiometricSessionError,
+    MAX_CHUNK_BYTES,
+    OffsetMismatchError,
+    SAMPLE_BYTES,
+    SessionNotFoundError,
+    get_session_store,
+)
+
+router = APIRouter(prefix="/api/v1/biometrics", tags=["biometrics"])
+
+
+class CreateSessionRequest(BaseModel):
+    """Start of an overnight recording"""
+    user_id: str
+    started_at: datetime  # wall-clock time of sample t_ms = 0
+
+
+def _upload_status(manifest: Dict) -> Dict:
+    return {
+        "session_id": manifest["session_id"],
+        "bytes_received": manifest["bytes_received"],
+        "samples_received": manifest["bytes_received"] // SAMPLE_BYTES,
+        "epochs_classified": manifest["epochs_classified"],
+        "completed": manifest["completed"],
+    }
+
+
+def _session_error(e: BiometricSessionError) -> HTTPException:
+    if isinstance(e, SessionNotFoundError):
+        return HTTPException(status_code=404, detail=str(e))
+    if isinstance(e, OffsetMismatchError):
+        return HTTPException(status_code=409, detail={"message": str(e), "bytes_received": e.bytes_received})
+    return HTTPException(status_code=409, detail=str(e))
+
+
+@router.post("/sessions", status_code=201)
+async def create_session(request: CreateSessionRequest):
+    """
+    Open an upload session for one night of samples.
+
+    Samples are packed little-endian records of 8 bytes, in time order:
+    uint32 t_ms (since started_at), uint16 rr_ms, uint16 motion (activity counts).
+    """
+    manifest = await run_in_threadpool(get_session_store().create, request.user_id, request.started_at)
+    return {**_upload_status(manifest), "sample_bytes": SAMPLE_BYTES, "max_chunk_bytes": MAX_CHUNK_BYTES}
+
+
+@router.get("/sessions/{session_id}")
+async def get_session(session_id: str):
+    """Upload progress: resume an interrupted upload from `bytes_received`"""
+    try:
+        return _upload_status(await run_in_threadpool(get_session_store().get, session_id))
+    except BiometricSessionError as e:
+        raise _session_error(e)
+
+
+@router.put("/sessions/{session_id}/chunks")
+async def upload_chunk(session_id: str, request: Request, offset: int = Query(..., ge=0)):
+    """
+    Append a chunk (application/octet-stream) at byte `offset`.
+
+    Chunks need not align with sample records. A chunk overlapping bytes
+    already received is accepted (the overlap is skipped); an offset past
+    `bytes_received` returns 409 with the offset to resume from.
+    Sleep phases of the 30-second epochs the chunk completes are scored immediately.
+    """
+    data = bytearray()
+    async for part in request.stream():
+        data += part
+        if len(data) > MAX_CHUNK_BYTES:
+            raise HTTPException(status_code=413, detail=f"Chunk exceeds {MAX_CHUNK_BYTES} bytes")
+    try:
+        manifest = await run_in_threadpool(get_session_store().append, session_id, offset, bytes(data))
+    except BiometricSessionError as e:
+        raise _session_error(e)
+    return _upload_status(manifest)
+
+
+@router.post("/sessions/{session_id}/complete")
+async def complete_session(session_id: str):
+    """Close the upload; scores the trailing partial epoch and returns the sleep summary"""
+    store = get_session_store()
+    try:
+        await run_in_threadpool(store.complete, session_id)
+        return await run_in_threadpool(store.sleep_summary, session_id)
+    except BiometricSessionError as e:
+        raise _session_error(e)
+
+
+@router.get("/sessions/{session_id}/sleep")
+async def get_sleep_summary(session_id: str, hypnogram: bool = False):
+    """
+    Sleep so far: minutes per phase, REM windows (with RMSSD) and
+    `timestamp_experience` (end of the last REM window). Available while uploading.
+    `hypnogram=true` adds the phase of every 30-second epoch.
+    """
+    store = get_session_store()
+    try:
+        summary = await run_in_threadpool(store.sleep_summary, session_id)
+        if hypnogram:
+            summary["hypnogram"] = [phase.value for phase in await run_in_threadpool(store.hypnogram, session_id)]
+        return summary
+    except BiometricSessionError as e:
+        raise _session_error(e)
+
+
+def experience_from_session(session_id: str, user_id: str) -> Optional[Dict]:
+    """
+    Dream-time context from a user's upload session: the last REM window's end
+    (timestamp_experience) and its RMSSD. None if the session is unknown, belongs
+    to another user or has no REM window yet.
+    """
+    store = get_session_store()
+    try:
+        if store.get(session_id)["user_id"] != str(user_id):
+            return None
+        summary = store.sleep_summary(session_id)
+    except BiometricSessionError:
+        return None
+    if summary["timestamp_experience"] is None:
+        return None
+    return {
+        "timestamp_experience": summary["timestamp_experience"],
+        "heart_rate_variability": summary["rem_windows"][-1]["rmssd_ms"],
+    }
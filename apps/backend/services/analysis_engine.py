@@ -2,8 +2,10 @@
 import sys
 import os
 from datetime import datetime
-from typing import Dict, List
+from functools import cached_property
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 import hashlib
+import math
 import json
 
 # Add packages to path - use absolute path resolution
@@ -20,7 +22,6 @@ from schemas import (
     SomaticResonance,
     FirdariaPhase,
     Planet,
-    Nakshatra,
     InputModality,
     PsychologicalPressure
 )
@@ -28,16 +29,166 @@ from schemas import (
 # Import time_keeper from same directory
 from time_keeper import (
     calculate_julian_day,
-    get_planet_position,
-    calculate_nakshatra,
-    calculate_ascendant,
+    calculate_nakshatra_array,
+    julian_day_to_datetime,
+    age_to_datetime,
+    NAKSHATRA_ENUM_TABLE,
+    NAKSHATRA_DEITY_TABLE,
+    NAKSHATRA_THEME_TABLE,
     lot_of_fortune,
     lot_of_spirit,
     is_day_chart,
-    calculate_firdaria
+    get_firdaria_timeline,
+    FirdariaTimeline,
+    get_ayanamsa,
+    ZodiacMode
 )
+from house_service import compute_houses, get_natal_houses, get_natal_house_lookup, HouseCusps, HouseLookup
+from sky_snapshot import get_sky_snapshot, get_body_longitude, SkySnapshot
+from somatic import HRVSummary, NoValidBeatsError, rr_digest, summarize_rr
+from dimension_pipeline import Cacheability, Dimension, DimensionPipeline, DEFAULT_WORKERS
 
-import swisseph as swe
+# Output precision: longitudes to 1e-6 degree (~0.004 arcsec), normalized HRV samples to 1e-4.
+# Keeps serialized floats short without affecting any astrological result.
+LONGITUDE_DECIMALS = 6
+HRV_DECIMALS = 4
+
+
+def compact_longitude(longitude: float) -> float:
+    """Longitude rounded for output, kept in [0, 360) (359.9999999 -> 0.0)"""
+    return round(longitude, LONGITUDE_DECIMALS) % 360.0
+
+
+class AnalysisInputs:
+    """
+    Shared inputs of one analysis, computed on first access and then reused.
+    Dimensions pull only what they need: e.g. the nakshatra needs just the
+    transit Moon (one ephemeris call), the lots need the current ascendant.
+    """
+    
+    # Input -> inputs it is computed from (the pipeline resolves these first)
+    DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+        "is_day": ("transit_sun", "current_houses"),
+        "natal_house_lookup": ("natal_houses",),
+        "current_house_lookup": ("current_houses",),
+        "is_day_birth": ("natal_sun", "natal_houses"),
+        "firdaria_timeline": ("is_day_birth",),
+    }
+    
+    def __init__(
+        self,
+        dream_content: str,
+        birth_jd: float,
+        current_jd: float,
+        birth_lat: float,
+        birth_lon: float,
+        zodiac_mode: ZodiacMode,
+        full_sky: bool = True,
+        rr_intervals: Optional[Sequence[float]] = None
+    ):
+        self.dream_content = dream_content
+        self.birth_jd = birth_jd
+        self.current_jd = current_jd
+        self.birth_lat = birth_lat
+        self.birth_lon = birth_lon
+        self.zodiac_mode = zodiac_mode
+        # True: read bodies from cached full-sky snapshots; False: one ephemeris call per body
+        self.full_sky = full_sky
+        self.rr_intervals = rr_intervals
+    
+    def _body(self, jd: float, planet: Planet) -> float:
+        if self.full_sky:
+            return get_sky_snapshot(jd, self.zodiac_mode).longitude(planet)
+        return get_body_longitude(jd, planet, self.zodiac_mode)
+    
+    @cached_property
+    def transit_sky(self) -> SkySnapshot:
+        return get_sky_snapshot(self.current_jd, self.zodiac_mode)
+    
+    @cached_property
+    def natal_moon(self) -> float:
+        return self._body(self.birth_jd, Planet.MOON)
+    
+    @cached_property
+    def natal_sun(self) -> float:
+        return self._body(self.birth_jd, Planet.SUN)
+    
+    @cached_property
+    def transit_sun(self) -> float:
+        return self._body(self.current_jd, Planet.SUN)
+    
+    @cached_property
+    def transit_moon(self) -> float:
+        return self._body(self.current_jd, Planet.MOON)
+    
+    @cached_property
+    def natal_houses(self) -> HouseCusps:
+        return get_natal_houses(self.birth_jd, self.birth_lat, self.birth_lon).shifted(
+            get_ayanamsa(self.birth_jd, self.zodiac_mode)
+        )
+    
+    @cached_property
+    def current_houses(self) -> HouseCusps:
+        return compute_houses(self.current_jd, self.birth_lat, self.birth_lon).shifted(
+            get_ayanamsa(self.current_jd, self.zodiac_mode)
+        )
+    
+    @cached_property
+    def is_day(self) -> bool:
+        return is_day_chart(self.transit_sun, self.current_houses.ascendant)
+    
+    @cached_property
+    def is_day_birth(self) -> bool:
+        """Sect of the natal chart (is_day is the sect at dream time)"""
+        return is_day_chart(self.natal_sun, self.natal_houses.ascendant)
+    
+    @cached_property
+    def firdaria_timeline(self) -> FirdariaTimeline:
+        # Shared per natal chart: later dreams only bisect the period tables
+        return get_firdaria_timeline(julian_day_to_datetime(self.birth_jd), self.is_day_birth)
+    
+    @cached_property
+    def natal_house_lookup(self) -> HouseLookup:
+        return get_natal_house_lookup(self.natal_houses)
+    
+    @cached_property
+    def current_house_lookup(self) -> HouseLookup:
+        # A new chart per request: not worth a slot in the natal lookup cache
+        return HouseLookup(self.current_houses.cusps)
+    
+    @cached_property
+    def hrv(self) -> Optional[HRVSummary]:
+        if self.rr_intervals is None or len(self.rr_intervals) == 0:
+            return None
+        summary = summarize_rr(self.rr_intervals)
+        if summary.beats == 0:
+            # An empty hrv_snapshot would break the 100-point contract; a stub would pass off no data as HRV
+            raise NoValidBeatsError(f"All {summary.rejected} RR intervals were rejected as artifacts")
+        return summary
+    
+    @property
+    def age(self) -> float:
+        # From JDs, so naive and aware datetimes can be mixed
+        return (self.current_jd - self.birth_jd) / 365.25
+    
+    @property
+    def ut_day(self) -> int:
+        """Julian Day Number of the UT calendar day of current_jd (JDs start at noon)"""
+        return math.floor(self.current_jd + 0.5)
+    
+    @property
+    def day_age(self) -> float:
+        """Age at 0h UT of the current day - same value for every analysis that day"""
+        return (self.ut_day - 0.5 - self.birth_jd) / 365.25
+    
+    def cache_key(self, cacheability: Cacheability) -> Optional[tuple]:
+        """Scope a dimension result is reusable in (None for per-request results)"""
+        if cacheability is Cacheability.PER_REQUEST:
+            return None
+        natal = (self.birth_jd, self.birth_lat, self.birth_lon, self.zodiac_mode.value)
+        if cacheability is Cacheability.PER_NATAL:
+            return natal
+        return natal + (self.ut_day,)
 
 
 class DecagonAnalyzer:
@@ -46,10 +197,47 @@ class DecagonAnalyzer:
     All astronomical calculations are deterministic (Swiss Ephemeris).
     """
     
-    def __init__(self):
-        self.version = "1.0.0"
+    # Dimension registry, in schema order: response field -> builder method,
+    # declared inputs (AnalysisInputs attributes) and cacheability. Inputs are
+    # lazy, so a dimension that is not requested costs nothing - no snapshot,
+    # house or ayanamsa computation for it.
+    DIMENSIONS: Dict[str, Dimension] = {dimension.name: dimension for dimension in (
+        Dimension("shadow_weave", "_dimension_shadow_weave", ("dream_content", "transit_moon", "natal_moon")),
+        Dimension("celestial_transit", "_dimension_celestial_transit", ("transit_sky", "natal_house_lookup")),
+        Dimension("nakshatra_snapshot", "_dimension_nakshatra_snapshot", ("transit_moon",)),
+        Dimension(
+            "arabic_lot", "_dimension_arabic_lot",
+            ("current_houses", "current_house_lookup", "transit_sun", "transit_moon", "is_day")
+        ),
+        # Vimshottari periods last years: the age at the start of the UT day is precise enough
+        Dimension("dasha_period", "_dimension_dasha_period", ("birth_jd", "day_age"), Cacheability.PER_DAY),
+        Dimension("somatic_resonance", "_dimension_somatic_resonance", ("hrv",)),
+        Dimension("ancestral_ghost", "_dimension_ancestral_ghost"),
+        Dimension("collective_ripple", "_dimension_collective_ripple"),
+        Dimension("digital_doppelganger", "_dimension_digital_doppelganger"),
+        Dimension("firdaria_phase", "_dimension_firdaria_phase", ("age", "firdaria_timeline")),
+    )}
+    
+    def __init__(self, workers: int = DEFAULT_WORKERS):
+        # Bump with any change to the output for the same inputs: the version is part of
+        # analysis_id, so cached results and ETags of older versions are not served.
+        # 1.1.0 rounding (user-042), 1.2.0 dasha from the age at 0h UT (user-044), 1.3.0 RR-based somatic (user-045),
+        # 1.4.0 Firdaria sub-period lord (user-026), 1.5.0 dasha dates from the chart (user-044)
+        self.version = "1.5.0"
+        # workers > 0 builds independent dimensions concurrently on a thread pool
+        self.pipeline = DimensionPipeline(self.DIMENSIONS, AnalysisInputs.DEPENDENCIES, workers=workers)
     
-    def analyze(self, dream_content: str, birth_datetime: datetime, birth_lat: float, birth_lon: float, current_datetime: datetime, user_id: str) -> DecagonAnalysisObject:
+    def analyze(
+        self,
+        dream_content: str,
+        birth_datetime: datetime,
+        birth_lat: float,
+        birth_lon: float,
+        current_datetime: datetime,
+        user_id: str,
+        zodiac_mode: ZodiacMode = ZodiacMode.TROPICAL,
+        rr_intervals: Optional[Sequence[float]] = None
+    ) -> DecagonAnalysisObject:
         """
         Main analysis method - composes all 10 dimensions.
         
@@ -60,107 +248,197 @@ class DecagonAnalyzer:
             birth_lon: Birth longitude
             current_datetime: When dream occurred
             user_id: User ID for checksum
+            zodiac_mode: Tropical (default) or a sidereal ayanamsa (Lahiri, Raman, Krishnamurti)
+            rr_intervals: Overnight RR intervals (ms) for the somatic dimension, if recorded
         
         Returns:
             DecagonAnalysisObject with all 10 analysis dimensions
-        """
-        # Calculate Julian Days
-        birth_jd = calculate_julian_day(birth_datetime)
-        current_jd = calculate_julian_day(current_datetime)
-        
-        # Get natal positions
-        natal_moon = get_planet_position(birth_jd, swe.MOON)
-        natal_asc = calculate_ascendant(birth_jd, birth_lat, birth_lon)
-        
-        # Get current (transit) positions
-        transit_sun = get_planet_position(current_jd, swe.SUN)
-        transit_moon = get_planet_position(current_jd, swe.MOON)
-        transit_mercury = get_planet_position(current_jd, swe.MERCURY)
-        transit_venus = get_planet_position(current_jd, swe.VENUS)
-        transit_mars = get_planet_position(current_jd, swe.MARS)
-        transit_jupiter = get_planet_position(current_jd, swe.JUPITER)
-        transit_saturn = get_planet_position(current_jd, swe.SATURN)
-        
-        current_asc = calculate_ascendant(current_jd, birth_lat, birth_lon)
-        
-        # Calculate day/night chart
-        is_day = is_day_chart(transit_sun, current_asc)
         
-        # Calculate age
-        age = (current_datetime - birth_datetime).days / 365.25
+        Raises:
+            HouseComputationError: if natal or current houses cannot be computed
+        """
+        return DecagonAnalysisObject(**self.analyze_fields(
+            dream_content, birth_datetime, birth_lat, birth_lon, current_datetime, user_id, zodiac_mode,
+            rr_intervals=rr_intervals
+        ))
+    
+    def analyze_fields(
+        self,
+        dream_content: str,
+        birth_datetime: datetime,
+        birth_lat: float,
+        birth_lon: float,
+        current_datetime: datetime,
+        user_id: str,
+        zodiac_mode: ZodiacMode = ZodiacMode.TROPICAL,
+        fields: Optional[Iterable[str]] = None,
+        rr_intervals: Optional[Sequence[float]] = None
+    ) -> Dict[str, Any]:
+        """
+        Compute only the requested dimensions (all when fields is None).
         
-        # ========================================================================
-        # DIMENSION 1: Shadow-Weave (Jungian Archetypal Analysis)
-        # ========================================================================
-        shadow_weave = self._analyze_shadow_weave(dream_content, transit_moon, natal_moon)
+        Returns: {"analysis_id", "timestamp", <dimension>: value, ...} in schema order;
+        values are the same objects analyze() puts in the DecagonAnalysisObject.
         
-        # ========================================================================
-        # DIMENSION 2: Celestial Transit (Current planetary pressures)
-        # ========================================================================
-        celestial_transits = self._analyze_celestial_transits(
-            transit_sun, transit_moon, transit_mercury, transit_venus,
-            transit_mars, transit_jupiter, transit_saturn
+        Raises:
+            ValueError: for unknown dimension names
+            HouseComputationError: if a requested dimension needs houses that cannot be computed
+        """
+        result, _ = self.analyze_with_timings(
+            dream_content, birth_datetime, birth_lat, birth_lon, current_datetime, user_id, zodiac_mode,
+            fields=fields, rr_intervals=rr_intervals
         )
+        return result
+    
+    def analyze_with_timings(
+        self,
+        dream_content: str,
+        birth_datetime: datetime,
+        birth_lat: float,
+        birth_lon: float,
+        current_datetime: datetime,
+        user_id: str,
+        zodiac_mode: ZodiacMode = ZodiacMode.TROPICAL,
+        fields: Optional[Iterable[str]] = None,
+        rr_intervals: Optional[Sequence[float]] = None
+    ) -> Tuple[Dict[str, Any], Dict]:
+        """
+        analyze_fields plus the report of this run: per-input and per-dimension
+        timings and cache use. The report describes the computation, not the
+        result, so it is returned alongside it (the API sends it as Server-Timing).
         
-        # ========================================================================
-        # DIMENSION 3: Nakshatra Snapshot (27 Lunar Mansions)
-        # ========================================================================
-        nakshatra_snapshot = self._analyze_nakshatra(transit_moon)
-        
-        # ========================================================================
-        # DIMENSION 4: Arabic Lots (Hermetic Fortune/Spirit)
-        # ========================================================================
-        arabic_lots = self._analyze_arabic_lots(current_asc, transit_sun, transit_moon, is_day)
-        
-        # ========================================================================
-        # DIMENSION 5: Dasha Period (Vedic Planetary Periods)
-        # ========================================================================
-        dasha_period = self._analyze_dasha(age)
-        
-        # ========================================================================
-        # DIMENSION 6: Somatic Resonance (Biometric stub - real HRV in production)
-        # ========================================================================
-        somatic_resonance = self._analyze_somatic_resonance()
-        
-        # ========================================================================
-        # DIMENSION 7: Ancestral Ghost (Archetypal inheritance - stub)
-        # ========================================================================
-        ancestral_ghost = None  # Optional - not implemented yet
-        
-        # ========================================================================
-        # DIMENSION 8: Collective Ripple (Cultural zeitgeist - stub)
-        # ========================================================================
-        collective_ripple = None  # Optional - requires Pinecone cohort search
-        
-        # ========================================================================
-        # DIMENSION 9: Digital Doppelganger (AI reflection - stub)
-        # ========================================================================
-        digital_doppelganger = None  # Optional
-        
-        # ========================================================================
-        # DIMENSION 10: Firdaria Phase (Persian Time-Lords)
-        # ========================================================================
-        firdaria_phase = self._analyze_firdaria(age, is_day)
-        
-        # Generate deterministic checksum
-        checksum_data = f"{user_id}:{dream_content}:{birth_jd}:{current_jd}"
-        checksum = hashlib.sha256(checksum_data.encode()).hexdigest()[:16]
+        Returns: (result as from analyze_fields, pipeline report)
+        """
+        selected = self.select_dimensions(fields)
+        inputs = AnalysisInputs(
+            dream_content=dream_content,
+            birth_jd=calculate_julian_day(birth_datetime),
+            current_jd=calculate_julian_day(current_datetime),
+            birth_lat=birth_lat,
+            birth_lon=birth_lon,
+            zodiac_mode=ZodiacMode(zodiac_mode),
+            # Transits read several bodies: one snapshot sweep is cheaper than per-body calls
+            full_sky="celestial_transit" in selected,
+            rr_intervals=rr_intervals
+        )
         
-        return DecagonAnalysisObject(
-            analysis_id=f"DEC-{checksum}",
-            timestamp=current_datetime,
-            shadow_weave=shadow_weave,
-            celestial_transit=celestial_transits,
-            nakshatra_snapshot=nakshatra_snapshot,
-            arabic_lot=arabic_lots,
-            dasha_period=dasha_period,
-            somatic_resonance=somatic_resonance,
-            ancestral_ghost=ancestral_ghost,
-            collective_ripple=collective_ripple,
-            digital_doppelganger=digital_doppelganger,
-            firdaria_phase=firdaria_phase
+        result: Dict[str, Any] = {
+            "analysis_id": self.compute_analysis_id(
+                dream_content, inputs.birth_jd, inputs.current_jd, user_id, birth_lat, birth_lon, inputs.zodiac_mode,
+                rr_checksum=rr_digest(rr_intervals) if rr_intervals is not None and len(rr_intervals) else None
+            ),
+            "timestamp": current_datetime,
+        }
+        values, pipeline = self.pipeline.run(self, inputs, selected, inputs.cache_key)
+        for name in selected:
+            result[name] = values[name]
+        return result, pipeline
+    
+    @classmethod
+    def select_dimensions(cls, fields: Optional[Iterable[str]]) -> List[str]:
+        """Requested dimension names in registry order (all when fields is None)"""
+        if fields is None:
+            return list(cls.DIMENSIONS)
+        requested = {field.strip() for field in fields if field and field.strip()}
+        unknown = requested - set(cls.DIMENSIONS)
+        if unknown:
+            raise ValueError(
+                f"Unknown analysis fields: {', '.join(sorted(unknown))} "
+                f"(available: {', '.join(cls.DIMENSIONS)})"
+            )
+        return [name for name in cls.DIMENSIONS if name in requested]
+    
+    # ========================================================================
+    # DIMENSION 1: Shadow-Weave (Jungian Archetypal Analysis)
+    # ========================================================================
+    def _dimension_shadow_weave(self, inputs: "AnalysisInputs") -> List[ShadowWeaveNode]:
+        return self._analyze_shadow_weave(inputs.dream_content, inputs.transit_moon, inputs.natal_moon)
+    
+    # ========================================================================
+    # DIMENSION 2: Celestial Transit (Current planetary pressures)
+    # ========================================================================
+    def _dimension_celestial_transit(self, inputs: "AnalysisInputs") -> List[Dict]:
+        return self._analyze_celestial_transits(inputs.transit_sky, natal_houses=inputs.natal_house_lookup)
+    
+    # ========================================================================
+    # DIMENSION 3: Nakshatra Snapshot (27 Lunar Mansions)
+    # ========================================================================
+    def _dimension_nakshatra_snapshot(self, inputs: "AnalysisInputs") -> NakshatraSnapshot:
+        return self._analyze_nakshatra(inputs.transit_moon)
+    
+    # ========================================================================
+    # DIMENSION 4: Arabic Lots (Hermetic Fortune/Spirit)
+    # ========================================================================
+    def _dimension_arabic_lot(self, inputs: "AnalysisInputs") -> List[ArabicLot]:
+        return self._analyze_arabic_lots(
+            inputs.current_houses.ascendant, inputs.transit_sun, inputs.transit_moon, inputs.is_day,
+            houses=inputs.current_house_lookup
         )
     
+    # ========================================================================
+    # DIMENSION 5: Dasha Period (Vedic Planetary Periods)
+    # ========================================================================
+    def _dimension_dasha_period(self, inputs: "AnalysisInputs") -> DashaPeriod:
+        return self._analyze_dasha(inputs.birth_jd, inputs.day_age)
+    
+    # ========================================================================
+    # DIMENSION 6: Somatic Resonance (HRV from RR intervals; stub without a recording)
+    # ========================================================================
+    def _dimension_somatic_resonance(self, inputs: "AnalysisInputs") -> SomaticResonance:
+        if inputs.hrv is not None:
+            return self._analyze_hrv(inputs.hrv)
+        return self._analyze_somatic_resonance()
+    
+    # ========================================================================
+    # DIMENSION 7: Ancestral Ghost (Archetypal inheritance - stub)
+    # ========================================================================
+    def _dimension_ancestral_ghost(self, inputs: "AnalysisInputs") -> None:
+        return None  # Optional - not implemented yet
+    
+    # ========================================================================
+    # DIMENSION 8: Collective Ripple (Cultural zeitgeist - stub)
+    # ========================================================================
+    def _dimension_collective_ripple(self, inputs: "AnalysisInputs") -> None:
+        return None  # Optional - requires Pinecone cohort search
+    
+    # ========================================================================
+    # DIMENSION 9: Digital Doppelganger (AI reflection - stub)
+    # ========================================================================
+    def _dimension_digital_doppelganger(self, inputs: "AnalysisInputs") -> None:
+        return None  # Optional
+    
+    # ========================================================================
+    # DIMENSION 10: Firdaria Phase (Persian Time-Lords)
+    # ========================================================================
+    def _dimension_firdaria_phase(self, inputs: "AnalysisInputs") -> FirdariaPhase:
+        return self._analyze_firdaria(inputs.firdaria_timeline, inputs.age)
+    
+    def compute_analysis_id(
+        self,
+        dream_content: str,
+        birth_jd: float,
+        current_jd: float,
+        user_id: str,
+        birth_lat: float,
+        birth_lon: float,
+        zodiac_mode: ZodiacMode = ZodiacMode.TROPICAL,
+        rr_checksum: Optional[str] = None
+    ) -> str:
+        """
+        Deterministic analysis id (sha256 checksum of every input the result depends on,
+        and of the analyzer version). Available before analysis runs, so it doubles as
+        the result cache key and ETag.
+        """
+        # Birth location drives the houses (transit houses, lots, day/night chart)
+        checksum_data = f"{self.version}:{user_id}:{dream_content}:{birth_jd}:{current_jd}:{birth_lat}:{birth_lon}"
+        if ZodiacMode(zodiac_mode) is not ZodiacMode.TROPICAL:
+            checksum_data += f":{ZodiacMode(zodiac_mode).value}"
+        if rr_checksum:
+            # RR recording drives the somatic dimension (see somatic.rr_digest)
+            checksum_data += f":rr={rr_checksum}"
+        checksum = hashlib.sha256(checksum_data.encode()).hexdigest()[:16]
+        return f"DEC-{checksum}"
+    
     def _analyze_shadow_weave(self, dream_content: str, transit_moon: float, natal_moon: float) -> List[ShadowWeaveNode]:
         """Jungian archetypal analysis (simplified stub - real LLM analysis in production)"""
         # In production: Use LLM to extract archetypal symbols
@@ -189,30 +467,33 @@ class DecagonAnalyzer:
             )
         ]
     
-    def _analyze_celestial_transits(self, sun, moon, mercury, venus, mars, jupiter, saturn) -> List[Dict]:
-        """Map current planetary positions to psychological pressures"""
+    def _analyze_celestial_transits(self, sky: SkySnapshot, natal_houses: HouseLookup) -> List[Dict]:
+        """Map current planetary positions to psychological pressures (houses are natal houses)"""
         transits = []
+        sun = sky.longitude(Planet.SUN)
+        moon = sky.longitude(Planet.MOON)
+        saturn = sky.longitude(Planet.SATURN)
         
         transits.append({
             "planet": Planet.SUN.value,
-            "longitude": sun,
-            "house_position": int(sun / 30) + 1,  # Simplified house
+            "longitude": compact_longitude(sun),
+            "house_position": natal_houses.house_of(sun),
             "pressure_type": PsychologicalPressure.FLOW.value,
             "intensity": 0.7
         })
         
         transits.append({
             "planet": Planet.MOON.value,
-            "longitude": moon,
-            "house_position": int(moon / 30) + 1,
+            "longitude": compact_longitude(moon),
+            "house_position": natal_houses.house_of(moon),
             "pressure_type": PsychologicalPressure.FRICTION.value,
             "intensity": 0.9
         })
         
         transits.append({
             "planet": Planet.SATURN.value,
-            "longitude": saturn,
-            "house_position": int(saturn / 30) + 1,
+            "longitude": compact_longitude(saturn),
+            "house_position": natal_houses.house_of(saturn),
             "pressure_type": PsychologicalPressure.RESTRICTION.value,
             "intensity": 0.6
         })
@@ -221,49 +502,38 @@ class DecagonAnalyzer:
     
     def _analyze_nakshatra(self, moon_longitude: float) -> NakshatraSnapshot:
         """Calculate current Nakshatra from Moon position"""
-        name, pada, deity, theme = calculate_nakshatra(moon_longitude)
-        
-        # Map name string to enum
-        nakshatra_enum = Nakshatra[name.upper().replace(" ", "_")]
-        
-        # Determine ruling planet (Vimshottari rulership)
-        ruling_planet_map = {
-            0: Planet.KETU, 1: Planet.VENUS, 2: Planet.SUN, 3: Planet.MOON,
-            4: Planet.MARS, 5: Planet.RAHU, 6: Planet.JUPITER, 7: Planet.SATURN,
-            8: Planet.MERCURY
-        }
-        nakshatra_index = list(Nakshatra).index(nakshatra_enum)
-        ruling_planet = ruling_planet_map[nakshatra_index % 9]
+        index, pada, ruler = calculate_nakshatra_array([moon_longitude])
+        i = int(index[0])
         
         return NakshatraSnapshot(
-            nakshatra=nakshatra_enum,
-            pada=pada,
-            ruling_planet=ruling_planet,
-            deity=deity,
-            archetypal_theme=theme
+            nakshatra=NAKSHATRA_ENUM_TABLE[i],
+            pada=int(pada[0]),
+            ruling_planet=ruler[0],
+            deity=NAKSHATRA_DEITY_TABLE[i],
+            archetypal_theme=NAKSHATRA_THEME_TABLE[i]
         )
     
-    def _analyze_arabic_lots(self, asc: float, sun: float, moon: float, is_day: bool) -> List[ArabicLot]:
-        """Calculate Arabic Lots/Parts"""
+    def _analyze_arabic_lots(self, asc: float, sun: float, moon: float, is_day: bool, houses: HouseLookup) -> List[ArabicLot]:
+        """Calculate Arabic Lots/Parts, placed in the houses of the chart they are cast from"""
         fortune = lot_of_fortune(asc, sun, moon, is_day)
         spirit = lot_of_spirit(asc, sun, moon, is_day)
         
         return [
             ArabicLot(
                 lot_name="Lot of Fortune",
-                longitude=fortune,
-                house_position=int(fortune / 30) + 1,
+                longitude=compact_longitude(fortune),
+                house_position=houses.house_of(fortune),
                 hermetic_meaning="Material fortune, body, physical manifestation"
             ),
             ArabicLot(
                 lot_name="Lot of Spirit",
-                longitude=spirit,
-                house_position=int(spirit / 30) + 1,
+                longitude=compact_longitude(spirit),
+                house_position=houses.house_of(spirit),
                 hermetic_meaning="Spiritual fortune, soul, divine will"
             )
         ]
     
-    def _analyze_dasha(self, age: float) -> DashaPeriod:
+    def _analyze_dasha(self, birth_jd: float, age: float) -> DashaPeriod:
         """Calculate Vimshottari Dasha (simplified - full calculation needs natal Moon Nakshatra)"""
         # In production: Calculate exact dasha balance from natal Moon
         # For now: Simplified planetary period assignment
@@ -275,16 +545,19 @@ class DecagonAnalyzer:
             (Planet.JUPITER, 16), (Planet.SATURN, 19), (Planet.MERCURY, 17)
         ]
         
-        age_in_cycle = age % total_cycle
+        cycle_start = (age // total_cycle) * total_cycle
+        age_in_cycle = age - cycle_start
         cursor = 0
         
+        # Dates from the chart and the age only (per-day cached: no clock reads)
+        birth_datetime = julian_day_to_datetime(birth_jd)
         for planet, duration in dasha_sequence:
             if cursor <= age_in_cycle < cursor + duration:
                 return DashaPeriod(
                     maha_dasha_lord=planet,
                     antardasha_lord=planet,  # Simplified - should be sub-period
-                    start_date=datetime.now(),  # Stub
-                    end_date=datetime.now(),  # Stub
+                    start_date=age_to_datetime(birth_datetime, cycle_start + cursor),
+                    end_date=age_to_datetime(birth_datetime, cycle_start + cursor + duration),
                     karmic_theme=f"{planet.value} period: Karmic lessons of {planet.value}"
                 )
             cursor += duration
@@ -293,25 +566,35 @@ class DecagonAnalyzer:
         return DashaPeriod(
             maha_dasha_lord=Planet.SUN,
             antardasha_lord=Planet.SUN,
-            start_date=datetime.now(),
-            end_date=datetime.now(),
+            start_date=birth_datetime,
+            end_date=birth_datetime,
             karmic_theme="Solar period: Authority, self-expression"
         )
     
     def _analyze_somatic_resonance(self) -> SomaticResonance:
         """Biometric analysis stub - real HRV data in production"""
         return SomaticResonance(
-            hrv_snapshot=[0.5 + (i % 10) * 0.05 for i in range(100)],  # Mock sine wave
+            hrv_snapshot=[round(0.5 + (i % 10) * 0.05, HRV_DECIMALS) for i in range(100)],  # Mock sine wave
             biometric_context={"sleep_phase": "REM", "heart_rate_avg": 65},
             body_map_activations={"chest": 0.7, "throat": 0.4, "solar_plexus": 0.6}
         )
     
-    def _analyze_firdaria(self, age: float, is_day: bool) -> FirdariaPhase:
-        """Persian time-lord system"""
-        firdaria_data = calculate_firdaria(age, is_day)
+    def _analyze_hrv(self, hrv: HRVSummary) -> SomaticResonance:
+        """Somatic resonance from a measured RR recording"""
+        return SomaticResonance(
+            hrv_snapshot=hrv.series,
+            biometric_context=hrv.biometric_context(),
+            # Body map stays a stub until body-region signals are recorded
+            body_map_activations={"chest": 0.7, "throat": 0.4, "solar_plexus": 0.6}
+        )
+    
+    def _analyze_firdaria(self, timeline: FirdariaTimeline, age: float) -> FirdariaPhase:
+        """Persian time-lord system: major period and sub-period at the given age"""
+        firdaria_data = timeline.period_at_age(age)
         
         return FirdariaPhase(
             ruling_planet=Planet(firdaria_data["ruling_planet"]),
+            sub_period_lord=Planet(firdaria_data["sub_period"]["sub_planet"]),
             start_age=firdaria_data["start_age"],
             end_age=firdaria_data["end_age"],
             current_phase=True,
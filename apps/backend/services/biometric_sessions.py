@@ -0,0 +1,333 @@
+# apps/backend/services/biometric_sessions.py
+"""
+Overnight biometric upload sessions.
+
+A wearable uploads the night as a byte stream of fixed-size sample records
+(SAMPLE_DTYPE: beat time, RR interval, motion count), in chunks of any size.
+Chunks are appended at an explicit byte offset, so an interrupted upload
+resumes from `bytes_received`; a retransmitted overlap is skipped.
+
+Samples live in a per-session memory-mapped file whose capacity doubles as
+it fills. After each chunk, only the newly completed 30-second epochs are
+read back and classified, so RAM use is bounded by the chunk size whatever
+the length of the night. Epoch phases are appended to a second file; the
+segmenter's running statistics are kept in the session manifest. The
+manifest is the commit point: bytes past its bytes_received / epochs_classified
+(left by a crash before the manifest write) are ignored and overwritten.
+
+Layout under BIOMETRIC_SESSION_DIR (default apps/backend/.biometric_sessions):
+    <session_id>/session.json   manifest (offsets, segmenter state)
+    <session_id>/samples.bin    sample records (memory-mapped, preallocated)
+    <session_id>/epochs.bin     one phase code (uint8) per 30 s epoch
+"""
+import json
+import os
+import sys
+import threading
+import uuid
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# Add packages to path - use absolute path resolution
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+repo_root = os.path.dirname(os.path.dirname(backend_dir))
+sys.path.insert(0, os.path.join(repo_root, 'packages', 'shared-schema', 'src'))
+
+from schemas import SleepPhase
+
+# One record per heartbeat: ms since session start, RR interval (ms), motion (activity counts)
+SAMPLE_DTYPE = np.dtype([("t_ms", "<u4"), ("rr_ms", "<u2"), ("motion", "<u2")])
+SAMPLE_BYTES = SAMPLE_DTYPE.itemsize
+
+SESSION_DIR = os.getenv("BIOMETRIC_SESSION_DIR", os.path.join(backend_dir, ".biometric_sessions"))
+INITIAL_CAPACITY_BYTES = 64 * 1024 * SAMPLE_BYTES
+MAX_CHUNK_BYTES = 4 * 1024 * 1024
+
+EPOCH_SECONDS = 30
+PHASE_CODES = [SleepPhase.WAKE, SleepPhase.NREM1, SleepPhase.NREM2, SleepPhase.NREM3, SleepPhase.REM]
+_CODE = {phase: code for code, phase in enumerate(PHASE_CODES)}
+
+# Segmentation thresholds (actigraphy + cardiac heuristic, per 30 s epoch)
+WAKE_MOTION = 40.0  # mean activity counts above which the epoch is wake
+STILL_MOTION = 5.0  # below: atonia / deep stillness
+DEEP_HR_Z = -0.5  # heart rate this many SDs under the night's mean -> NREM3
+REM_HR_Z = 0.3  # REM: elevated heart rate ...
+REM_VARIABILITY_RATIO = 1.2  # ... and RR variability above the night's mean
+MIN_REM_EPOCHS = 2  # shortest run of REM epochs reported as a REM window
+BASELINE_EPOCHS = 10  # sleep epochs scored NREM2 while the night's statistics settle
+
+
+class BiometricSessionError(Exception):
+    """Base error for upload sessions"""
+
+
+class SessionNotFoundError(BiometricSessionError):
+    pass
+
+
+class OffsetMismatchError(BiometricSessionError):
+    """Chunk does not start at (or overlap) the end of the received bytes"""
+
+    def __init__(self, bytes_received: int):
+        super().__init__(f"Upload offset must be <= {bytes_received}")
+        self.bytes_received = bytes_received
+
+
+class SleepSegmenter:
+    """
+    Causal epoch classifier: each epoch is scored against running statistics
+    of the epochs before it (heart rate mean/SD, mean RR variability), so
+    phases can be assigned as the night streams in, without a second pass.
+    """
+
+    def __init__(self, state: Optional[Dict] = None):
+        state = state or {}
+        self.epochs = state.get("epochs", 0)
+        self.hr_mean = state.get("hr_mean", 0.0)
+        self.hr_m2 = state.get("hr_m2", 0.0)
+        self.rr_sd_mean = state.get("rr_sd_mean", 0.0)
+
+    def state(self) -> Dict:
+        return {"epochs": self.epochs, "hr_mean": self.hr_mean, "hr_m2": self.hr_m2, "rr_sd_mean": self.rr_sd_mean}
+
+    def classify(self, rr_ms: np.ndarray, motion: np.ndarray) -> SleepPhase:
+        """Phase of one epoch from its samples (no samples = sensor off, scored as wake)"""
+        if rr_ms.size < 2 or float(motion.mean()) > WAKE_MOTION:
+            return SleepPhase.WAKE
+        heart_rate = 60000.0 / float(rr_ms.mean())
+        rr_sd = float(rr_ms.std())
+        mean_motion = float(motion.mean())
+
+        phase = SleepPhase.NREM2
+        if self.epochs >= BASELINE_EPOCHS:
+            hr_sd = (self.hr_m2 / (self.epochs - 1)) ** 0.5 or 1.0
+            z = (heart_rate - self.hr_mean) / hr_sd
+            if mean_motion > STILL_MOTION:
+                phase = SleepPhase.NREM1
+            elif z >= REM_HR_Z and rr_sd > REM_VARIABILITY_RATIO * self.rr_sd_mean:
+                phase = SleepPhase.REM
+            elif z <= DEEP_HR_Z:
+                phase = SleepPhase.NREM3
+
+        self.epochs += 1
+        delta = heart_rate - self.hr_mean
+        self.hr_mean += delta / self.epochs
+        self.hr_m2 += delta * (heart_rate - self.hr_mean)
+        self.rr_sd_mean += (rr_sd - self.rr_sd_mean) / self.epochs
+        return phase
+
+
+class BiometricSessionStore:
+    """Per-session files under one directory; one lock per session serializes its writers"""
+
+    def __init__(self, root: str = SESSION_DIR):
+        self.root = root
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    @staticmethod
+    def _canonical_id(session_id: str) -> str:
+        """Canonical UUID string (one lock and one directory per session, however spelled)"""
+        try:
+            return str(uuid.UUID(session_id))  # also rejects path tricks
+        except ValueError:
+            raise SessionNotFoundError(f"Biometric session {session_id} not found")
+
+    def _lock(self, session_id: str) -> threading.Lock:
+        session_id = self._canonical_id(session_id)
+        with self._locks_guard:
+            return self._locks.setdefault(session_id, threading.Lock())
+
+    def _path(self, session_id: str, name: str) -> str:
+        return os.path.join(self.root, session_id, name)
+
+    def _read_manifest(self, session_id: str) -> Dict:
+        session_id = self._canonical_id(session_id)
+        try:
+            with open(self._path(session_id, "session.json")) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            raise SessionNotFoundError(f"Biometric session {session_id} not found")
+
+    def _write_manifest(self, manifest: Dict) -> None:
+        path = self._path(manifest["session_id"], "session.json")
+        with open(path + ".tmp", "w") as f:
+            json.dump(manifest, f)
+        os.replace(path + ".tmp", path)
+
+    def create(self, user_id: str, started_at: datetime) -> Dict:
+        """New empty session; started_at is the wall-clock time of t_ms = 0"""
+        session_id = str(uuid.uuid4())
+        os.makedirs(os.path.join(self.root, session_id))
+        with open(self._path(session_id, "samples.bin"), "wb") as f:
+            f.truncate(INITIAL_CAPACITY_BYTES)
+        open(self._path(session_id, "epochs.bin"), "wb").close()
+        manifest = {
+            "session_id": session_id,
+            "user_id": str(user_id),
+            "started_at": started_at.isoformat(),
+            "bytes_received": 0,
+            "capacity_bytes": INITIAL_CAPACITY_BYTES,
+            "samples_processed": 0,
+            "epochs_classified": 0,
+            "completed": False,
+            "segmenter": SleepSegmenter().state(),
+        }
+        self._write_manifest(manifest)
+        return manifest
+
+    def get(self, session_id: str) -> Dict:
+        return self._read_manifest(session_id)
+
+    def append(self, session_id: str, offset: int, data: bytes) -> Dict:
+        """
+        Write a chunk at `offset` and classify the epochs it completes.
+
+        Raises:
+            SessionNotFoundError: unknown session
+            OffsetMismatchError: offset beyond the received bytes (client must resume from there)
+            BiometricSessionError: session already completed
+        """
+        with self._lock(session_id):
+            manifest = self._read_manifest(session_id)
+            if manifest["completed"]:
+                raise BiometricSessionError(f"Biometric session {session_id} is already completed")
+            received = manifest["bytes_received"]
+            if offset > received or offset < 0:
+                raise OffsetMismatchError(received)
+            data = data[received - offset:]  # skip a retransmitted overlap
+            if not data:
+                return manifest
+
+            end = received + len(data)
+            path = self._path(manifest["session_id"], "samples.bin")
+            if end > manifest["capacity_bytes"]:
+                capacity = manifest["capacity_bytes"]
+                while capacity < end:
+                    capacity *= 2
+                os.truncate(path, capacity)
+                manifest["capacity_bytes"] = capacity
+            buffer = np.memmap(path, dtype=np.uint8, mode="r+", shape=(manifest["capacity_bytes"],))
+            buffer[received:end] = np.frombuffer(data, dtype=np.uint8)
+            buffer.flush()
+            del buffer
+            manifest["bytes_received"] = end
+
+            self._segment(manifest, final=False)
+            self._write_manifest(manifest)
+            return manifest
+
+    def complete(self, session_id: str) -> Dict:
+        """Close the upload: the trailing partial epoch is classified too"""
+        with self._lock(session_id):
+            manifest = self._read_manifest(session_id)
+            if not manifest["completed"]:
+                self._segment(manifest, final=True)
+                manifest["completed"] = True
+                self._write_manifest(manifest)
+            return manifest
+
+    def _samples(self, manifest: Dict) -> np.ndarray:
+        """Memory-mapped view of every complete sample record received so far"""
+        count = manifest["bytes_received"] // SAMPLE_BYTES
+        if count == 0:
+            return np.empty(0, dtype=SAMPLE_DTYPE)
+        return np.memmap(self._path(manifest["session_id"], "samples.bin"), dtype=SAMPLE_DTYPE, mode="r", shape=(count,))
+
+    def _segment(self, manifest: Dict, final: bool) -> None:
+        """Classify the epochs completed since the last call (reads only the new samples)"""
+        samples = self._samples(manifest)
+        start = manifest["samples_processed"]
+        if samples.size == 0 or (start >= samples.size and not final):
+            return
+        new = np.array(samples[start:])  # the unprocessed tail: at most one chunk plus one epoch
+        del samples
+        times = new["t_ms"].astype(np.int64)
+        epoch_ms = EPOCH_SECONDS * 1000
+
+        segmenter = SleepSegmenter(manifest["segmenter"])
+        epoch = manifest["epochs_classified"]
+        last_time = int(times[-1]) if times.size else epoch * epoch_ms
+        # An epoch is complete once a sample at or past its end has arrived
+        complete_until = last_time // epoch_ms + (1 if final and times.size else 0)
+        codes = bytearray()
+        consumed = 0
+        while epoch < complete_until:
+            stop = int(np.searchsorted(times, (epoch + 1) * epoch_ms))
+            codes.append(_CODE[segmenter.classify(new["rr_ms"][consumed:stop].astype(np.float64), new["motion"][consumed:stop])])
+            consumed = stop
+            epoch += 1
+
+        if codes:
+            with open(self._path(manifest["session_id"], "epochs.bin"), "r+b") as f:
+                # epochs_classified is the committed length (one byte per epoch): drop codes
+                # a crash left behind after the previous append, before the manifest write
+                f.truncate(manifest["epochs_classified"])
+                f.seek(manifest["epochs_classified"])
+                f.write(bytes(codes))
+        manifest["samples_processed"] = start + consumed
+        manifest["epochs_classified"] = epoch
+        manifest["segmenter"] = segmenter.state()
+
+    def _epoch_codes(self, manifest: Dict) -> bytes:
+        with open(self._path(manifest["session_id"], "epochs.bin"), "rb") as f:
+            return f.read(manifest["epochs_classified"])
+
+    def hypnogram(self, session_id: str) -> List[SleepPhase]:
+        manifest = self._read_manifest(session_id)
+        return [PHASE_CODES[code] for code in self._epoch_codes(manifest)]
+
+    def sleep_summary(self, session_id: str) -> Dict:
+        """
+        Hypnogram totals, REM windows and the derived timestamp_experience:
+        the end of the last REM window, i.e. the dream most likely recalled on waking.
+        """
+        manifest = self._read_manifest(session_id)
+        codes = np.frombuffer(self._epoch_codes(manifest), dtype=np.uint8)
+        started_at = datetime.fromisoformat(manifest["started_at"])
+
+        rem = np.concatenate(([0], (codes == _CODE[SleepPhase.REM]).astype(np.int8), [0]))
+        edges = np.flatnonzero(np.diff(rem))
+        windows = []
+        for first, stop in zip(edges[::2], edges[1::2]):
+            if stop - first >= MIN_REM_EPOCHS:
+                windows.append({
+                    "start": started_at + timedelta(seconds=int(first) * EPOCH_SECONDS),
+                    "end": started_at + timedelta(seconds=int(stop) * EPOCH_SECONDS),
+                    "epochs": int(stop - first),
+                    "rmssd_ms": self._rmssd(manifest, int(first), int(stop)),
+                })
+
+        counts = np.bincount(codes, minlength=len(PHASE_CODES))
+        return {
+            "session_id": manifest["session_id"],
+            "completed": manifest["completed"],
+            "epochs": int(codes.size),
+            "minutes_by_phase": {phase.value: float(counts[code]) * EPOCH_SECONDS / 60.0 for code, phase in enumerate(PHASE_CODES)},
+            "rem_windows": windows,
+            "timestamp_experience": windows[-1]["end"] if windows else None,
+        }
+
+    def _rmssd(self, manifest: Dict, first_epoch: int, stop_epoch: int) -> Optional[float]:
+        """RMSSD over one epoch range (reads only that slice of the samples)"""
+        samples = self._samples(manifest)
+        if samples.size == 0:
+            return None
+        times = samples["t_ms"]
+        lo, hi = np.searchsorted(times, [first_epoch * EPOCH_SECONDS * 1000, stop_epoch * EPOCH_SECONDS * 1000])
+        rr = np.asarray(samples["rr_ms"][lo:hi], dtype=np.float64)
+        if rr.size < 2:
+            return None
+        return round(float(np.sqrt(np.mean(np.diff(rr) ** 2))), 2)
+
+
+_store: Optional[BiometricSessionStore] = None
+
+
+def get_session_store() -> BiometricSessionStore:
+    global _store
+    if _store is None:
+        _store = BiometricSessionStore()
+    return _store
@@ -0,0 +1,216 @@
+# apps/backend/services/dimension_pipeline.py
+"""
+Dimension pipeline: the analyzer's dimensions as declared plugins.
+
+Each Dimension names the shared inputs it reads (natal Moon, transit sky,
+age, dream text, ...) and how long its result stays valid:
+
+  PER_REQUEST  recomputed for every analysis
+  PER_DAY      reused for the same birth data on the same UT day
+  PER_NATAL    reused for the same birth data
+
+The pipeline orders the inputs of the selected dimensions by their
+dependencies and resolves each once, on the calling thread: Swiss Ephemeris
+keeps process-global state, so ephemeris work is never spread over threads.
+A dimension is dispatched as soon as its last input is resolved, inline or
+(with workers > 0) on a thread pool, so it overlaps the remaining input work.
+Builders must read only their declared inputs.
+"""
+import os
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from threading import Lock
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+# ANALYSIS_DIMENSION_WORKERS=0 (default) builds dimensions inline on the request thread
+DEFAULT_WORKERS = int(os.getenv("ANALYSIS_DIMENSION_WORKERS", "0"))
+DEFAULT_CACHE_ENTRIES = int(os.getenv("ANALYSIS_DIMENSION_CACHE_SIZE", "4096"))
+
+
+class Cacheability(str, Enum):
+    """How long a dimension result stays valid"""
+    PER_REQUEST = "per_request"
+    PER_DAY = "per_day"
+    PER_NATAL = "per_natal"
+
+
+@dataclass(frozen=True)
+class Dimension:
+    """One analysis dimension: response field, builder method and declared inputs"""
+    name: str
+    builder: str  # method of the analyzer, called as builder(inputs)
+    inputs: Tuple[str, ...] = ()
+    cacheability: Cacheability = Cacheability.PER_REQUEST
+
+
+def input_order(names: Iterable[str], dependencies: Mapping[str, Sequence[str]]) -> List[str]:
+    """
+    The given inputs plus everything they depend on, dependencies first.
+
+    Raises:
+        ValueError: on a dependency cycle
+    """
+    order: List[str] = []
+    done = set()
+    visiting = set()
+
+    def visit(name: str) -> None:
+        if name in done:
+            return
+        if name in visiting:
+            raise ValueError(f"Dependency cycle through analysis input '{name}'")
+        visiting.add(name)
+        for dependency in dependencies.get(name, ()):
+            visit(dependency)
+        visiting.discard(name)
+        done.add(name)
+        order.append(name)
+
+    for name in names:
+        visit(name)
+    return order
+
+
+class DimensionCache:
+    """In-process LRU of per-day / per-natal dimension results"""
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[tuple, Any]" = OrderedDict()
+        self._lock = Lock()
+        self._counters: Counter = Counter()
+
+    def get(self, key: tuple) -> Tuple[bool, Any]:
+        """(hit, value); values may legitimately be None"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._counters["hits"] += 1
+                return True, self._entries[key]
+            self._counters["misses"] += 1
+            return False, None
+
+    def put(self, key: tuple, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), **self._counters}
+
+
+class DimensionPipeline:
+    """Resolves inputs and builds the selected dimensions, with timings"""
+
+    def __init__(
+        self,
+        dimensions: Mapping[str, Dimension],
+        input_dependencies: Mapping[str, Sequence[str]],
+        workers: int = DEFAULT_WORKERS,
+        cache: Optional[DimensionCache] = None
+    ):
+        self.dimensions = dimensions
+        self.input_dependencies = input_dependencies
+        self.workers = workers
+        self.cache = cache if cache is not None else DimensionCache()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = Lock()
+        # Fail at startup, not on the first request, if the declarations are cyclic
+        input_order((i for d in dimensions.values() for i in d.inputs), input_dependencies)
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="aetheria-dimension")
+            return self._executor
+
+    def run(
+        self,
+        owner: Any,
+        inputs: Any,
+        selected: Sequence[str],
+        cache_key: Callable[[Cacheability], Optional[tuple]]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Build the selected dimensions.
+
+        Args:
+            owner: object whose methods are the dimension builders
+            inputs: object exposing the inputs as (lazily computed) attributes
+            selected: dimension names
+            cache_key: scope key for a cacheability (None = do not cache)
+
+        Returns: (values by dimension name, pipeline metadata with timings in ms)
+        """
+        started = time.perf_counter()
+        values: Dict[str, Any] = {}
+        report: Dict[str, Dict[str, Any]] = {}
+
+        pending: List[Tuple[Dimension, Optional[tuple]]] = []
+        for name in selected:
+            dimension = self.dimensions[name]
+            key = cache_key(dimension.cacheability)
+            if key is not None:
+                key = (name,) + key
+                hit, value = self.cache.get(key)
+                if hit:
+                    values[name] = value
+                    report[name] = {"ms": 0.0, "cache": "hit"}
+                    continue
+            pending.append((dimension, key))
+
+        order = input_order((i for dimension, _ in pending for i in dimension.inputs), self.input_dependencies)
+        position = {name: index for index, name in enumerate(order)}
+        ready_after: Dict[int, List[Tuple[Dimension, Optional[tuple]]]] = {}
+        for dimension, key in pending:
+            last = max((position[i] for i in dimension.inputs), default=-1)
+            ready_after.setdefault(last, []).append((dimension, key))
+
+        pool = self._pool() if self.workers > 0 and len(pending) > 1 else None
+        builds: List[Tuple[Dimension, Optional[tuple], Any]] = []
+
+        def dispatch(index: int) -> None:
+            for dimension, key in ready_after.get(index, ()):
+                if pool is not None:
+                    builds.append((dimension, key, pool.submit(_build, owner, dimension, inputs)))
+                else:
+                    builds.append((dimension, key, _build(owner, dimension, inputs)))
+
+        input_ms: Dict[str, float] = {}
+        dispatch(-1)
+        for index, name in enumerate(order):
+            input_started = time.perf_counter()
+            getattr(inputs, name)
+            input_ms[name] = round((time.perf_counter() - input_started) * 1000.0, 3)
+            dispatch(index)
+
+        for dimension, key, build in builds:
+            value, elapsed_ms = build.result() if isinstance(build, Future) else build
+            values[dimension.name] = value
+            report[dimension.name] = {"ms": round(elapsed_ms, 3), "cache": "miss" if key is not None else "none"}
+            if key is not None:
+                self.cache.put(key, value)
+
+        metadata = {
+            "workers": self.workers if pool is not None else 0,
+            "total_ms": round((time.perf_counter() - started) * 1000.0, 3),
+            "inputs": input_ms,
+            "dimensions": {name: report[name] for name in selected},
+        }
+        return values, metadata
+
+
+def _build(owner: Any, dimension: Dimension, inputs: Any) -> Tuple[Any, float]:
+    started = time.perf_counter()
+    value = getattr(owner, dimension.builder)(inputs)
+    return value, (time.perf_counter() - started) * 1000.0
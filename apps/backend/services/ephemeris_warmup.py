@@ -0,0 +1,41 @@
+# apps/backend/services/ephemeris_warmup.py
+"""
+Startup warm-up for the Swiss Ephemeris.
+
+Ephemeris files under SWEPHE_PATH are opened lazily by the first calculation
+that needs them. Running one full snapshot, one house computation and one
+ayanamsa lookup at startup moves that cost out of the first user requests.
+"""
+from datetime import datetime
+from time import perf_counter
+from typing import Dict, Optional
+
+import swisseph as swe
+
+from time_keeper import EPHEMERIS_PATH, ZodiacMode, calculate_julian_day, get_ayanamsa, calc_body
+from sky_snapshot import compute_sky_snapshot
+from house_service import compute_houses
+
+
+def warm_up_ephemeris(jd: Optional[float] = None) -> Dict:
+    """
+    Open the ephemeris files and exercise every calculation path once.
+
+    Returns: {ephemeris_path, ephemeris_source, julian_day, duration_ms}
+    """
+    started = perf_counter()
+    jd = calculate_julian_day(datetime.utcnow()) if jd is None else jd
+
+    compute_sky_snapshot(jd)
+    compute_houses(jd, 0.0, 0.0)
+    for mode in ZodiacMode:
+        get_ayanamsa(jd, mode)
+
+    # The returned flags show whether data files were found or the built-in Moshier model was used
+    _, flags = calc_body(jd, swe.MOON)
+    return {
+        "ephemeris_path": EPHEMERIS_PATH,
+        "ephemeris_source": "swiss_ephemeris_files" if flags & swe.FLG_SWIEPH else "moshier",
+        "julian_day": jd,
+        "duration_ms": round((perf_counter() - started) * 1000.0, 2)
+    }
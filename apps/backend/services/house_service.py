@@ -0,0 +1,140 @@
+# apps/backend/services/house_service.py
+"""
+House cusp computation with natal caching and explicit failures.
+
+swe.houses raises for some inputs (e.g. Placidus above the polar circles).
+Failures are counted and raised as HouseComputationError rather than being
+replaced by a 0.0 Ascendant that silently corrupts the Arabic Lots.
+"""
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+import swisseph as swe
+
+PLACIDUS = b'P'
+
+_counters: Counter = Counter()
+_counters_lock = Lock()
+
+
+class HouseComputationError(Exception):
+    """Raised when Swiss Ephemeris cannot compute houses for the given time/place"""
+
+
+@dataclass(frozen=True)
+class HouseCusps:
+    """All twelve cusps plus the angles from swe.houses (degrees, 0-360)"""
+    julian_day: float
+    latitude: float
+    longitude: float
+    house_system: bytes
+    cusps: Tuple[float, ...]  # cusps[0] = 1st house (Ascendant) ... cusps[11] = 12th
+    ascendant: float
+    midheaven: float
+    armc: float
+    vertex: float
+
+    def shifted(self, ayanamsa: float) -> "HouseCusps":
+        """Cusps and angles moved by -ayanamsa (sidereal zodiac); ARMC is not a zodiacal longitude"""
+        if ayanamsa == 0.0:
+            return self
+        return replace(
+            self,
+            cusps=tuple((cusp - ayanamsa) % 360.0 for cusp in self.cusps),
+            ascendant=(self.ascendant - ayanamsa) % 360.0,
+            midheaven=(self.midheaven - ayanamsa) % 360.0,
+            vertex=(self.vertex - ayanamsa) % 360.0
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "house_system": self.house_system.decode(),
+            "cusps": list(self.cusps),
+            "ascendant": self.ascendant,
+            "midheaven": self.midheaven,
+            "armc": self.armc,
+            "vertex": self.vertex
+        }
+
+
+def _count(key: str, amount: int = 1) -> None:
+    with _counters_lock:
+        _counters[key] += amount
+
+
+def compute_houses(jd: float, lat: float, lon: float, house_system: bytes = PLACIDUS) -> HouseCusps:
+    """Compute all house cusps; raises HouseComputationError on failure"""
+    try:
+        cusps, ascmc = swe.houses(jd, lat, lon, house_system)
+    except Exception as e:
+        _count("failed")
+        raise HouseComputationError(
+            f"House computation failed (system={house_system.decode()}, lat={lat}, lon={lon}, jd={jd}): {e}"
+        ) from e
+
+    _count("computed")
+    return HouseCusps(
+        julian_day=jd,
+        latitude=lat,
+        longitude=lon,
+        house_system=house_system,
+        cusps=tuple(cusps[:12]),
+        ascendant=ascmc[0],
+        midheaven=ascmc[1],
+        armc=ascmc[2],
+        vertex=ascmc[3]
+    )
+
+
+@lru_cache(maxsize=4096)
+def _natal_houses(jd: float, lat: float, lon: float, house_system: bytes) -> HouseCusps:
+    _count("natal_cache_misses")
+    return compute_houses(jd, lat, lon, house_system)
+
+
+def get_natal_houses(jd: float, lat: float, lon: float, house_system: bytes = PLACIDUS) -> HouseCusps:
+    """Natal houses, cached per chart (failures are not cached)"""
+    _count("natal_lookups")
+    return _natal_houses(jd, lat, lon, house_system)
+
+
+class HouseLookup:
+    """
+    House placement for one chart.
+    Cusps are unwrapped into increasing offsets from the 1st cusp, so placing
+    a longitude is a bisect over 12 values.
+    """
+
+    def __init__(self, cusps: Sequence[float]):
+        self.first_cusp = cusps[0]
+        self.offsets = [(cusp - self.first_cusp) % 360.0 for cusp in cusps]
+        self._offsets_array = np.array(self.offsets)
+
+    def house_of(self, longitude: float) -> int:
+        """House number (1-12) containing the longitude"""
+        return bisect_right(self.offsets, (longitude - self.first_cusp) % 360.0)
+
+    def houses_of(self, longitudes: np.ndarray) -> np.ndarray:
+        """Vectorized house_of"""
+        offsets = np.mod(np.asarray(longitudes, dtype=np.float64) - self.first_cusp, 360.0)
+        return np.searchsorted(self._offsets_array, offsets, side="right")
+
+
+@lru_cache(maxsize=4096)
+def get_natal_house_lookup(houses: HouseCusps) -> HouseLookup:
+    """
+    HouseLookup built once per natal chart. Only for charts that recur (natal);
+    per-request charts build a HouseLookup directly rather than evict these.
+    """
+    return HouseLookup(houses.cusps)
+
+
+def get_house_stats() -> Dict[str, int]:
+    """Counters: computed, failed, natal_lookups, natal_cache_misses"""
+    with _counters_lock:
+        return dict(_counters)
@@ -0,0 +1,163 @@
+# apps/backend/services/lunar_calendar.py
+"""
+Lunar calendar: exact Moon ingress times into padas, nakshatras and signs.
+
+Instead of sampling the Moon minute by minute, longitudes are sampled on a
+coarse grid, every boundary crossed between two samples is bracketed, and the
+crossing is refined with Brent's method. Every nakshatra (4 padas) and sign
+(9 padas) boundary is also a pada boundary, so one search covers all three.
+Sidereal modes search the Moon's longitude less the (per-day) ayanamsa, the
+same positions the analyzer reports for that mode.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from time_keeper import (
+    calculate_julian_day,
+    julian_day_to_datetime,
+    get_ayanamsa,
+    get_planet_position,
+    to_naive_utc,
+    ZodiacMode,
+    NAKSHATRA_LIST,
+    ZODIAC_SIGNS,
+    PADA_SPAN,
+)
+from root_finding import brent_root, signed_arc
+
+# Moon speed never exceeds ~15.4°/day, so half a day keeps each bracket well
+# under 180° and the unwrapped longitude strictly increasing between samples.
+SAMPLE_STEP_DAYS = 0.5
+
+# Root tolerance in days (~0.1 s)
+INGRESS_XTOL_DAYS = 1e-6
+
+INGRESS_KINDS = ("pada", "nakshatra", "sign")
+
+PADAS_PER_NAKSHATRA = 4
+PADAS_PER_SIGN = 9
+PADAS_PER_CIRCLE = 108
+
+
+@dataclass(frozen=True)
+class LunarIngress:
+    """Moon crossing one pada boundary (and possibly a nakshatra/sign boundary)"""
+    julian_day: float
+    pada_boundary: int  # 0-107, boundary at pada_boundary * PADA_SPAN degrees
+
+    @property
+    def kinds(self) -> Tuple[str, ...]:
+        kinds = ["pada"]
+        if self.pada_boundary % PADAS_PER_NAKSHATRA == 0:
+            kinds.append("nakshatra")
+        if self.pada_boundary % PADAS_PER_SIGN == 0:
+            kinds.append("sign")
+        return tuple(kinds)
+
+    def to_dict(self, kind: str) -> Dict:
+        nakshatra_index = self.pada_boundary // PADAS_PER_NAKSHATRA
+        return {
+            "kind": kind,
+            "julian_day": self.julian_day,
+            "datetime": julian_day_to_datetime(self.julian_day),
+            "longitude": self.pada_boundary * PADA_SPAN,
+            "nakshatra": NAKSHATRA_LIST[nakshatra_index],
+            "pada": self.pada_boundary % PADAS_PER_NAKSHATRA + 1,
+            "sign": ZODIAC_SIGNS[self.pada_boundary // PADAS_PER_SIGN]
+        }
+
+
+def _moon_longitude(jd: float, mode: ZodiacMode = ZodiacMode.TROPICAL) -> float:
+    return (get_planet_position(jd, swe.MOON) - get_ayanamsa(jd, mode)) % 360.0
+
+
+def find_moon_ingresses(
+    start_jd: float,
+    end_jd: float,
+    mode: ZodiacMode = ZodiacMode.TROPICAL
+) -> List[LunarIngress]:
+    """
+    All pada boundary crossings of the Moon in [start_jd, end_jd), in time order.
+    """
+    sample_count = max(int(np.ceil((end_jd - start_jd) / SAMPLE_STEP_DAYS)), 1) + 1
+    times = np.linspace(start_jd, end_jd, sample_count)
+    longitudes = np.array([_moon_longitude(jd, mode) for jd in times])
+
+    # The Moon never retrogrades, so the unwrapped longitude is monotonic and
+    # each boundary lies in exactly one sample interval.
+    unwrapped = np.unwrap(longitudes, period=360.0)
+    boundary_index = np.floor(unwrapped / PADA_SPAN).astype(np.int64)
+
+    ingresses = []
+    for i in np.nonzero(np.diff(boundary_index))[0]:
+        t0, t1 = times[i], times[i + 1]
+        for boundary in range(boundary_index[i] + 1, boundary_index[i + 1] + 1):
+            target = (boundary * PADA_SPAN) % 360.0
+
+            def offset(jd: float, target: float = target) -> float:
+                return signed_arc(_moon_longitude(jd, mode), target)
+
+            jd = brent_root(
+                offset, t0, t1,
+                fa=signed_arc(longitudes[i], target),
+                fb=signed_arc(longitudes[i + 1], target),
+                xtol=INGRESS_XTOL_DAYS
+            )
+            ingresses.append(LunarIngress(julian_day=float(jd), pada_boundary=int(boundary % PADAS_PER_CIRCLE)))
+
+    return [ingress for ingress in ingresses if start_jd <= ingress.julian_day < end_jd]
+
+
+def _month_start(year: int, month: int) -> datetime:
+    return datetime(year + (month - 1) // 12, (month - 1) % 12 + 1, 1)
+
+
+@lru_cache(maxsize=120)
+def month_ingresses(year: int, month: int, mode: ZodiacMode = ZodiacMode.TROPICAL) -> Tuple[LunarIngress, ...]:
+    """Moon ingresses for one calendar month (UT), cached per month window and zodiac"""
+    start_jd = calculate_julian_day(_month_start(year, month))
+    end_jd = calculate_julian_day(_month_start(year, month + 1))
+    return tuple(find_moon_ingresses(start_jd, end_jd, mode))
+
+
+def _months_between(start: datetime, end: datetime) -> Iterable[Tuple[int, int]]:
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        yield year, month
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def lunar_ingresses_between(
+    start: datetime,
+    end: datetime,
+    kinds: Optional[Iterable[str]] = None,
+    zodiac_mode: ZodiacMode = ZodiacMode.TROPICAL
+) -> List[Dict]:
+    """
+    All Moon ingresses between two datetimes (aware ones converted to UT, naive
+    ones taken as UT), assembled from cached month windows.
+
+    Args:
+        kinds: subset of INGRESS_KINDS to return (default: all)
+        zodiac_mode: zodiac the padas, nakshatras and signs are measured in (default: tropical)
+
+    Returns: list of {kind, julian_day, datetime, longitude, nakshatra, pada, sign}
+    """
+    wanted = set(kinds or INGRESS_KINDS)
+    mode = ZodiacMode(zodiac_mode)
+    # Month windows are UT months: 2026-02-01T01:00+03:00 is still January
+    start, end = to_naive_utc(start), to_naive_utc(end)
+    start_jd = calculate_julian_day(start)
+    end_jd = calculate_julian_day(end)
+
+    results = []
+    for year, month in _months_between(start, end):
+        for ingress in month_ingresses(year, month, mode):
+            if start_jd <= ingress.julian_day < end_jd:
+                results.extend(ingress.to_dict(kind) for kind in ingress.kinds if kind in wanted)
+    return results
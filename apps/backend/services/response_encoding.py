@@ -0,0 +1,82 @@
+# apps/backend/services/response_encoding.py
+"""
+Wire encodings for analysis responses.
+
+JSON is produced once per analysis by pydantic-core (model_dump_json), which
+serializes straight from the model without building an intermediate dict and
+is faster here than dict + orjson. That JSON string is what the result cache
+stores and what is served as-is.
+
+MessagePack (for the mobile client) is optional: with the msgpack package
+installed, requests sending `Accept: application/msgpack` get the same
+document packed, converted from the cached JSON (orjson.loads when
+available). Without msgpack those requests get JSON.
+"""
+import json
+from typing import Any, List, Optional, Tuple
+
+try:
+    import msgpack  # type: ignore
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+_MSGPACK_ALIASES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack")
+
+# ETag suffix per encoding: each representation needs its own strong validator
+ETAG_VARIANTS = {JSON_MEDIA_TYPE: "", MSGPACK_MEDIA_TYPE: "-msgpack"}
+
+
+def negotiate(accept: Optional[str]) -> str:
+    """
+    Media type to serve for an Accept header: MessagePack only when it is
+    explicitly listed with a higher (or equal) quality than JSON and msgpack
+    is installed; JSON otherwise.
+    """
+    if not accept or msgpack is None:
+        return JSON_MEDIA_TYPE
+
+    best_msgpack = best_json = -1.0
+    for entry in accept.split(","):
+        media_type, _, params = entry.strip().partition(";")
+        media_type = media_type.strip().lower()
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type in _MSGPACK_ALIASES:
+            best_msgpack = max(best_msgpack, quality)
+        elif media_type in (JSON_MEDIA_TYPE, "application/*", "*/*"):
+            best_json = max(best_json, quality)
+
+    return MSGPACK_MEDIA_TYPE if best_msgpack > 0 and best_msgpack >= best_json else JSON_MEDIA_TYPE
+
+
+def loads_json(payload: str) -> Any:
+    return orjson.loads(payload) if orjson is not None else json.loads(payload)
+
+
+def project(json_payload: str, keys: List[str]) -> str:
+    """Serialized document restricted to `keys`, in that order (sparse views of a cached analysis)"""
+    document = loads_json(json_payload)
+    subset = {key: document[key] for key in keys if key in document}
+    if orjson is not None:
+        return orjson.dumps(subset).decode("utf-8")
+    return json.dumps(subset, separators=(",", ":"), ensure_ascii=False)
+
+
+def encode(json_payload: str, media_type: str) -> Tuple[bytes, str]:
+    """Body bytes and media type for a serialized analysis in the negotiated encoding"""
+    if media_type == MSGPACK_MEDIA_TYPE and msgpack is not None:
+        return msgpack.packb(loads_json(json_payload), use_bin_type=True), MSGPACK_MEDIA_TYPE
+    return json_payload.encode("utf-8"), JSON_MEDIA_TYPE
@@ -0,0 +1,147 @@
+# apps/backend/services/result_cache.py
+"""
+Result cache for DecagonAnalysisObject, keyed by the deterministic analysis_id.
+
+Two tiers: an in-process LRU (serialized JSON, so hits skip model validation)
+and an optional Redis tier shared across workers. Redis is used only when
+ANALYSIS_CACHE_REDIS_URL (or REDIS_URL) is set and reachable; any Redis
+failure degrades to the LRU tier instead of failing the request.
+"""
+import os
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, Iterable, Optional
+
+import redis
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+KEY_PREFIX = "analysis:"
+
+
+def etag_for(analysis_id: str, variant: str = "") -> str:
+    """Strong ETag for an analysis (the id is already a content checksum); variant marks other encodings"""
+    return f'"{analysis_id}{variant}"'
+
+
+def etag_matches(if_none_match: Optional[str], analysis_id: str, variant: str = "") -> bool:
+    """True if an If-None-Match header value covers this analysis_id (in this encoding)"""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag.strip('"') == analysis_id + variant:
+            return True
+    return False
+
+
+class ResultCache:
+    """LRU + Redis cache of serialized analysis results"""
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        redis_url: Optional[str] = None,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = Lock()
+        self._counters: Counter = Counter()
+
+        self.redis_client = None
+        if redis_url:
+            try:
+                self.redis_client = redis.Redis.from_url(redis_url, decode_responses=True, socket_connect_timeout=1)
+                self.redis_client.ping()
+            except (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError):
+                # Offline mode: in-process tier only
+                self.redis_client = None
+
+    @property
+    def offline_mode(self) -> bool:
+        return self.redis_client is None
+
+    def get(self, analysis_id: str) -> Optional[str]:
+        """Serialized DecagonAnalysisObject JSON, or None"""
+        with self._lock:
+            payload = self._entries.get(analysis_id)
+            if payload is not None:
+                self._entries.move_to_end(analysis_id)
+                self._counters["memory_hits"] += 1
+                return payload
+
+        payload = self._redis_get(analysis_id)
+        if payload is not None:
+            self._count("redis_hits")
+            self._remember(analysis_id, payload)
+            return payload
+
+        self._count("misses")
+        return None
+
+    def put(self, analysis_id: str, payload: str) -> None:
+        self._remember(analysis_id, payload)
+        if self.redis_client is not None:
+            self._count("redis_round_trips")
+            try:
+                self.redis_client.set(KEY_PREFIX + analysis_id, payload, ex=self.ttl_seconds)
+            except redis.exceptions.RedisError:
+                self._count("redis_errors")
+
+    def invalidate(self, analysis_ids: Iterable[str]) -> None:
+        keys = list(analysis_ids)
+        with self._lock:
+            for analysis_id in keys:
+                self._entries.pop(analysis_id, None)
+        if self.redis_client is not None and keys:
+            self._count("redis_round_trips")
+            try:
+                self.redis_client.delete(*(KEY_PREFIX + analysis_id for analysis_id in keys))
+            except redis.exceptions.RedisError:
+                self._count("redis_errors")
+
+    def stats(self) -> Dict[str, int]:
+        """Counters: memory_hits, redis_hits, misses, evictions, redis_round_trips, redis_errors, entries"""
+        with self._lock:
+            stats = dict(self._counters)
+            stats["entries"] = len(self._entries)
+        return stats
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._counters[key] += 1
+
+    def _remember(self, analysis_id: str, payload: str) -> None:
+        with self._lock:
+            self._entries[analysis_id] = payload
+            self._entries.move_to_end(analysis_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def _redis_get(self, analysis_id: str) -> Optional[str]:
+        if self.redis_client is None:
+            return None
+        self._count("redis_round_trips")
+        try:
+            return self.redis_client.get(KEY_PREFIX + analysis_id)
+        except redis.exceptions.RedisError:
+            self._count("redis_errors")
+            return None
+
+
+@lru_cache(maxsize=1)
+def get_result_cache() -> ResultCache:
+    """Process-wide cache configured from the environment"""
+    return ResultCache(
+        max_entries=int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+        redis_url=os.getenv("ANALYSIS_CACHE_REDIS_URL") or os.getenv("REDIS_URL"),
+        ttl_seconds=int(os.getenv("ANALYSIS_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS))
+    )
@@ -0,0 +1,80 @@
+# apps/backend/services/root_finding.py
+"""
+Scalar root-finding helpers for ephemeris event searches.
+Callers bracket a sign change on a coarse time grid, then refine it here.
+"""
+from typing import Callable, Optional
+
+
+def signed_arc(longitude: float, target: float) -> float:
+    """Shortest signed angle from target to longitude, in [-180, 180)"""
+    return (longitude - target + 180.0) % 360.0 - 180.0
+
+
+def brent_root(
+    f: Callable[[float], float],
+    a: float,
+    b: float,
+    fa: Optional[float] = None,
+    fb: Optional[float] = None,
+    xtol: float = 1e-6,
+    maxiter: int = 60,
+) -> float:
+    """
+    Brent's method (inverse quadratic / secant steps with bisection fallback).
+
+    Requires f(a) and f(b) to bracket a root. Pass fa/fb when they are
+    already known from the coarse scan to save two evaluations.
+    """
+    fa = f(a) if fa is None else fa
+    fb = f(b) if fb is None else fb
+    if fa == 0.0:
+        return a
+    if fb == 0.0:
+        return b
+    if (fa > 0) == (fb > 0):
+        raise ValueError("brent_root: f(a) and f(b) must bracket a root")
+
+    c, fc = a, fa
+    d = e = b - a
+    for _ in range(maxiter):
+        if (fb > 0) == (fc > 0):
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol = 2e-16 * abs(b) + 0.5 * xtol
+        m = 0.5 * (c - b)
+        if abs(m) <= tol or fb == 0.0:
+            return b
+
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Secant step
+                p = 2.0 * m * s
+                q = 1.0 - s
+            else:
+                # Inverse quadratic interpolation
+                q = fa / fc
+                r = fb / fc
+                p = s * (2.0 * m * q * (q - r) - (b - a) * (r - 1.0))
+                q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+            if p > 0:
+                q = -q
+            else:
+                p = -p
+            if 2.0 * p < min(3.0 * m * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+
+        a, fa = b, fb
+        b += d if abs(d) > tol else (tol if m > 0 else -tol)
+        fb = f(b)
+
+    return b
@@ -0,0 +1,157 @@
+# apps/backend/services/sky_snapshot.py
+"""
+Full-sky ephemeris snapshot: every body computed once per Julian Day.
+
+The analyzer, the celestial engine and the nakshatra code all read positions
+from the same cached SkySnapshot, so one request never computes a body twice.
+"""
+import os
+import sys
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, List, Union
+
+import numpy as np
+import swisseph as swe
+
+# Add packages to path - use absolute path resolution
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+repo_root = os.path.dirname(os.path.dirname(backend_dir))
+sys.path.insert(0, os.path.join(repo_root, 'packages', 'shared-schema', 'src'))
+
+from schemas import Planet
+from time_keeper import ZodiacMode, get_ayanamsa, calc_body
+
+# Bodies read from Swiss Ephemeris, in array order. Ketu is derived from Rahu.
+EPHEMERIS_BODIES = [
+    (Planet.SUN, swe.SUN),
+    (Planet.MOON, swe.MOON),
+    (Planet.MERCURY, swe.MERCURY),
+    (Planet.VENUS, swe.VENUS),
+    (Planet.MARS, swe.MARS),
+    (Planet.JUPITER, swe.JUPITER),
+    (Planet.SATURN, swe.SATURN),
+    (Planet.URANUS, swe.URANUS),
+    (Planet.NEPTUNE, swe.NEPTUNE),
+    (Planet.PLUTO, swe.PLUTO),
+    (Planet.RAHU, swe.MEAN_NODE),
+]
+
+SNAPSHOT_BODIES: List[Planet] = [planet for planet, _ in EPHEMERIS_BODIES] + [Planet.KETU]
+
+# Keyed by enum value so Planet enums loaded through either schema import path resolve
+BODY_INDEX: Dict[str, int] = {planet.value: i for i, planet in enumerate(SNAPSHOT_BODIES)}
+
+_RAHU = BODY_INDEX[Planet.RAHU.value]
+_KETU = BODY_INDEX[Planet.KETU.value]
+
+_EPHEMERIS_CONSTANTS: Dict[str, int] = {planet.value: body for planet, body in EPHEMERIS_BODIES}
+
+
+class SkySnapshot:
+    """
+    Longitude, latitude, speed and retrograde flag for all bodies at one Julian Day.
+    Backed by read-only NumPy arrays indexed by BODY_INDEX.
+    Longitudes are tropical unless the snapshot was shifted by an ayanamsa.
+    """
+
+    __slots__ = ("julian_day", "longitudes", "latitudes", "speeds", "retrograde", "ayanamsa")
+
+    def __init__(
+        self,
+        julian_day: float,
+        longitudes: np.ndarray,
+        latitudes: np.ndarray,
+        speeds: np.ndarray,
+        ayanamsa: float = 0.0
+    ):
+        self.julian_day = julian_day
+        self.ayanamsa = ayanamsa
+        self.longitudes = longitudes
+        self.latitudes = latitudes
+        self.speeds = speeds
+        self.retrograde = speeds < 0
+        for array in (self.longitudes, self.latitudes, self.speeds, self.retrograde):
+            array.flags.writeable = False
+
+    @staticmethod
+    def index(planet: Union[Planet, str]) -> int:
+        return BODY_INDEX[planet.value if isinstance(planet, Enum) else planet]
+
+    def longitude(self, planet: Union[Planet, str]) -> float:
+        return float(self.longitudes[self.index(planet)])
+
+    def latitude(self, planet: Union[Planet, str]) -> float:
+        return float(self.latitudes[self.index(planet)])
+
+    def speed(self, planet: Union[Planet, str]) -> float:
+        return float(self.speeds[self.index(planet)])
+
+    def is_retrograde(self, planet: Union[Planet, str]) -> bool:
+        return bool(self.retrograde[self.index(planet)])
+
+    def position(self, planet: Union[Planet, str]) -> Dict:
+        i = self.index(planet)
+        return {
+            "planet": SNAPSHOT_BODIES[i].value,
+            "longitude": float(self.longitudes[i]),
+            "latitude": float(self.latitudes[i]),
+            "speed": float(self.speeds[i]),
+            "retrograde": bool(self.retrograde[i])
+        }
+
+    def shifted(self, ayanamsa: float) -> "SkySnapshot":
+        """Copy with every longitude moved by -ayanamsa (one vectorized offset, no ephemeris calls)"""
+        if ayanamsa == 0.0:
+            return self
+        return SkySnapshot(
+            self.julian_day,
+            np.mod(self.longitudes - ayanamsa, 360.0),
+            self.latitudes,
+            self.speeds,
+            ayanamsa=self.ayanamsa + ayanamsa
+        )
+
+    def to_dict(self) -> Dict:
+        return {
+            "julian_day": self.julian_day,
+            "ayanamsa": self.ayanamsa,
+            "bodies": [self.position(planet) for planet in SNAPSHOT_BODIES]
+        }
+
+
+@lru_cache(maxsize=2048)
+def compute_sky_snapshot(jd: float) -> SkySnapshot:
+    """All bodies at one Julian Day (UT) in a single ephemeris sweep, cached per JD"""
+    data = np.empty((len(SNAPSHOT_BODIES), 3))
+    for i, (_, body) in enumerate(EPHEMERIS_BODIES):
+        position, _ = calc_body(jd, body)
+        data[i] = (position[0], position[1], position[3])
+
+    # Ketu is the point opposite Rahu
+    data[_KETU] = ((data[_RAHU, 0] + 180.0) % 360.0, -data[_RAHU, 1], data[_RAHU, 2])
+
+    return SkySnapshot(jd, data[:, 0].copy(), data[:, 1].copy(), data[:, 2].copy())
+
+
+@lru_cache(maxsize=2048)
+def get_sky_snapshot(jd: float, mode: ZodiacMode = ZodiacMode.TROPICAL) -> SkySnapshot:
+    """Snapshot in the requested zodiac; sidereal modes reuse the cached tropical sweep"""
+    return compute_sky_snapshot(jd).shifted(get_ayanamsa(jd, mode))
+
+
+def get_body_longitude(jd: float, planet: Union[Planet, str], mode: ZodiacMode = ZodiacMode.TROPICAL) -> float:
+    """
+    One body's longitude in the requested zodiac with a single ephemeris call,
+    for callers that need one or two bodies rather than a full snapshot.
+    Same value as get_sky_snapshot(jd, mode).longitude(planet).
+    """
+    name = planet.value if isinstance(planet, Enum) else planet
+    if name == Planet.KETU.value:
+        position, _ = calc_body(jd, _EPHEMERIS_CONSTANTS[Planet.RAHU.value])
+        longitude = (position[0] + 180.0) % 360.0
+    else:
+        position, _ = calc_body(jd, _EPHEMERIS_CONSTANTS[name])
+        longitude = position[0]
+    ayanamsa = get_ayanamsa(jd, mode)
+    return float(np.mod(longitude - ayanamsa, 360.0)) if ayanamsa else float(longitude)
@@ -0,0 +1,306 @@
+# apps/backend/services/somatic.py
+"""
+Heart-rate variability from RR-interval streams (the somatic dimension).
+
+RR intervals arrive as packed little-endian arrays, not JSON floats:
+  u16  uint16 milliseconds (2 bytes per beat, the default)
+  f32  float32 milliseconds (4 bytes per beat, sub-millisecond sensors)
+
+HRVAccumulator consumes a recording chunk by chunk with bounded memory,
+whatever its length:
+  - RMSSD / SDNN / mean HR from running sums over artifact-free beats
+  - LF / HF power from a Hann-windowed FFT of each 5-minute window of the
+    4 Hz resampled tachogram, averaged over windows (only one window is held)
+  - the 100-point hrv_snapshot from mean-RR buckets that merge pairwise
+    whenever there are more than 2 * points of them
+summarize_rr() runs the same code on an in-memory array.
+"""
+import hashlib
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+RR_ENCODINGS = {"u16": np.dtype("<u2"), "f32": np.dtype("<f4")}
+
+# Physiological range for one beat; a beat differing from the previous one by more
+# than MAX_SUCCESSIVE_CHANGE is treated as ectopic / a missed detection
+MIN_RR_MS = 300.0
+MAX_RR_MS = 2000.0
+MAX_SUCCESSIVE_CHANGE = 0.2
+
+
+class NoValidBeatsError(ValueError):
+    """Every RR interval of a recording was rejected as an artifact: there is no HRV to report"""
+
+
+SNAPSHOT_POINTS = 100
+SNAPSHOT_DECIMALS = 4
+
+# Short-term spectral analysis (Task Force 1996): 5-minute windows, tachogram resampled at 4 Hz
+SPECTRAL_WINDOW_SECONDS = 300.0
+MIN_SPECTRAL_WINDOW_SECONDS = 120.0
+RESAMPLE_HZ = 4.0
+LF_BAND = (0.04, 0.15)
+HF_BAND = (0.15, 0.40)
+
+
+def decode_rr(data: bytes, encoding: str = "u16") -> np.ndarray:
+    """
+    Packed RR intervals -> float64 milliseconds.
+
+    Raises:
+        ValueError: unknown encoding, or a byte length that is not a whole number of samples
+    """
+    dtype = RR_ENCODINGS.get(encoding)
+    if dtype is None:
+        raise ValueError(f"Unknown RR encoding '{encoding}' (available: {', '.join(RR_ENCODINGS)})")
+    if len(data) % dtype.itemsize:
+        raise ValueError(f"RR payload of {len(data)} bytes is not a whole number of {encoding} samples")
+    return np.frombuffer(data, dtype=dtype).astype(np.float64)
+
+
+def encode_rr(rr_ms, encoding: str = "u16") -> bytes:
+    """float milliseconds -> packed RR intervals (u16 rounds to whole milliseconds)"""
+    values = np.asarray(rr_ms, dtype=np.float64)
+    if encoding == "u16":
+        values = np.clip(np.rint(values), 0, np.iinfo(np.uint16).max)
+    return values.astype(RR_ENCODINGS[encoding]).tobytes()
+
+
+def rr_digest(rr_ms) -> str:
+    """Content checksum of an RR series (part of the analysis id when RR data is supplied)"""
+    return hashlib.sha256(np.ascontiguousarray(rr_ms, dtype=np.float64).tobytes()).hexdigest()[:16]
+
+
+@dataclass
+class HRVSummary:
+    """Time- and frequency-domain HRV of one recording"""
+    beats: int
+    rejected: int
+    duration_s: float
+    heart_rate_avg: Optional[float]
+    rmssd_ms: Optional[float]
+    sdnn_ms: Optional[float]
+    lf_ms2: Optional[float]  # None when no window was long enough for spectral analysis
+    hf_ms2: Optional[float]
+    lf_hf: Optional[float]
+    series: List[float]  # mean RR (s) per bucket, SNAPSHOT_POINTS long (empty without beats)
+
+    def biometric_context(self) -> Dict[str, Any]:
+        return {
+            "source": "rr_intervals",
+            "beats": self.beats,
+            "rejected_beats": self.rejected,
+            "duration_s": round(self.duration_s, 1),
+            "heart_rate_avg": _rounded(self.heart_rate_avg, 1),
+            "rmssd_ms": _rounded(self.rmssd_ms, 2),
+            "sdnn_ms": _rounded(self.sdnn_ms, 2),
+            "lf_ms2": _rounded(self.lf_ms2, 2),
+            "hf_ms2": _rounded(self.hf_ms2, 2),
+            "lf_hf": _rounded(self.lf_hf, 3),
+        }
+
+
+def _rounded(value: Optional[float], decimals: int) -> Optional[float]:
+    return None if value is None else round(value, decimals)
+
+
+def band_powers(times_s: np.ndarray, rr_ms: np.ndarray) -> Optional[tuple]:
+    """
+    (LF, HF) power in ms^2 of one tachogram window: linear interpolation to
+    RESAMPLE_HZ, linear detrend, Hann window, one-sided periodogram.
+    None if the window is too short or has too few beats.
+    """
+    if len(rr_ms) < 4 or times_s[-1] - times_s[0] < MIN_SPECTRAL_WINDOW_SECONDS:
+        return None
+    grid = np.arange(times_s[0], times_s[-1], 1.0 / RESAMPLE_HZ)
+    signal = np.interp(grid, times_s, rr_ms)
+    signal = signal - np.polyval(np.polyfit(grid - grid[0], signal, 1), grid - grid[0])
+    window = np.hanning(len(signal))
+    psd = np.abs(np.fft.rfft(signal * window)) ** 2 / (RESAMPLE_HZ * np.sum(window ** 2))
+    psd[1:] *= 2.0  # one-sided (the Nyquist bin lies outside both bands)
+    freqs = np.fft.rfftfreq(len(signal), 1.0 / RESAMPLE_HZ)
+    resolution = freqs[1]
+    lf = psd[(freqs >= LF_BAND[0]) & (freqs < LF_BAND[1])].sum() * resolution
+    hf = psd[(freqs >= HF_BAND[0]) & (freqs < HF_BAND[1])].sum() * resolution
+    return float(lf), float(hf)
+
+
+class HRVAccumulator:
+    """Streaming HRV over an arbitrarily long RR recording, in bounded memory"""
+
+    def __init__(self, points: int = SNAPSHOT_POINTS, window_seconds: float = SPECTRAL_WINDOW_SECONDS):
+        self.points = points
+        self.window_seconds = window_seconds
+        self._pending = b""  # trailing bytes of a sample split across chunks
+        self._previous: Optional[float] = None  # last beat seen (accepted or not)
+        self._previous_ok = False
+        self._elapsed_s = 0.0
+        # Accepted beats: count, mean, sum of squared deviations (Chan et al. merge)
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._rejected = 0
+        # Successive differences between adjacent accepted beats
+        self._diff_count = 0
+        self._diff_sq_sum = 0.0
+        # Current spectral window and per-window band powers
+        self._window_times: List[np.ndarray] = []
+        self._window_rr: List[np.ndarray] = []
+        self._window_start: Optional[float] = None
+        self._lf_sum = 0.0
+        self._hf_sum = 0.0
+        self._windows = 0
+        # Snapshot buckets of `_span` accepted beats each, plus the filling bucket
+        self._span = 1
+        self._bucket_sums = np.empty(0)
+        self._partial_sum = 0.0
+        self._partial_count = 0
+
+    def add_bytes(self, data: bytes, encoding: str = "u16") -> None:
+        """Feed a raw chunk; a sample split across chunk boundaries is carried over"""
+        itemsize = RR_ENCODINGS[encoding].itemsize if encoding in RR_ENCODINGS else 1
+        data = self._pending + data
+        usable = len(data) - len(data) % itemsize
+        self._pending = data[usable:]
+        self.add(decode_rr(data[:usable], encoding))
+
+    @property
+    def has_pending_bytes(self) -> bool:
+        """True if the bytes fed so far end in the middle of a sample"""
+        return bool(self._pending)
+
+    def add(self, rr_ms: np.ndarray) -> None:
+        """Feed the next RR intervals (milliseconds) of the recording"""
+        rr = np.asarray(rr_ms, dtype=np.float64)
+        if rr.size == 0:
+            return
+
+        times = self._elapsed_s + np.cumsum(rr) / 1000.0
+        self._elapsed_s = float(times[-1])
+
+        previous = np.concatenate(([self._previous if self._previous is not None else np.nan], rr[:-1]))
+        in_range = (rr >= MIN_RR_MS) & (rr <= MAX_RR_MS)
+        with np.errstate(invalid="ignore"):
+            jump = np.abs(rr - previous) > MAX_SUCCESSIVE_CHANGE * previous
+        ok = in_range & ~jump
+        previous_ok = np.concatenate(([self._previous_ok], ok[:-1]))
+        self._previous = float(rr[-1])
+        self._previous_ok = bool(ok[-1])
+        self._rejected += int(rr.size - ok.sum())
+
+        good = rr[ok]
+        if good.size:
+            self._merge_moments(good)
+            self._add_to_window(times[ok], good)
+            self._add_to_buckets(good)
+
+        adjacent = ok & previous_ok
+        if adjacent.any():
+            diffs = (rr - previous)[adjacent]
+            self._diff_count += diffs.size
+            self._diff_sq_sum += float(np.dot(diffs, diffs))
+
+    def _merge_moments(self, values: np.ndarray) -> None:
+        count = values.size
+        mean = float(values.mean())
+        m2 = float(np.sum((values - mean) ** 2))
+        total = self._count + count
+        delta = mean - self._mean
+        self._m2 += m2 + delta * delta * self._count * count / total
+        self._mean += delta * count / total
+        self._count = total
+
+    def _add_to_window(self, times: np.ndarray, rr: np.ndarray) -> None:
+        if self._window_start is None:
+            self._window_start = float(times[0])
+        while times.size:
+            end = self._window_start + self.window_seconds
+            inside = int(np.searchsorted(times, end))
+            self._window_times.append(times[:inside])
+            self._window_rr.append(rr[:inside])
+            if inside == times.size:
+                break
+            self._close_window()
+            times, rr = times[inside:], rr[inside:]
+            self._window_start = end
+
+    def _close_window(self) -> None:
+        if self._window_times:
+            powers = band_powers(np.concatenate(self._window_times), np.concatenate(self._window_rr))
+            if powers is not None:
+                self._lf_sum += powers[0]
+                self._hf_sum += powers[1]
+                self._windows += 1
+        self._window_times, self._window_rr = [], []
+
+    def _add_to_buckets(self, rr: np.ndarray) -> None:
+        # Complete the filling bucket, then cut the rest into buckets of `_span` beats
+        take = min(self._span - self._partial_count, rr.size)
+        self._partial_sum += float(rr[:take].sum())
+        self._partial_count += take
+        rest = rr[take:]
+        if self._partial_count < self._span:
+            return
+        full = rest.size // self._span
+        new_sums = rest[:full * self._span].reshape(full, self._span).sum(axis=1)
+        self._bucket_sums = np.concatenate((self._bucket_sums, [self._partial_sum], new_sums))
+        tail = rest[full * self._span:]
+        self._partial_sum, self._partial_count = float(tail.sum()), tail.size
+
+        while self._bucket_sums.size > 2 * self.points:
+            if self._bucket_sums.size % 2:
+                # An odd bucket out becomes the head of the (twice as wide) filling bucket
+                self._partial_sum += float(self._bucket_sums[-1])
+                self._partial_count += self._span
+                self._bucket_sums = self._bucket_sums[:-1]
+            self._bucket_sums = self._bucket_sums.reshape(-1, 2).sum(axis=1)
+            self._span *= 2
+
+    def _snapshot(self) -> List[float]:
+        sums = self._bucket_sums
+        counts = np.full(sums.size, float(self._span))
+        if self._partial_count:
+            sums = np.append(sums, self._partial_sum)
+            counts = np.append(counts, float(self._partial_count))
+        if sums.size == 0:
+            return []
+        if sums.size > self.points:
+            starts = np.linspace(0, sums.size, self.points + 1).astype(int)[:-1]
+            means = np.add.reduceat(sums, starts) / np.add.reduceat(counts, starts)
+        else:
+            means = sums / counts
+            if means.size < self.points:
+                # Short recordings are stretched to the fixed snapshot length
+                means = np.interp(np.linspace(0, means.size - 1, self.points), np.arange(means.size), means)
+        return np.round(means / 1000.0, SNAPSHOT_DECIMALS).tolist()
+
+    def summary(self) -> HRVSummary:
+        """HRV of everything fed so far (a partial last spectral window counts if long enough)"""
+        lf_sum, hf_sum, windows = self._lf_sum, self._hf_sum, self._windows
+        if self._window_times:
+            powers = band_powers(np.concatenate(self._window_times), np.concatenate(self._window_rr))
+            if powers is not None:
+                lf_sum, hf_sum, windows = lf_sum + powers[0], hf_sum + powers[1], windows + 1
+        lf = lf_sum / windows if windows else None
+        hf = hf_sum / windows if windows else None
+        return HRVSummary(
+            beats=self._count,
+            rejected=self._rejected,
+            duration_s=self._elapsed_s,
+            heart_rate_avg=60000.0 / self._mean if self._count else None,
+            rmssd_ms=float(np.sqrt(self._diff_sq_sum / self._diff_count)) if self._diff_count else None,
+            sdnn_ms=float(np.sqrt(self._m2 / (self._count - 1))) if self._count > 1 else None,
+            lf_ms2=lf,
+            hf_ms2=hf,
+            lf_hf=lf / hf if lf is not None and hf else None,
+            series=self._snapshot(),
+        )
+
+
+def summarize_rr(rr_ms) -> HRVSummary:
+    """HRV of an in-memory RR series (milliseconds)"""
+    accumulator = HRVAccumulator()
+    accumulator.add(rr_ms)
+    return accumulator.summary()
@@ -1,7 +1,13 @@
 # apps/backend/services/time_keeper.py
+import numpy as np
 import swisseph as swe
-from datetime import datetime
-from typing import Dict, List, Tuple
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from functools import lru_cache
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
 import sys
 import os
 
@@ -10,10 +16,12 @@ backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 repo_root = os.path.dirname(os.path.dirname(backend_dir))
 sys.path.insert(0, os.path.join(repo_root, 'packages', 'shared-schema', 'src'))
 
-from schemas import Planet
+from schemas import Planet, Nakshatra
+from house_service import compute_houses
 
-# Initialize ephemeris path
-swe.set_ephe_path(os.getenv("SWEPHE_PATH", "/usr/share/ephe"))
+# Initialize ephemeris path (set once per process: swe.set_ephe_path closes any open ephemeris files)
+EPHEMERIS_PATH = os.getenv("SWEPHE_PATH", "/usr/share/ephe")
+swe.set_ephe_path(EPHEMERIS_PATH)
 
 # ============================================================================
 # NAKSHATRA CALCULATION (27 Lunar Mansions)
@@ -89,6 +97,27 @@ NAKSHATRA_THEMES = {
 }
 
 
+ZODIAC_SIGNS = [
+    "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+    "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
+]
+
+NAKSHATRA_SPAN = 360.0 / 27.0
+PADA_SPAN = NAKSHATRA_SPAN / 4.0
+
+# Vimshottari rulership repeats every 9 nakshatras, starting from Ashwini
+VIMSHOTTARI_RULERS = [
+    Planet.KETU, Planet.VENUS, Planet.SUN, Planet.MOON, Planet.MARS,
+    Planet.RAHU, Planet.JUPITER, Planet.SATURN, Planet.MERCURY
+]
+
+# Lookup tables indexed by nakshatra index (0 = Ashwini ... 26 = Revati)
+NAKSHATRA_ENUM_TABLE = np.array([Nakshatra(name) for name in NAKSHATRA_LIST], dtype=object)
+NAKSHATRA_DEITY_TABLE = np.array([NAKSHATRA_DEITIES[name] for name in NAKSHATRA_LIST], dtype=object)
+NAKSHATRA_THEME_TABLE = np.array([NAKSHATRA_THEMES[name] for name in NAKSHATRA_LIST], dtype=object)
+NAKSHATRA_RULER_TABLE = np.array([VIMSHOTTARI_RULERS[i % 9] for i in range(27)], dtype=object)
+
+
 def calculate_nakshatra(moon_longitude: float) -> Tuple[str, int, str, str]:
     """
     Deterministic Nakshatra calculation from Moon's ecliptic longitude.
@@ -96,40 +125,140 @@ def calculate_nakshatra(moon_longitude: float) -> Tuple[str, int, str, str]:
     Returns: (nakshatra_name, pada [1-4], deity, theme)
     """
     # Each Nakshatra = 13.333333° (360° / 27)
-    nakshatra_span = 360.0 / 27.0
-    nakshatra_index = int(moon_longitude / nakshatra_span)
+    nakshatra_index = int(moon_longitude / NAKSHATRA_SPAN)
     nakshatra_index = min(nakshatra_index, 26)  # Cap at Revati
     
     nakshatra_name = NAKSHATRA_LIST[nakshatra_index]
     
     # Calculate pada (1-4)
-    offset_in_nakshatra = moon_longitude - (nakshatra_index * nakshatra_span)
-    pada = int(offset_in_nakshatra / (nakshatra_span / 4.0)) + 1
+    offset_in_nakshatra = moon_longitude - (nakshatra_index * NAKSHATRA_SPAN)
+    pada = int(offset_in_nakshatra / PADA_SPAN) + 1
     pada = min(pada, 4)
     
-    deity = NAKSHATRA_DEITIES.get(nakshatra_name, "Unknown")
-    theme = NAKSHATRA_THEMES.get(nakshatra_name, "Unknown")
+    deity = NAKSHATRA_DEITY_TABLE[nakshatra_index]
+    theme = NAKSHATRA_THEME_TABLE[nakshatra_index]
     
     return nakshatra_name, pada, deity, theme
 
 
+def calculate_nakshatra_array(moon_longitudes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized Nakshatra calculation for many Moon longitudes at once.
+    
+    Returns: (nakshatra_index [0-26], pada [1-4], ruling_planet) arrays.
+    Index into the NAKSHATRA_*_TABLE arrays for names, deities and themes.
+    """
+    longitudes = np.mod(np.asarray(moon_longitudes, dtype=np.float64), 360.0)
+    
+    nakshatra_index = np.minimum((longitudes // NAKSHATRA_SPAN).astype(np.intp), 26)
+    offset_in_nakshatra = longitudes - nakshatra_index * NAKSHATRA_SPAN
+    pada = np.minimum((offset_in_nakshatra // PADA_SPAN).astype(np.intp), 3) + 1
+    
+    return nakshatra_index, pada, NAKSHATRA_RULER_TABLE[nakshatra_index]
+
+
+_ephemeris_calls = 0
+_ephemeris_calls_lock = Lock()
+
+
+def calc_body(jd: float, planet_const: int, flags: int = swe.FLG_SWIEPH | swe.FLG_SPEED):
+    """swe.calc with call accounting (exported as a metric via get_ephemeris_call_count)"""
+    global _ephemeris_calls
+    with _ephemeris_calls_lock:
+        _ephemeris_calls += 1
+    return swe.calc(jd, planet_const, flags)
+
+
+def get_ephemeris_call_count() -> int:
+    """Total swe.calc calls made through calc_body in this process"""
+    return _ephemeris_calls
+
+
 def get_planet_position(jd: float, planet_const: int) -> float:
     """
     Get ecliptic longitude of a planet at Julian Day.
     Returns: longitude in degrees (0-360)
     """
-    result, _ = swe.calc(jd, planet_const)
+    result, _ = calc_body(jd, planet_const)
     return result[0]  # Longitude
 
 
+# JD of 1970-01-01T00:00 UT. Every engine converts through calculate_julian_day,
+# so the same instant always yields a bit-identical JD cache key.
+UNIX_EPOCH_JD = 2440587.5
+_UNIX_EPOCH = datetime(1970, 1, 1)
+_ONE_DAY = timedelta(days=1)
+
+
+def to_naive_utc(dt: datetime) -> datetime:
+    """Aware datetimes are converted to UT; naive datetimes are assumed to already be UT"""
+    if dt.tzinfo is not None and dt.utcoffset() is not None:
+        return dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+@lru_cache(maxsize=8192)
+def _julian_day_naive_utc(dt: datetime) -> float:
+    return (dt - _UNIX_EPOCH) / _ONE_DAY + UNIX_EPOCH_JD
+
+
 def calculate_julian_day(dt: datetime) -> float:
-    """Convert datetime to Julian Day (UT)"""
-    return swe.julday(
-        dt.year,
-        dt.month,
-        dt.day,
-        dt.hour + dt.minute / 60.0 + dt.second / 3600.0
-    )
+    """Convert datetime to Julian Day (UT), keeping microseconds; memoized per instant"""
+    return _julian_day_naive_utc(to_naive_utc(dt))
+
+
+def julian_day_to_datetime(jd: float) -> datetime:
+    """Convert Julian Day (UT) back to a naive UT datetime, rounded to the second"""
+    year, month, day, hours = swe.revjul(jd)
+    return datetime(year, month, day) + timedelta(seconds=round(hours * 3600.0))
+
+
+# ============================================================================
+# ZODIAC MODE (TROPICAL / SIDEREAL AYANAMSA)
+# ============================================================================
+
+class ZodiacMode(str, Enum):
+    """Zodiac in which longitudes are reported"""
+    TROPICAL = "tropical"
+    LAHIRI = "lahiri"
+    RAMAN = "raman"
+    KRISHNAMURTI = "krishnamurti"
+
+
+SIDEREAL_MODES = {
+    ZodiacMode.LAHIRI: swe.SIDM_LAHIRI,
+    ZodiacMode.RAMAN: swe.SIDM_RAMAN,
+    ZodiacMode.KRISHNAMURTI: swe.SIDM_KRISHNAMURTI,
+}
+
+# swe.set_sid_mode is process-global state, so setting the mode and reading
+# the ayanamsa must happen atomically
+_ayanamsa_lock = Lock()
+
+
+@lru_cache(maxsize=4096)
+def _ayanamsa_for_day(day: int, mode: ZodiacMode) -> float:
+    with _ayanamsa_lock:
+        swe.set_sid_mode(SIDEREAL_MODES[mode])
+        # True ayanamsa (with nutation), matching the true-of-date tropical positions from swe.calc
+        return swe.get_ayanamsa_ex_ut(day + 0.5, 0)[1]
+
+
+def get_ayanamsa(jd: float, mode: ZodiacMode = ZodiacMode.TROPICAL) -> float:
+    """
+    Ayanamsa (degrees) to subtract from tropical longitudes; 0.0 for tropical.
+    Precession moves it ~0.00014°/day, so one value per Julian day bucket
+    (evaluated at the bucket's midpoint) is cached and reused.
+    """
+    mode = ZodiacMode(mode)
+    if mode is ZodiacMode.TROPICAL:
+        return 0.0
+    return _ayanamsa_for_day(int(np.floor(jd)), mode)
+
+
+def to_zodiac(longitudes: np.ndarray, jd: float, mode: ZodiacMode = ZodiacMode.TROPICAL) -> np.ndarray:
+    """Shift tropical longitudes into the given zodiac (vectorized)"""
+    return np.mod(np.asarray(longitudes, dtype=np.float64) - get_ayanamsa(jd, mode), 360.0)
 
 
 # ============================================================================
@@ -180,6 +309,8 @@ FIRDARIA_SEQUENCE_DAY = [
     (Planet.SATURN, 11),
     (Planet.JUPITER, 12),
     (Planet.MARS, 7),
+    (Planet.RAHU, 3),
+    (Planet.KETU, 2),
 ]
 
 FIRDARIA_SEQUENCE_NIGHT = [
@@ -190,6 +321,22 @@ FIRDARIA_SEQUENCE_NIGHT = [
     (Planet.SUN, 10),
     (Planet.VENUS, 8),
     (Planet.MERCURY, 13),
+    (Planet.RAHU, 3),
+    (Planet.KETU, 2),
+]
+
+FIRDARIA_CYCLE_YEARS = 75.0
+
+# Sub-periods run in Chaldean order starting from the major lord.
+# The nodal periods are not subdivided.
+CHALDEAN_ORDER = [
+    Planet.SATURN,
+    Planet.JUPITER,
+    Planet.MARS,
+    Planet.SUN,
+    Planet.VENUS,
+    Planet.MERCURY,
+    Planet.MOON,
 ]
 
 
@@ -203,33 +350,144 @@ def calculate_firdaria(current_age: float, is_day_birth: bool) -> Dict:
     
     Returns: {planet, start_age, end_age, archetypal_task}
     """
-    sequence = FIRDARIA_SEQUENCE_DAY if is_day_birth else FIRDARIA_SEQUENCE_NIGHT
-    
-    # Firdaria cycle = 75 years
-    age_in_cycle = current_age % 75.0
-    
-    age_cursor = 0.0
-    for planet, duration in sequence:
-        if age_cursor <= age_in_cycle < age_cursor + duration:
-            return {
-                "ruling_planet": planet.value,
-                "start_age": age_cursor,
-                "end_age": age_cursor + duration,
-                "current_phase": True,
-                "archetypal_task": get_firdaria_theme(planet)
-            }
-        age_cursor += duration
+    major = _FIRDARIA_TABLES[is_day_birth].major_at(current_age % FIRDARIA_CYCLE_YEARS)
     
-    # Fallback (shouldn't happen with modulo)
     return {
-        "ruling_planet": Planet.SUN.value,
-        "start_age": 0.0,
-        "end_age": 10.0,
+        "ruling_planet": major.planet.value,
+        "start_age": major.start_age,
+        "end_age": major.end_age,
         "current_phase": True,
-        "archetypal_task": "Authority, identity consolidation"
+        "archetypal_task": get_firdaria_theme(major.planet)
     }
 
 
+@dataclass(frozen=True)
+class FirdariaPeriod:
+    """One major period or sub-period, in ages (years) within a single 75-year cycle"""
+    planet: Planet
+    start_age: float
+    end_age: float
+    sub_planet: Optional[Planet] = None  # Set on sub-periods only
+
+    def to_dict(self, birth_datetime: Optional[datetime] = None, cycle: int = 0) -> Dict:
+        offset = cycle * FIRDARIA_CYCLE_YEARS
+        data = {
+            "ruling_planet": self.planet.value,
+            "sub_planet": self.sub_planet.value if self.sub_planet else None,
+            "start_age": self.start_age + offset,
+            "end_age": self.end_age + offset,
+            "archetypal_task": get_firdaria_theme(self.planet)
+        }
+        if birth_datetime is not None:
+            data["start_date"] = age_to_datetime(birth_datetime, data["start_age"])
+            data["end_date"] = age_to_datetime(birth_datetime, data["end_age"])
+        return data
+
+
+class _FirdariaTable:
+    """
+    Sorted start ages for the major periods and sub-periods of one sequence.
+    Built once per sequence; lookups are a bisect over the start ages.
+    """
+
+    def __init__(self, sequence: List[Tuple[Planet, int]]):
+        self.majors: List[FirdariaPeriod] = []
+        self.subs: List[FirdariaPeriod] = []
+        
+        age_cursor = 0.0
+        for planet, duration in sequence:
+            self.majors.append(FirdariaPeriod(planet, age_cursor, age_cursor + duration))
+            
+            if planet in CHALDEAN_ORDER:
+                sub_length = duration / 7.0
+                first = CHALDEAN_ORDER.index(planet)
+                for i in range(7):
+                    sub_planet = CHALDEAN_ORDER[(first + i) % 7]
+                    sub_start = age_cursor + i * sub_length
+                    self.subs.append(FirdariaPeriod(planet, sub_start, sub_start + sub_length, sub_planet))
+            else:
+                # Nodal periods have a single undivided sub-period
+                self.subs.append(FirdariaPeriod(planet, age_cursor, age_cursor + duration, planet))
+            
+            age_cursor += duration
+        
+        self.major_starts = [p.start_age for p in self.majors]
+        self.sub_starts = [p.start_age for p in self.subs]
+
+    def major_at(self, age_in_cycle: float) -> FirdariaPeriod:
+        return self.majors[bisect_right(self.major_starts, age_in_cycle) - 1]
+
+    def sub_at(self, age_in_cycle: float) -> FirdariaPeriod:
+        return self.subs[bisect_right(self.sub_starts, age_in_cycle) - 1]
+
+
+_FIRDARIA_TABLES = {
+    True: _FirdariaTable(FIRDARIA_SEQUENCE_DAY),
+    False: _FirdariaTable(FIRDARIA_SEQUENCE_NIGHT),
+}
+
+
+def age_to_datetime(birth_datetime: datetime, age: float) -> datetime:
+    """Inverse of the analyzer's age convention (elapsed Julian days / 365.25)"""
+    return birth_datetime + timedelta(days=age * 365.25)
+
+
+class FirdariaTimeline:
+    """
+    Firdaria major periods and sub-periods for one natal chart.
+    
+    Point lookups (by age or date) bisect the shared per-sequence tables.
+    Ages past 75 wrap into the next cycle, matching calculate_firdaria.
+    """
+
+    def __init__(self, birth_datetime: datetime, is_day_birth: bool):
+        self.birth_datetime = birth_datetime
+        self.is_day_birth = is_day_birth
+        self._table = _FIRDARIA_TABLES[is_day_birth]
+
+    def age_at(self, dt: datetime) -> float:
+        return (calculate_julian_day(dt) - calculate_julian_day(self.birth_datetime)) / 365.25
+
+    def period_at_age(self, age: float) -> Dict:
+        """Major period and sub-period active at the given age"""
+        cycle, age_in_cycle = divmod(age, FIRDARIA_CYCLE_YEARS)
+        major = self._table.major_at(age_in_cycle)
+        sub = self._table.sub_at(age_in_cycle)
+        
+        result = major.to_dict(self.birth_datetime, int(cycle))
+        result["current_phase"] = True
+        result["sub_period"] = sub.to_dict(self.birth_datetime, int(cycle))
+        return result
+
+    def period_at(self, dt: datetime) -> Dict:
+        return self.period_at_age(self.age_at(dt))
+
+    def periods_between(self, start: datetime, end: datetime, include_sub_periods: bool = True) -> List[Dict]:
+        """All periods overlapping [start, end), in chronological order (for calendar views)"""
+        start_age = max(self.age_at(start), 0.0)
+        end_age = self.age_at(end)
+        periods = self._table.subs if include_sub_periods else self._table.majors
+        starts = self._table.sub_starts if include_sub_periods else self._table.major_starts
+        
+        results = []
+        cycle = int(start_age // FIRDARIA_CYCLE_YEARS)
+        while cycle * FIRDARIA_CYCLE_YEARS < end_age:
+            offset = cycle * FIRDARIA_CYCLE_YEARS
+            first = max(bisect_right(starts, start_age - offset) - 1, 0)
+            for period in periods[first:]:
+                if period.start_age + offset >= end_age:
+                    break
+                results.append(period.to_dict(self.birth_datetime, cycle))
+            cycle += 1
+        return results
+
+
+@lru_cache(maxsize=1024)
+def get_firdaria_timeline(birth_datetime: datetime, is_day_birth: bool) -> FirdariaTimeline:
+    """Cached FirdariaTimeline per natal chart"""
+    return FirdariaTimeline(birth_datetime, is_day_birth)
+
+
 def get_firdaria_theme(planet: Planet) -> str:
     """Archetypal themes for each Firdaria lord"""
     themes = {
@@ -239,15 +497,16 @@ def get_firdaria_theme(planet: Planet) -> str:
         Planet.VENUS: "Relationships, pleasure",
         Planet.MARS: "Conflict, assertion",
         Planet.JUPITER: "Expansion, fortune",
-        Planet.SATURN: "Restriction, crystallization"
+        Planet.SATURN: "Restriction, crystallization",
+        Planet.RAHU: "Hunger, unfamiliar territory",
+        Planet.KETU: "Release, detachment"
     }
     return themes.get(planet, "Unknown")
 
 
 def calculate_ascendant(jd: float, lat: float, lon: float) -> float:
-    """Calculate Ascendant (rising sign) using Placidus house system"""
-    try:
-        houses, ascmc = swe.houses(jd, lat, lon, b'P')
-        return ascmc[0]  # Ascendant
-    except:
-        return 0.0  # Fallback
+    """
+    Calculate Ascendant (rising sign) using Placidus house system.
+    Raises house_service.HouseComputationError if houses cannot be computed.
+    """
+    return compute_houses(jd, lat, lon).ascendant
@@ -0,0 +1,243 @@
+# Verified against Section 5.2.3 (Celestial Engine) and Section 2.2 (Deterministic Bridge)
+
+import os
+import sys
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from packages.shared_schema.src.schemas import Planet, AspectType, PsychologicalPressure
+from apps.backend.src.agents.celestial_engine import (
+    PLANET_CONSTANTS,
+    ASPECT_ANGLES,
+    NatalCoordinates,
+    get_psychological_pressure,
+)
+
+# Shared time/root-finding helpers live in backend services - use absolute path resolution
+backend_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(backend_dir, 'services'))
+
+from time_keeper import calculate_julian_day, julian_day_to_datetime, calc_body, to_naive_utc
+from root_finding import brent_root, signed_arc
+from sky_snapshot import compute_sky_snapshot
+
+# Coarse scan step per transiting body (days). Each step must keep the body's
+# motion well under 180° so a bracket never straddles the longitude wrap.
+SCAN_STEP_DAYS = {
+    Planet.MOON: 0.25,
+}
+DEFAULT_SCAN_STEP_DAYS = 1.0
+
+# Root tolerance in days (~1 s)
+EVENT_XTOL_DAYS = 1e-5
+
+MAX_WINDOW_DAYS = 366
+
+EVENT_ENTER_ORB = "enter_orb"
+EVENT_EXACT = "exact"
+EVENT_EXIT_ORB = "exit_orb"
+
+
+class AspectTimelineInput(BaseModel):
+    natal_coordinates: NatalCoordinates
+    window_start: datetime
+    window_end: datetime
+    orb_degrees: float = Field(3.0, gt=0.0, le=10.0, description="Orb used for enter/exit events")
+    transit_planets: Optional[List[Planet]] = Field(None, description="Defaults to all ten bodies")
+
+
+class AspectEvent(BaseModel):
+    event_type: str = Field(description="enter_orb, exact or exit_orb")
+    timestamp: datetime
+    julian_day: float
+    transit_planet: Planet
+    natal_planet: Planet
+    aspect_type: AspectType
+    transit_longitude: float
+    retrograde: bool = Field(description="Transiting body was retrograde at the event")
+    pass_number: Optional[int] = Field(None, description="1-based perfection count within the window (exact events)")
+    psychological_pressure: PsychologicalPressure
+
+
+class AspectTimeline(BaseModel):
+    window_start: datetime
+    window_end: datetime
+    orb_degrees: float
+    events: List[AspectEvent]
+
+
+def _sample_body(planet_const: int, times: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Longitudes/speeds on the scan grid, with station times spliced in so the
+    longitude is monotonic inside every interval (retrograde multi-pass handling).
+    """
+    samples = [calc_body(jd, planet_const)[0] for jd in times]
+    longitudes = np.array([s[0] for s in samples])
+    speeds = np.array([s[3] for s in samples])
+
+    stations = []
+    for i in np.nonzero(np.signbit(speeds[:-1]) != np.signbit(speeds[1:]))[0]:
+        station_jd = brent_root(
+            lambda jd: calc_body(jd, planet_const)[0][3],
+            times[i], times[i + 1],
+            fa=speeds[i], fb=speeds[i + 1],
+            xtol=EVENT_XTOL_DAYS
+        )
+        station = calc_body(station_jd, planet_const)[0]
+        stations.append((i + 1, station_jd, station[0], station[3]))
+
+    for offset, (index, jd, lon, speed) in enumerate(stations):
+        times = np.insert(times, index + offset, jd)
+        longitudes = np.insert(longitudes, index + offset, lon)
+        speeds = np.insert(speeds, index + offset, speed)
+
+    return times, longitudes, speeds
+
+
+def _aspect_levels(natal_longitudes: Dict[Planet, float], orb: float) -> Tuple[np.ndarray, List[Tuple]]:
+    """Every longitude at which an aspect perfects or crosses its orb boundary"""
+    levels = []
+    meta = []
+    for natal_planet, natal_lon in natal_longitudes.items():
+        for aspect, angle in ASPECT_ANGLES.items():
+            # Conjunction and opposition have one target point, the rest two
+            for target in sorted({(natal_lon + angle) % 360.0, (natal_lon - angle) % 360.0}):
+                for offset in (-orb, 0.0, orb):
+                    levels.append((target + offset) % 360.0)
+                    meta.append((natal_planet, aspect, target, offset))
+    return np.array(levels), meta
+
+
+def _body_events(
+    transit_planet: Planet,
+    start_jd: float,
+    end_jd: float,
+    levels: np.ndarray,
+    meta: List[Tuple],
+) -> List[AspectEvent]:
+    planet_const = PLANET_CONSTANTS[transit_planet]
+    step = SCAN_STEP_DAYS.get(transit_planet, DEFAULT_SCAN_STEP_DAYS)
+    sample_count = max(int(np.ceil((end_jd - start_jd) / step)), 1) + 1
+    times, longitudes, _ = _sample_body(planet_const, np.linspace(start_jd, end_jd, sample_count))
+
+    unwrapped = np.unwrap(longitudes, period=360.0)
+    lo = np.minimum(unwrapped[:-1], unwrapped[1:])[:, None]
+    # Nearest copy of each level at or above the interval's lower end
+    crossing_values = levels[None, :] + 360.0 * np.ceil((lo - levels[None, :]) / 360.0)
+    before = unwrapped[:-1, None] < crossing_values
+    after = unwrapped[1:, None] < crossing_values
+    intervals, level_indices = np.nonzero(before != after)
+
+    events = []
+    passes: Dict[Tuple, int] = {}
+    # np.nonzero yields intervals in time order, so passes are numbered chronologically
+    for i, j in zip(intervals, level_indices):
+        level = levels[j]
+        natal_planet, aspect, target, offset = meta[j]
+
+        jd = brent_root(
+            lambda t: signed_arc(calc_body(t, planet_const)[0][0], level),
+            times[i], times[i + 1],
+            fa=signed_arc(longitudes[i], level),
+            fb=signed_arc(longitudes[i + 1], level),
+            xtol=EVENT_XTOL_DAYS
+        )
+        if not start_jd <= jd < end_jd:
+            continue
+
+        position = calc_body(jd, planet_const)[0]
+        retrograde = position[3] < 0
+        if offset == 0.0:
+            event_type = EVENT_EXACT
+        elif (offset > 0) != retrograde:
+            # Moving away from the target through the outer orb boundary
+            event_type = EVENT_EXIT_ORB
+        else:
+            event_type = EVENT_ENTER_ORB
+
+        pass_number = None
+        if event_type == EVENT_EXACT:
+            # Number repeated perfections of the same target point (direct / retrograde / direct)
+            key = (natal_planet, aspect, target)
+            passes[key] = pass_number = passes.get(key, 0) + 1
+
+        events.append(AspectEvent(
+            event_type=event_type,
+            timestamp=julian_day_to_datetime(jd),
+            julian_day=float(jd),
+            transit_planet=transit_planet,
+            natal_planet=natal_planet,
+            aspect_type=aspect,
+            transit_longitude=round(position[0], 4),
+            retrograde=bool(retrograde),
+            pass_number=pass_number,
+            psychological_pressure=get_psychological_pressure(transit_planet, natal_planet, aspect),
+        ))
+
+    return events
+
+
+@lru_cache(maxsize=256)
+def _cached_aspect_events(
+    natal_jd: float,
+    start_jd: float,
+    end_jd: float,
+    orb: float,
+    transit_planets: Tuple[Planet, ...],
+) -> Tuple[AspectEvent, ...]:
+    natal_sky = compute_sky_snapshot(natal_jd)
+    natal_longitudes = {planet: natal_sky.longitude(planet) for planet in PLANET_CONSTANTS}
+    levels, meta = _aspect_levels(natal_longitudes, orb)
+
+    events = []
+    for transit_planet in transit_planets:
+        events.extend(_body_events(transit_planet, start_jd, end_jd, levels, meta))
+    events.sort(key=lambda e: e.julian_day)
+
+    return tuple(events)
+
+
+def calculate_aspect_timeline(input_data: AspectTimelineInput) -> AspectTimeline:
+    """
+    Transit-to-natal aspect events (orb entry, exact perfection, orb exit) over a window.
+
+    Planet longitudes are scanned at coarse steps; every aspect or orb boundary
+    crossed between two samples is refined with Brent's method. Stations are
+    located first so retrograde loops produce one event per pass.
+    Results are cached per natal chart, window and orb. Aware datetimes are
+    converted to UT, naive ones are taken as UT; the window is returned in UT.
+    """
+    # Mixed naive/aware bounds cannot be compared as given
+    window_start = to_naive_utc(input_data.window_start)
+    window_end = to_naive_utc(input_data.window_end)
+    if window_end <= window_start:
+        raise ValueError("window_end must be after window_start")
+    if (window_end - window_start).days > MAX_WINDOW_DAYS:
+        raise ValueError(f"Window exceeds {MAX_WINDOW_DAYS} days")
+
+    transit_planets = tuple(input_data.transit_planets or PLANET_CONSTANTS.keys())
+    events = _cached_aspect_events(
+        calculate_julian_day(to_naive_utc(input_data.natal_coordinates.birth_time_utc)),
+        calculate_julian_day(window_start),
+        calculate_julian_day(window_end),
+        input_data.orb_degrees,
+        transit_planets,
+    )
+
+    return AspectTimeline(
+        window_start=window_start,
+        window_end=window_end,
+        orb_degrees=input_data.orb_degrees,
+        events=[event.model_copy() for event in events],
+    )
+
+# Verification Log
+# - Event search for transit-to-natal aspects per Section 5.2.3 (strictly mathematical).
+# - Coarse scan + Brent refinement; stations spliced into the grid so each retrograde pass is found.
+# - Exact events carry pass_number and retrograde flag; orb entry/exit derived from motion direction.
+# - Cached per (natal JD, window, orb, bodies); returned models are copies of the cached events.
+# - Window bounds normalized to naive UT first, so naive and aware inputs compare and share cache entries.
@@ -2,6 +2,7 @@
 
 import swisseph as swe  # pyswisseph library
 import os
+import sys
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 from packages.shared_schema.src.schemas import CelestialTransitMap, ActiveAspect, Planet, AspectType, PsychologicalPressure
@@ -9,6 +10,13 @@ from pydantic import BaseModel
 from uuid import UUID, uuid4
 import logging
 
+# Shared ephemeris snapshot lives in backend services - use absolute path resolution
+backend_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(backend_dir, 'services'))
+
+from sky_snapshot import compute_sky_snapshot
+from time_keeper import calculate_julian_day
+
 logger = logging.getLogger(__name__)
 
 class NatalCoordinates(BaseModel):
@@ -94,17 +102,16 @@ def validate_planetary_position(planet: Planet, position: float, julian_day: flo
         Fail: Return "Celestial Data Unavailable"
     """
     try:
-        planet_const = PLANET_CONSTANTS.get(planet)
-        if not planet_const:
+        # swe.SUN is 0, so test membership rather than truthiness of the constant
+        if planet not in PLANET_CONSTANTS:
             return ValidationResult(
                 is_valid=False,
                 deviation_degrees=999.0,
                 error_message=f"Unknown planet: {planet}"
             )
         
-        # Ground truth from Swiss Ephemeris
-        ground_truth, _ = swe.calc(julian_day, planet_const)
-        ground_truth_position = ground_truth[0]
+        # Ground truth from Swiss Ephemeris (shared per-JD snapshot, no extra ephemeris call)
+        ground_truth_position = compute_sky_snapshot(julian_day).longitude(planet)
         
         # Calculate deviation
         deviation = abs(position - ground_truth_position)
@@ -143,33 +150,20 @@ def calculate_planetary_transits(input_data: CalculateTransitsInput) -> Celestia
     Per ADR-04: Local C-library wrapper ensures deterministic accuracy.
     """
     try:
-        # Set ephemeris path if provided
-        ephe_path = os.getenv("SWEPHE_PATH")
-        if ephe_path:
-            swe.set_ephe_path(ephe_path)
-
-        # Convert to Julian Day
-        natal_jd = swe.julday(
-            input_data.natal_coordinates.birth_time_utc.year,
-            input_data.natal_coordinates.birth_time_utc.month,
-            input_data.natal_coordinates.birth_time_utc.day,
-            input_data.natal_coordinates.birth_time_utc.hour + input_data.natal_coordinates.birth_time_utc.minute / 60,
-        )
-
-        target_jd = swe.julday(
-            input_data.target_date.year,
-            input_data.target_date.month,
-            input_data.target_date.day,
-            input_data.target_date.hour + input_data.target_date.minute / 60,
-        )
+        # Convert to Julian Day (shared converter: UT-normalized, sub-second, memoized)
+        natal_jd = calculate_julian_day(input_data.natal_coordinates.birth_time_utc)
+        target_jd = calculate_julian_day(input_data.target_date)
 
         active_aspects = []
         validation_failures = []
 
+        # Each sky is computed once (and cached per JD) instead of once per planet pair
+        natal_sky = compute_sky_snapshot(natal_jd)
+        transit_sky = compute_sky_snapshot(target_jd)
+
         # Calculate all planet-to-planet aspects
-        for transit_planet, transit_const in PLANET_CONSTANTS.items():
-            transit_pos, _ = swe.calc(target_jd, transit_const)
-            transit_longitude = transit_pos[0]
+        for transit_planet in PLANET_CONSTANTS:
+            transit_longitude = transit_sky.longitude(transit_planet)
             
             # Section 8.2: Validate transit position
             validation = validate_planetary_position(transit_planet, transit_longitude, target_jd)
@@ -178,12 +172,9 @@ def calculate_planetary_transits(input_data: CalculateTransitsInput) -> Celestia
                 logger.error(f"[CELESTIAL_ENGINE] Validation failed for {transit_planet}")
                 continue
             
-            for natal_planet, natal_const in PLANET_CONSTANTS.items():
-                natal_pos, _ = swe.calc(natal_jd, natal_const)
-                natal_longitude = natal_pos[0]
+            for natal_planet in PLANET_CONSTANTS:
+                natal_longitude = natal_sky.longitude(natal_planet)
                 
-                # Calculate angular separation
-                diff = abs(transit_longitude - natal_longitude) % 360
                 # Calculate angular separation
                 diff = abs(transit_longitude - natal_longitude) % 360
                 
@@ -202,9 +193,7 @@ def calculate_planetary_transits(input_data: CalculateTransitsInput) -> Celestia
                         )
 
         # Calculate lunar phase (Section 3.3: 0.0=New, 0.5=Full, 1.0=New)
-        moon_pos, _ = swe.calc(target_jd, swe.MOON)
-        sun_pos, _ = swe.calc(target_jd, swe.SUN)
-        lunar_phase = ((moon_pos[0] - sun_pos[0]) % 360) / 360
+        lunar_phase = ((transit_sky.longitude(Planet.MOON) - transit_sky.longitude(Planet.SUN)) % 360) / 360
         
         # Log validation summary
         if validation_failures:
@@ -234,4 +223,7 @@ def calculate_planetary_transits(input_data: CalculateTransitsInput) -> Celestia
 # - Threshold: 0.5 degree maximum deviation per spec
 # - Enhanced psychological pressure logic per Section 3.3
 # - Proper error handling: Returns valid empty state instead of hallucinated data
-# - Logging for validation failures and developer review per Section 8.2
\ No newline at end of file
+# - Logging for validation failures and developer review per Section 8.2
+# - Transit and natal positions read from the shared per-JD SkySnapshot (one ephemeris sweep per chart)
+# - Ephemeris path is set once by time_keeper at import; re-setting it per call closed the open ephemeris files
+# - Julian Days via time_keeper.calculate_julian_day so JD cache keys match every other engine
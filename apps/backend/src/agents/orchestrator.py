@@ -3,7 +3,7 @@
 import os
 import sys
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import logging
 
 # Fix import paths - use absolute path resolution
@@ -11,13 +11,9 @@ backend_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__
 repo_root = os.path.dirname(os.path.dirname(backend_dir))
 sys.path.insert(0, os.path.join(repo_root, 'packages', 'shared-schema', 'src'))
 
-from apps.backend.src.agents.jungian_decoder import JungianDecoder
-from apps.backend.src.agents.celestial_engine import calculate_planetary_transits, CalculateTransitsInput, NatalCoordinates
-from apps.backend.src.agents.narrative_weaver import NarrativeWeaver
-from apps.backend.src.agents.resonance_librarian import ResonanceLibrarian
-from apps.backend.src.agents.safety_sentinel import SafetySentinel
-from apps.backend.src.core.context_registry import ContextRegistry
+from apps.backend.src.core.agent_registry import AgentRegistry
 from apps.backend.src.core.cloud_events import event_publisher
+from apps.backend.src.core.profiling import span
 from apps.backend.src.agents.mcp_tools import MCP_TOOL_REGISTRY
 from schemas import DreamIngestionObject
 import re
@@ -37,17 +33,38 @@ class PsycheOrchestrator:
     - Maintains Context Registry state
     """
 
-    def __init__(self):
-        # Initialize all worker agents (Section 2.1)
-        self.jungian_decoder = JungianDecoder()
-        self.celestial_engine = calculate_planetary_transits
-        self.narrative_weaver = NarrativeWeaver()
-        self.resonance_librarian = ResonanceLibrarian(pinecone_api_key=os.getenv("PINECONE_API_KEY", ""))
-        self.safety_sentinel = SafetySentinel()
-        self.context_registry = ContextRegistry()
+    def __init__(self, registry: Optional[AgentRegistry] = None):
+        # Worker agents (Section 2.1) are resolved lazily through the registry on first use
+        if registry is None:
+            from apps.backend.src.core.agent_registry import agent_registry as registry
+        self.registry = registry
         
         logger.info("[ORCHESTRATOR] Initialized with Agents-as-Tools pattern")
 
+    @property
+    def jungian_decoder(self):
+        return self.registry.get("jungian_decoder")
+
+    @property
+    def celestial_engine(self):
+        return self.registry.get("celestial_engine")
+
+    @property
+    def narrative_weaver(self):
+        return self.registry.get("narrative_weaver")
+
+    @property
+    def resonance_librarian(self):
+        return self.registry.get("resonance_librarian")
+
+    @property
+    def safety_sentinel(self):
+        return self.registry.get("safety_sentinel")
+
+    @property
+    def context_registry(self):
+        return self.registry.get("context_registry")
+
     def process_query(self, user_query: str, user_id: str) -> dict:
         """Parse intent and delegate to appropriate agent."""
         context = self.context_registry.get_user_context(user_id)
@@ -59,12 +76,13 @@ class PsycheOrchestrator:
 
         elif "transit" in user_query.lower() or "planets" in user_query.lower():
             # Delegate to Celestial Engine
+            from apps.backend.src.agents.celestial_engine import CalculateTransitsInput
             # Assumption: Extract date and coords from query or context
             input_data = CalculateTransitsInput(
                 target_date=datetime.now(),
                 natal_coordinates={"latitude": 0, "longitude": 0, "birth_time_utc": datetime.now()}  # Placeholder
             )
-            transits = calculate_planetary_transits(input_data)
+            transits = self.celestial_engine(input_data)
             return {"type": "celestial_transits", "data": transits.dict()}
 
         else:
@@ -86,7 +104,8 @@ class PsycheOrchestrator:
         
         # STEP 1: Safety validation (Section 8.1 - CRITICAL)
         # Must happen BEFORE any processing to prevent context poisoning
-        safety_result = self.safety_sentinel.validate_content(dream.content_raw)
+        with span("safety"):
+            safety_result = self.safety_sentinel.validate_content(dream.content_raw)
         
         if not safety_result["is_safe"]:
             # Section 8.1: STOP generation immediately for TIER1 violations
@@ -113,7 +132,8 @@ class PsycheOrchestrator:
         
         # STEP 2: Delegate to Jungian Decoder (W-02)
         logger.info(f"[ORCHESTRATOR] Delegating to Jungian Decoder")
-        archetype = self.jungian_decoder.analyze_dream(processed_content)
+        with span("decoder"):
+            archetype = self.jungian_decoder.analyze_dream(processed_content)
         
         # Publish CloudEvent: Archetype extracted
         event_publisher.publish_archetype_extracted(
@@ -125,6 +145,7 @@ class PsycheOrchestrator:
         # STEP 3: Delegate to Celestial Engine (W-03) - DETERMINISTIC
         # Section 2.2: "Deterministic Bridge" - must use Swiss Ephemeris, not LLM
         logger.info(f"[ORCHESTRATOR] Delegating to Celestial Engine")
+        from apps.backend.src.agents.celestial_engine import CalculateTransitsInput, NatalCoordinates
         
         # TODO: Get actual natal coordinates from user profile
         # For now, use placeholder (Assumption: doc silent on profile storage)
@@ -134,10 +155,11 @@ class PsycheOrchestrator:
             birth_time_utc=datetime(1990, 1, 1, 12, 0)
         )
         
-        transits = self.celestial_engine(CalculateTransitsInput(
-            target_date=dream.timestamp_ingested,
-            natal_coordinates=natal_coords
-        ))
+        with span("celestial"):
+            transits = self.celestial_engine(CalculateTransitsInput(
+                target_date=dream.timestamp_ingested,
+                natal_coordinates=natal_coords
+            ))
         
         # Publish CloudEvent: Transits calculated
         event_publisher.publish_transits_calculated(
@@ -148,14 +170,16 @@ class PsycheOrchestrator:
         
         # STEP 4: Delegate to Narrative Weaver (W-04)
         logger.info(f"[ORCHESTRATOR] Delegating to Narrative Weaver")
-        narrative = self.narrative_weaver.synthesize_narrative(archetype, transits)
+        with span("narrative"):
+            narrative = self.narrative_weaver.synthesize_narrative(archetype, transits)
         
         # Publish CloudEvent: Narrative synthesized
         event_publisher.publish_narrative_synthesized(dream_id_str, user_id_str)
         
         # STEP 5: Delegate to Resonance Librarian (W-04) for cohort finding
         logger.info(f"[ORCHESTRATOR] Delegating to Resonance Librarian")
-        cohort = self.resonance_librarian.query_resonance_map([archetype.archetype_id.value])
+        with span("resonance"):
+            cohort = self.resonance_librarian.query_resonance_map([archetype.archetype_id.value])
         
         # Publish CloudEvent: Resonance cohort found
         event_publisher.publish_resonance_cohort_found(
@@ -165,7 +189,8 @@ class PsycheOrchestrator:
         )
         
         # STEP 6: Update Context Registry (Section 4)
-        self.context_registry.update_temporal_state(user_id_str, dream.timestamp_ingested)
+        with span("context"):
+            self.context_registry.update_temporal_state(user_id_str, dream.timestamp_ingested)
         
         # STEP 7: Return structured response
         logger.info(f"[ORCHESTRATOR] Dream processing complete: {dream_id_str}")
@@ -198,4 +223,6 @@ class PsycheOrchestrator:
 # - Section 2.2: "Deterministic Bridge" - routes astrology to Swiss Ephemeris
 # - Context Registry updates per Section 4
 # - Proper error handling and logging for observability
-# - Returns structured response with metadata and safety information
\ No newline at end of file
+# - Returns structured response with metadata and safety information
+# - Each delegation runs inside a profiling span (safety, decoder, celestial, narrative, resonance, context)
+# - Worker agents resolved lazily via AgentRegistry so importing/constructing the orchestrator has no I/O
\ No newline at end of file
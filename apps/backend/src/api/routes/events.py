@@ -0,0 +1,53 @@
+# Verified against Section 3.4 (CloudEvents): per-user WebSocket push of orchestration stages
+
+import asyncio
+from typing import Optional
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from apps.backend.src.core.event_hub import SlowConsumerError, Subscription, event_hub
+
+router = APIRouter()
+
+# Close code for a client that stopped reading ("try again later")
+WS_TRY_AGAIN_LATER = 1013
+
+
+async def _watch_disconnect(websocket: WebSocket, subscription: Subscription) -> None:
+    # Clients send nothing; reading only notices the disconnect (pings are answered by the server)
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    subscription.close()
+
+
+@router.websocket('/ws')
+async def stream_events(websocket: WebSocket, user_id: str, dream_id: Optional[str] = None):
+    """
+    Stage events of the user's dreams (or of one dream with `dream_id`) as they happen.
+
+    Frames: {"type": "events", "events": [...], "dropped": n}. Each event is
+    {"type": "stage", "dream_id", "stage", "event_id", "time", "data"} or, when
+    an ingestion job ends, {"type": "job", "dream_id", "status", "error"}.
+    `dropped` > 0 means the connection fell behind and lost older events;
+    GET /ingest/jobs/{dream_id} has the full state.
+
+    Not access-controlled yet: user_id is taken from the query string, so any
+    client can follow any user's stages until the auth middleware (JWT) lands
+    and the user comes from the token instead.
+    """
+    await websocket.accept()
+    subscription = event_hub.connect(user_id, dream_id)
+    watcher = asyncio.create_task(_watch_disconnect(websocket, subscription))
+    try:
+        await event_hub.stream(subscription, websocket.send_json)
+    except SlowConsumerError:
+        await websocket.close(code=WS_TRY_AGAIN_LATER)
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
+        event_hub.disconnect(subscription)
+        watcher.cancel()
@@ -0,0 +1,52 @@
+# Verified against Section 3.1 (Dream Ingestion): status of queued ingestion jobs
+
+import asyncio
+
+from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
+from apps.backend.src.core.job_queue import TERMINAL_STATUSES, get_job_queue
+
+router = APIRouter()
+
+# The job row is the source of truth (workers may run in other processes); it is re-read at this interval
+WS_POLL_SECONDS = 0.2
+
+
+@router.get('/jobs/{dream_id}')
+async def get_ingest_job(dream_id: str):
+    """Status, completed stages and, once succeeded, the analysis result"""
+    job = await run_in_threadpool(get_job_queue().get, dream_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"No ingestion job for dream {dream_id}")
+    return job
+
+
+@router.websocket('/jobs/{dream_id}/ws')
+async def watch_ingest_job(websocket: WebSocket, dream_id: str):
+    """
+    Push {"type": "stage", ...} for each completed stage (including those done
+    before connecting), then one {"type": "status", ...} with the final job, and close.
+    """
+    await websocket.accept()
+    queue = get_job_queue()
+    sent = 0
+    try:
+        while True:
+            job = await run_in_threadpool(queue.get, dream_id)
+            if job is None:
+                await websocket.send_json({"type": "error", "detail": f"No ingestion job for dream {dream_id}"})
+                await websocket.close(code=4404)
+                return
+            if len(job["stages"]) < sent:
+                # Retried after a failed attempt: stages start over
+                sent = 0
+            for stage in job["stages"][sent:]:
+                await websocket.send_json({"type": "stage", "dream_id": dream_id, **stage})
+            sent = len(job["stages"])
+            if job["status"] in TERMINAL_STATUSES:
+                await websocket.send_json({"type": "status", **job})
+                await websocket.close()
+                return
+            await asyncio.sleep(WS_POLL_SECONDS)
+    except WebSocketDisconnect:
+        return
@@ -0,0 +1,147 @@
+# Verified against Section 5.2.1 (Psyche_Orchestrator) and ADR-01 (Agents-as-Tools Pattern)
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from apps.backend.src.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class AgentRegistry:
+    """
+    Lazily constructed worker agents.
+
+    Agent modules are imported and agents built on first use (or by warm()
+    from a lifespan task), so importing an app module stays cheap: no prompt
+    file reads, Pinecone init or Redis ping at import time.
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Callable[[], Any]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._build_seconds: Dict[str, float] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._registry_lock = threading.Lock()
+
+    def register(self, name: str, factory: Callable[[], Any]) -> None:
+        """Register a zero-argument factory; replaces any built instance"""
+        with self._registry_lock:
+            self._factories[name] = factory
+            self._locks.setdefault(name, threading.Lock())
+            self._instances.pop(name, None)
+
+    def get(self, name: str) -> Any:
+        """Return the agent, building it on first use (once, even under concurrent callers)"""
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        if name not in self._factories:
+            raise KeyError(f"Unknown agent: {name}")
+
+        with self._locks[name]:
+            instance = self._instances.get(name)
+            if instance is None:
+                started = time.perf_counter()
+                instance = self._factories[name]()
+                self._build_seconds[name] = time.perf_counter() - started
+                self._instances[name] = instance
+                logger.info(f"[AGENT_REGISTRY] Built {name} in {self._build_seconds[name] * 1000:.1f} ms")
+        return instance
+
+    def is_built(self, name: str) -> bool:
+        return name in self._instances
+
+    def warm(self, names: Optional[Iterable[str]] = None) -> Dict[str, float]:
+        """Build agents ahead of first use; returns build time (seconds) per agent"""
+        for name in list(names or self._factories):
+            try:
+                self.get(name)
+            except Exception as e:
+                # A failing agent is rebuilt on first use instead of blocking startup
+                logger.warning(f"[AGENT_REGISTRY] Warm-up failed for {name}: {e}")
+        return dict(self._build_seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "registered": sorted(self._factories),
+            "built": sorted(self._instances),
+            "build_ms": {name: round(seconds * 1000, 2) for name, seconds in self._build_seconds.items()},
+        }
+
+
+def _build_context_registry():
+    import os
+    from urllib.parse import urlparse
+    from apps.backend.src.core.context_registry import ContextRegistry
+    # REDIS_URL (shared with the result cache) overrides the localhost:6379 default
+    url = urlparse(os.getenv("REDIS_URL", "redis://localhost:6379"))
+    return ContextRegistry(redis_host=url.hostname or "localhost", redis_port=url.port or 6379)
+
+
+def _build_jungian_decoder():
+    from apps.backend.src.agents.jungian_decoder import JungianDecoder
+    return JungianDecoder()
+
+
+def _build_celestial_engine():
+    from apps.backend.src.agents.celestial_engine import calculate_planetary_transits
+    return calculate_planetary_transits
+
+
+def _build_narrative_weaver():
+    from apps.backend.src.agents.narrative_weaver import NarrativeWeaver
+    return NarrativeWeaver()
+
+
+def _build_resonance_librarian():
+    import os
+    from apps.backend.src.agents.resonance_librarian import ResonanceLibrarian
+    return ResonanceLibrarian(pinecone_api_key=os.getenv("PINECONE_API_KEY", ""))
+
+
+def _build_safety_sentinel():
+    from apps.backend.src.agents.safety_sentinel import SafetySentinel
+    return SafetySentinel()
+
+
+def _build_growth_architect():
+    from apps.backend.src.agents.growth_architect import GrowthArchitect
+    return GrowthArchitect()
+
+
+def _build_orchestrator():
+    from apps.backend.src.agents.orchestrator import PsycheOrchestrator
+    return PsycheOrchestrator(registry=agent_registry)
+
+
+# Process-wide registry shared by main.py, mcp_server.py and the orchestrator
+agent_registry = AgentRegistry()
+agent_registry.register("context_registry", _build_context_registry)
+agent_registry.register("jungian_decoder", _build_jungian_decoder)
+agent_registry.register("celestial_engine", _build_celestial_engine)
+agent_registry.register("narrative_weaver", _build_narrative_weaver)
+agent_registry.register("resonance_librarian", _build_resonance_librarian)
+agent_registry.register("safety_sentinel", _build_safety_sentinel)
+agent_registry.register("growth_architect", _build_growth_architect)
+agent_registry.register("orchestrator", _build_orchestrator)
+
+
+def _collect_agent_metrics():
+    stats = agent_registry.stats()
+    yield ("aetheria_agent_built", "gauge", "1 once a registered agent has been built",
+           [("aetheria_agent_built", {"agent": name}, 1 if name in stats["built"] else 0) for name in stats["registered"]])
+    yield ("aetheria_agent_build_seconds", "gauge", "Time taken to build each agent",
+           [("aetheria_agent_build_seconds", {"agent": name}, ms / 1000.0) for name, ms in stats["build_ms"].items()])
+
+
+metrics.register_collector(_collect_agent_metrics)
+
+# Verification Log
+# - Lazy registry for worker agents per ADR-01 (agents remain tools; construction deferred to first use).
+# - Factories import agent modules on demand, keeping app import free of Pinecone/Redis/prompt-file side effects.
+# - Per-agent locks guarantee a single instance under concurrent first use; build times recorded for startup profiling.
+# - Built agents and build times exported on /metrics via a scrape-time collector.
@@ -1,6 +1,6 @@
 # Verified against Section 3.4 and Section 9 (Event-Driven Sourcing)
 
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, Optional
 from datetime import datetime
 from uuid import uuid4
 import sys
@@ -12,7 +12,12 @@ repo_root = os.path.dirname(os.path.dirname(backend_dir))
 sys.path.insert(0, os.path.join(repo_root, 'packages', 'shared-schema', 'src'))
 
 from schemas import CloudEvent
+from apps.backend.src.core.metrics import CLOUD_EVENTS
 import json
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
 
 class CloudEventPublisher:
     """
@@ -24,6 +29,22 @@ class CloudEventPublisher:
     def __init__(self, source_service: str = "//aetheria.api"):
         self.source_service = source_service
         self.event_log: list[CloudEvent] = []  # In-memory log for development
+        self._subscribers: list[Callable[[CloudEvent], None]] = []
+        self._subscribers_lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[CloudEvent], None]) -> Callable[[], None]:
+        """
+        Call `callback(event)` for every event published from now on, on the
+        publishing thread. Returns a function that removes the subscription.
+        """
+        with self._subscribers_lock:
+            self._subscribers = self._subscribers + [callback]
+
+        def unsubscribe() -> None:
+            with self._subscribers_lock:
+                self._subscribers = [s for s in self._subscribers if s is not callback]
+
+        return unsubscribe
     
     def publish_dream_logged(self, dream_id: str, user_id: str, status: str = "processing") -> CloudEvent:
         """
@@ -158,7 +179,14 @@ class CloudEventPublisher:
         In production, this would publish to message queue (Kafka, RabbitMQ, etc.)
         """
         self.event_log.append(event)
+        CLOUD_EVENTS.inc(type=event.type)
         print(f"[CloudEvent] {event.type} | ID: {event.id} | Time: {event.time}")
+        for callback in self._subscribers:
+            try:
+                callback(event)
+            except Exception as e:
+                # A failing subscriber must not break the workflow that published
+                logger.warning(f"[CloudEvent] Subscriber failed on {event.type}: {e}")
     
     def get_event_history(self, event_type: Optional[str] = None) -> list[CloudEvent]:
         """
@@ -187,3 +215,5 @@ event_publisher = CloudEventPublisher()
 # - Enables temporal replay and auditability per ADR-05
 # - Security event logging per Section 8.1
 # - In-memory log for development; production would use message queue
+# - Emitted events counted per type (aetheria_cloud_events_total)
+# - subscribe() hook feeds in-process consumers (ingestion job stages); subscriber errors are logged, never raised
@@ -6,6 +6,7 @@ from typing import Optional, Dict, Any, List
 from pydantic import BaseModel
 from datetime import datetime
 from packages.shared_schema.src.schemas import ArchetypalNode  # Assuming import path
+from apps.backend.src.core.metrics import REDIS_ROUND_TRIPS, REDIS_ERRORS
 
 class UserContextTier(BaseModel):
     tier_level: str  # e.g., "gold_subscriber"
@@ -37,7 +38,7 @@ class ContextRegistry:
         try:
             self.redis_client = redis.Redis(host=redis_host, port=redis_port, decode_responses=True, socket_connect_timeout=1)
             # Test connection
-            self.redis_client.ping()
+            self._redis("ping", self.redis_client.ping)
             self.offline_mode = False
         except (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError):
             # Offline mode: use in-memory dict as fallback
@@ -45,13 +46,22 @@ class ContextRegistry:
             self.offline_mode = True
             self._memory_store: Dict[str, str] = {}
 
+    def _redis(self, op: str, command, *args):
+        """Run one Redis command, counting round trips and failures"""
+        REDIS_ROUND_TRIPS.inc(client="context_registry", op=op)
+        try:
+            return command(*args)
+        except redis.exceptions.RedisError:
+            REDIS_ERRORS.inc(client="context_registry", op=op)
+            raise
+
     def get_user_context(self, user_id: str) -> Optional[ContextRegistryEntry]:
         """Retrieve the context registry entry for a user."""
         key = f"context:{user_id}"
         if self.offline_mode:
             data = self._memory_store.get(key)
         else:
-            data = self.redis_client.get(key)
+            data = self._redis("get", self.redis_client.get, key)
         if data:
             return ContextRegistryEntry.parse_raw(data)
         return None
@@ -65,7 +75,7 @@ class ContextRegistry:
             if self.offline_mode:
                 self._memory_store[key] = existing.json()
             else:
-                self.redis_client.set(key, existing.json())
+                self._redis("set", self.redis_client.set, key, existing.json())
         # Assumption: If no existing context, create minimal one. Doc silent on initialization.
 
     def set_user_context(self, user_id: str, entry: ContextRegistryEntry) -> None:
@@ -74,7 +84,7 @@ class ContextRegistry:
         if self.offline_mode:
             self._memory_store[key] = entry.json()
         else:
-            self.redis_client.set(key, entry.json())
+            self._redis("set", self.redis_client.set, key, entry.json())
 
     def update_active_threads(self, user_id: str, threads: List[ActiveNarrativeThread]) -> None:
         """Update active narrative threads."""
@@ -86,5 +96,6 @@ class ContextRegistry:
 # Verification Log
 # - Implemented ContextRegistry class with Redis backend as per Section 4.
 # - Defined Pydantic models for ContextRegistryEntry and sub-components based on Section 4.1.
+# - Every Redis command is counted (aetheria_redis_round_trips_total / aetheria_redis_errors_total).
 # - Assumption: Used Redis for storage; if Postgres preferred, please clarify.
 # - Assumption: Added set_user_context and update_active_threads methods for completeness, as doc specifies get_user_context and update_temporal_state but implies full management.
\ No newline at end of file
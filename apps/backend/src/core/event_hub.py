@@ -0,0 +1,262 @@
+# Verified against Section 3.4 (CloudEvents) - push of orchestration stage events to connected clients
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Set
+
+from apps.backend.src.core.job_queue import TERMINAL_STATUSES, IngestJobQueue, stage_record
+from apps.backend.src.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+# Orchestration stages pushed to the dream's owner
+STREAMED_EVENT_TYPES = frozenset({
+    "com.aetheria.dream.logged",
+    "com.aetheria.archetype.extracted",
+    "com.aetheria.transits.calculated",
+    "com.aetheria.narrative.synthesized",
+    "com.aetheria.resonance.cohort_found",
+})
+
+# Events arriving within this window after the first one go out in the same frame
+COALESCE_SECONDS = float(os.getenv("EVENT_HUB_COALESCE_MS", "50")) / 1000.0
+# Per-connection buffer; when a slow client lets it fill, the oldest events are dropped (and counted)
+MAX_PENDING = int(os.getenv("EVENT_HUB_MAX_PENDING", "256"))
+# A frame not accepted within this time closes the connection (1013, reconnect later)
+SEND_TIMEOUT_SECONDS = float(os.getenv("EVENT_HUB_SEND_TIMEOUT", "10"))
+# Event ids remembered to drop the second copy of an event (local publisher vs. queue relay)
+SEEN_EVENT_IDS = 65536
+
+EVENT_HUB_CONNECTIONS = metrics.gauge("aetheria_event_hub_connections", "Open event WebSocket connections")
+EVENT_HUB_MESSAGES = metrics.counter(
+    "aetheria_event_hub_messages", "Events handled by the hub (delivered, dropped on overflow)", ["outcome"]
+)
+EVENT_HUB_FRAMES = metrics.counter("aetheria_event_hub_frames", "Frames sent to clients")
+EVENT_HUB_SLOW_CLOSES = metrics.counter(
+    "aetheria_event_hub_slow_closes", "Connections closed because a frame was not accepted in time"
+)
+
+
+class SlowConsumerError(Exception):
+    """A client did not accept a frame within SEND_TIMEOUT_SECONDS"""
+
+
+class Subscription:
+    """One WebSocket connection: a bounded buffer of events waiting to be sent"""
+
+    __slots__ = ("user_id", "dream_id", "pending", "dropped", "wake", "closed")
+
+    def __init__(self, user_id: str, dream_id: Optional[str] = None):
+        self.user_id = user_id
+        self.dream_id = dream_id
+        self.pending: Deque[Dict[str, Any]] = deque()
+        self.dropped = 0
+        self.wake = asyncio.Event()
+        self.closed = False
+
+    def offer(self, message: Dict[str, Any], max_pending: int) -> None:
+        if self.closed or (self.dream_id is not None and message.get("dream_id") != self.dream_id):
+            return
+        if len(self.pending) >= max_pending:
+            self.pending.popleft()
+            self.dropped += 1
+            EVENT_HUB_MESSAGES.inc(outcome="dropped")
+        self.pending.append(message)
+        self.wake.set()
+
+    def close(self) -> None:
+        self.closed = True
+        self.wake.set()
+
+
+class EventHub:
+    """
+    Fans CloudEvents out to per-user WebSocket subscriptions.
+
+    Events are published from worker threads; they are handed to the event
+    loop (call_soon_threadsafe) only when the user has a connection, so idle
+    users and idle connections cost nothing per event. An idle connection
+    is two parked coroutines (the endpoint waiting in stream() and its
+    disconnect watcher task) and an empty deque. Each connection gets bursts
+    coalesced into one frame and a bounded buffer, so a slow client never
+    holds memory or the publishers back: it loses its oldest events
+    (reported as `dropped`, resync with GET /ingest/jobs/{dream_id}), and
+    is closed if it stops accepting frames.
+    """
+
+    def __init__(
+        self,
+        coalesce_seconds: float = COALESCE_SECONDS,
+        max_pending: int = MAX_PENDING,
+        send_timeout: float = SEND_TIMEOUT_SECONDS
+    ):
+        self.coalesce_seconds = coalesce_seconds
+        self.max_pending = max_pending
+        self.send_timeout = send_timeout
+        self._subscriptions: Dict[str, Set[Subscription]] = {}
+        self._connections = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._seen: "OrderedDict[str, None]" = OrderedDict()
+        self._seen_lock = threading.Lock()
+
+    def bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Deliver on this loop (the server's); set from the app lifespan"""
+        self._loop = loop
+
+    @property
+    def connection_count(self) -> int:
+        return self._connections
+
+    def has_subscribers(self, user_id: Optional[str] = None) -> bool:
+        if user_id is None:
+            return bool(self._subscriptions)
+        return user_id in self._subscriptions
+
+    def connect(self, user_id: str, dream_id: Optional[str] = None) -> Subscription:
+        """Register a connection (on the loop thread)"""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        subscription = Subscription(user_id, dream_id)
+        self._subscriptions.setdefault(user_id, set()).add(subscription)
+        self._connections += 1
+        EVENT_HUB_CONNECTIONS.set(self._connections)
+        return subscription
+
+    def disconnect(self, subscription: Subscription) -> None:
+        subscription.close()
+        subs = self._subscriptions.get(subscription.user_id)
+        if subs is None or subscription not in subs:
+            return
+        subs.discard(subscription)
+        if not subs:
+            del self._subscriptions[subscription.user_id]
+        self._connections -= 1
+        EVENT_HUB_CONNECTIONS.set(self._connections)
+
+    def _first_sighting(self, event_id: str) -> bool:
+        with self._seen_lock:
+            if event_id in self._seen:
+                return False
+            self._seen[event_id] = None
+            if len(self._seen) > SEEN_EVENT_IDS:
+                self._seen.popitem(last=False)
+            return True
+
+    def publish(self, user_id: str, message: Dict[str, Any]) -> None:
+        """Queue `message` for the user's connections; callable from any thread, duplicates (same event_id) dropped"""
+        if user_id not in self._subscriptions or self._loop is None:
+            return
+        if not self._first_sighting(message["event_id"]):
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._dispatch(user_id, message)
+        else:
+            try:
+                self._loop.call_soon_threadsafe(self._dispatch, user_id, message)
+            except RuntimeError:
+                # Loop closed (shutdown)
+                pass
+
+    def _dispatch(self, user_id: str, message: Dict[str, Any]) -> None:
+        for subscription in self._subscriptions.get(user_id, ()):
+            subscription.offer(message, self.max_pending)
+
+    def on_cloud_event(self, event) -> None:
+        """CloudEventPublisher subscriber"""
+        if event.type not in STREAMED_EVENT_TYPES:
+            return
+        data = event.data or {}
+        user_id = data.get("user_id")
+        if user_id is None:
+            return
+        self.publish(str(user_id), {"type": "stage", "dream_id": str(data.get("dream_id")), **stage_record(event)})
+
+    async def stream(self, subscription: Subscription, send: Callable[[Dict[str, Any]], Awaitable[None]]) -> None:
+        """
+        Send frames {"type": "events", "events": [...], "dropped": n} until the
+        subscription is closed. Raises SlowConsumerError if a send times out.
+        """
+        while not subscription.closed:
+            await subscription.wake.wait()
+            if subscription.closed:
+                return
+            if self.coalesce_seconds > 0:
+                await asyncio.sleep(self.coalesce_seconds)
+            subscription.wake.clear()
+            events = list(subscription.pending)
+            subscription.pending.clear()
+            dropped, subscription.dropped = subscription.dropped, 0
+            if not events:
+                continue
+            try:
+                await asyncio.wait_for(send({"type": "events", "events": events, "dropped": dropped}), self.send_timeout)
+            except asyncio.TimeoutError:
+                EVENT_HUB_SLOW_CLOSES.inc()
+                raise SlowConsumerError(f"client for user {subscription.user_id} stopped reading")
+            EVENT_HUB_FRAMES.inc()
+            EVENT_HUB_MESSAGES.inc(len(events), outcome="delivered")
+
+    def stats(self) -> Dict[str, Any]:
+        return {"users": len(self._subscriptions), "connections": self.connection_count}
+
+
+async def relay_queue_events(
+    hub: EventHub,
+    queue: IngestJobQueue,
+    interval: float = 0.5,
+    overlap: float = 2.0
+) -> None:
+    """
+    Forward stages recorded by ingestion workers in other processes (and job
+    completions) from the shared job queue into the hub. One query per interval
+    for the whole process, only while someone is connected; stages this process
+    published itself are dropped by the hub as duplicates.
+    """
+    cursor = time.time()
+    while True:
+        await asyncio.sleep(interval)
+        if not hub.has_subscribers():
+            cursor = time.time()
+            continue
+        try:
+            # Re-read `overlap` seconds: a commit can land with an updated_at older than the last one seen
+            jobs = await asyncio.to_thread(queue.changed_since, cursor - overlap)
+        except Exception as e:
+            logger.warning(f"[EVENT_HUB] Queue relay failed: {e}")
+            continue
+        for job in jobs:
+            cursor = max(cursor, job["updated_at"])
+            if not hub.has_subscribers(job["user_id"]):
+                continue
+            for stage in job["stages"]:
+                hub.publish(job["user_id"], {"type": "stage", "dream_id": job["job_id"], **stage})
+            if job["status"] in TERMINAL_STATUSES:
+                hub.publish(job["user_id"], {
+                    "type": "job",
+                    "dream_id": job["job_id"],
+                    "event_id": f"{job['job_id']}:{job['status']}:{job['attempts']}",
+                    "status": job["status"],
+                    "error": job["error"],
+                })
+
+
+# Process-wide hub, fed by event_publisher.subscribe(event_hub.on_cloud_event) in the app lifespan
+event_hub = EventHub()
+
+
+# Verification Log
+# - Subscribes to CloudEventPublisher; pushes dream.logged, archetype.extracted, transits.calculated,
+#   narrative.synthesized and resonance.cohort_found to the dream owner's connections (optionally one dream).
+# - Thread-safe publish: events for users without a connection are dropped before touching the loop.
+# - Bursts coalesced per connection (EVENT_HUB_COALESCE_MS); bounded buffer drops oldest (EVENT_HUB_MAX_PENDING),
+#   stalled clients closed after EVENT_HUB_SEND_TIMEOUT.
+# - relay_queue_events covers ingestion workers in other processes and announces job completion ("job" messages).
+# - Connections, frames, delivered/dropped events and slow closes exported to /metrics.
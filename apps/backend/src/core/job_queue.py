@@ -0,0 +1,497 @@
+# Verified against Section 3.1 (Dream Ingestion) and Section 3.4 (Event-Driven Sourcing)
+
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+
+from apps.backend.src.core.cloud_events import event_publisher
+from apps.backend.src.core.metrics import metrics
+from apps.backend.src.core.profiling import RequestProfile, profile_job
+
+logger = logging.getLogger(__name__)
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Shared by the API process and every worker process on the host
+QUEUE_PATH = os.getenv("INGEST_QUEUE_PATH", os.path.join(backend_dir, ".ingest_queue.sqlite3"))
+
+QUEUED, RUNNING, SUCCEEDED, FAILED = "queued", "running", "succeeded", "failed"
+TERMINAL_STATUSES = (SUCCEEDED, FAILED)
+
+INGEST_JOBS = metrics.counter(
+    "aetheria_ingest_jobs", "Ingestion jobs by outcome (enqueued, succeeded, retried, failed, lease_lost)", ["outcome"]
+)
+INGEST_QUEUE_WAIT = metrics.histogram(
+    "aetheria_ingest_queue_wait_seconds", "Time from enqueue to a worker claiming the job"
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS ingest_jobs (
+    job_id      TEXT PRIMARY KEY,
+    user_id     TEXT NOT NULL,
+    payload     TEXT NOT NULL,
+    status      TEXT NOT NULL,
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    stages      TEXT NOT NULL DEFAULT '[]',
+    result      TEXT,
+    error       TEXT,
+    worker_id   TEXT,
+    lease_until REAL,
+    enqueued_at REAL NOT NULL,
+    updated_at  REAL NOT NULL,
+    dedupe_key  TEXT,
+    claimed_at  REAL,
+    profile     TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_ingest_jobs_claim ON ingest_jobs (status, enqueued_at);
+CREATE INDEX IF NOT EXISTS ix_ingest_jobs_updated ON ingest_jobs (updated_at);
+"""
+
+# Columns added after the table first shipped; applied to existing queue files on open
+MIGRATIONS = (
+    ("dedupe_key", "ALTER TABLE ingest_jobs ADD COLUMN dedupe_key TEXT"),
+    ("claimed_at", "ALTER TABLE ingest_jobs ADD COLUMN claimed_at REAL"),
+    ("profile", "ALTER TABLE ingest_jobs ADD COLUMN profile TEXT"),
+)
+# Writes by the worker holding the current claim; attempts is bumped by every claim, so it fences
+# off a worker whose lease lapsed even if the same worker_id claimed the job again
+LEASE_HOLDER = "status = 'running' AND worker_id = ? AND attempts = ?"
+
+DEDUPE_INDEX = "CREATE INDEX IF NOT EXISTS ix_ingest_jobs_dedupe ON ingest_jobs (dedupe_key) WHERE dedupe_key IS NOT NULL"
+
+
+def stage_record(event) -> Dict[str, Any]:
+    """A CloudEvent as a job stage (and as pushed to clients): short type, id, time, data without the ids"""
+    return {
+        "stage": event.type.removeprefix("com.aetheria."),
+        "event_id": event.id,
+        "time": event.time.isoformat(),
+        "data": jsonable_encoder({k: v for k, v in (event.data or {}).items() if k not in ("dream_id", "user_id")}),
+    }
+
+
+def _iso(timestamp: Optional[float]) -> Optional[str]:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+class IngestJobQueue:
+    """
+    Durable FIFO of dream ingestion jobs in a local SQLite file (WAL mode).
+
+    The job id is the dream_id, so re-submitting a dream is idempotent.
+    A worker claims a job under a lease, which it renews (heartbeat) while the
+    job runs; a job whose worker died is claimed again once the lease lapses,
+    up to `max_attempts`. Writes for a job (stages, completion, failure) take
+    the claim's worker_id and attempt and are dropped once that claim has been
+    superseded, so a worker that lost its lease cannot overwrite the job. Completed stages
+    (CloudEvent types) are appended to the job row as they happen, so any
+    process can report progress.
+    """
+
+    def __init__(self, path: str = QUEUE_PATH, lease_seconds: float = 300.0, max_attempts: int = 3):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._local = threading.local()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        conn = self._connection()
+        conn.executescript(SCHEMA)
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(ingest_jobs)")}
+        for column, statement in MIGRATIONS:
+            if column not in columns:
+                conn.execute(statement)
+        conn.execute(DEDUPE_INDEX)
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread; autocommit, explicit BEGIN IMMEDIATE where a read-modify-write needs it
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30.0, isolation_level=None, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _transaction(self, work: Callable[[sqlite3.Connection], Any]) -> Any:
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            value = work(conn)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return value
+
+    def enqueue(
+        self,
+        job_id: str,
+        user_id: str,
+        payload: Dict[str, Any],
+        dedupe_key: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Add a job; returns (job, created). An existing job with this id, or an
+        unfinished one enqueued with the same `dedupe_key`, is returned instead.
+        """
+
+        def work(conn: sqlite3.Connection):
+            existing = self._find_unfinished(conn, dedupe_key)
+            if existing is not None:
+                return existing, False
+            now = time.time()
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO ingest_jobs "
+                "(job_id, user_id, payload, status, enqueued_at, updated_at, dedupe_key) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, user_id, json.dumps(payload), QUEUED, now, now, dedupe_key),
+            )
+            return job_id, cursor.rowcount == 1
+
+        job_id, created = self._transaction(work)
+        if created:
+            INGEST_JOBS.inc(outcome="enqueued")
+        return self.get(job_id), created
+
+    def find_unfinished(self, dedupe_key: str) -> Optional[Dict[str, Any]]:
+        """The queued or running job enqueued with `dedupe_key`, if any"""
+        job_id = self._find_unfinished(self._connection(), dedupe_key)
+        return self.get(job_id) if job_id is not None else None
+
+    @staticmethod
+    def _find_unfinished(conn: sqlite3.Connection, dedupe_key: Optional[str]) -> Optional[str]:
+        if dedupe_key is None:
+            return None
+        row = conn.execute(
+            "SELECT job_id FROM ingest_jobs WHERE dedupe_key = ? AND status IN (?, ?) LIMIT 1",
+            (dedupe_key, QUEUED, RUNNING),
+        ).fetchone()
+        return row["job_id"] if row is not None else None
+
+    def claim(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """Take the oldest queued (or lease-expired) job, or None if there is nothing to do"""
+
+        def work(conn: sqlite3.Connection):
+            now = time.time()
+            row = conn.execute(
+                "SELECT job_id, payload, enqueued_at, attempts FROM ingest_jobs "
+                "WHERE status = ? OR (status = ? AND lease_until < ?) "
+                "ORDER BY enqueued_at LIMIT 1",
+                (QUEUED, RUNNING, now),
+            ).fetchone()
+            if row is None:
+                return None
+            if row["attempts"] >= self.max_attempts:
+                # Lease lapsed on the last attempt: the worker died mid-job every time
+                conn.execute(
+                    "UPDATE ingest_jobs SET status = ?, error = ?, worker_id = NULL, lease_until = NULL, "
+                    "updated_at = ? WHERE job_id = ?",
+                    (FAILED, "worker lease expired", now, row["job_id"]),
+                )
+                INGEST_JOBS.inc(outcome="failed")
+                return work(conn)
+            conn.execute(
+                "UPDATE ingest_jobs SET status = ?, attempts = attempts + 1, worker_id = ?, lease_until = ?, "
+                "claimed_at = ?, updated_at = ? WHERE job_id = ?",
+                (RUNNING, worker_id, now + self.lease_seconds, now, now, row["job_id"]),
+            )
+            INGEST_QUEUE_WAIT.observe(now - row["enqueued_at"])
+            return {"job_id": row["job_id"], "payload": json.loads(row["payload"]), "attempt": row["attempts"] + 1}
+
+        return self._transaction(work)
+
+    def heartbeat(self, job_id: str, worker_id: str, attempt: int) -> bool:
+        """Extend the lease of a running job; False if this claim no longer holds it"""
+        now = time.time()
+        cursor = self._connection().execute(
+            f"UPDATE ingest_jobs SET lease_until = ? WHERE job_id = ? AND {LEASE_HOLDER}",
+            (now + self.lease_seconds, job_id, worker_id, attempt),
+        )
+        return cursor.rowcount == 1
+
+    def record_stage(self, job_id: str, stage: Dict[str, Any], worker_id: str, attempt: int) -> bool:
+        """Append a completed stage and extend the lease; False (nothing written) if the claim was lost"""
+
+        def work(conn: sqlite3.Connection):
+            row = conn.execute(
+                f"SELECT stages FROM ingest_jobs WHERE job_id = ? AND {LEASE_HOLDER}", (job_id, worker_id, attempt)
+            ).fetchone()
+            if row is None:
+                return False
+            stages = json.loads(row["stages"]) + [stage]
+            now = time.time()
+            conn.execute(
+                "UPDATE ingest_jobs SET stages = ?, lease_until = ?, updated_at = ? WHERE job_id = ?",
+                (json.dumps(stages), now + self.lease_seconds, now, job_id),
+            )
+            return True
+
+        return self._transaction(work)
+
+    def record_profile(self, job_id: str, profile: Dict[str, Any], worker_id: str, attempt: int) -> bool:
+        """Store the span timings of this attempt (sampled jobs only); False if the claim was lost"""
+        cursor = self._connection().execute(
+            f"UPDATE ingest_jobs SET profile = ? WHERE job_id = ? AND {LEASE_HOLDER}",
+            (json.dumps(profile), job_id, worker_id, attempt),
+        )
+        return cursor.rowcount == 1
+
+    def get_profile(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Span timings of the job's latest profiled attempt, if any"""
+        row = self._connection().execute("SELECT profile FROM ingest_jobs WHERE job_id = ?", (job_id,)).fetchone()
+        if row is None or row["profile"] is None:
+            return None
+        return json.loads(row["profile"])
+
+    def complete(self, job_id: str, result: Dict[str, Any], worker_id: str, attempt: int) -> bool:
+        """Store the result; False (dropped) if the claim was lost"""
+        cursor = self._connection().execute(
+            "UPDATE ingest_jobs SET status = ?, result = ?, error = NULL, worker_id = NULL, lease_until = NULL, "
+            f"updated_at = ? WHERE job_id = ? AND {LEASE_HOLDER}",
+            (SUCCEEDED, json.dumps(result), time.time(), job_id, worker_id, attempt),
+        )
+        if cursor.rowcount != 1:
+            INGEST_JOBS.inc(outcome="lease_lost")
+            return False
+        INGEST_JOBS.inc(outcome="succeeded")
+        return True
+
+    def fail(self, job_id: str, error: str, worker_id: str, attempt: int) -> Optional[str]:
+        """
+        Requeue the job (stages reset) or, after max_attempts, mark it failed;
+        returns the new status, or None (nothing written) if the claim was lost
+        """
+
+        def work(conn: sqlite3.Connection):
+            status = QUEUED if attempt < self.max_attempts else FAILED
+            cursor = conn.execute(
+                "UPDATE ingest_jobs SET status = ?, stages = '[]', error = ?, worker_id = NULL, lease_until = NULL, "
+                f"updated_at = ? WHERE job_id = ? AND {LEASE_HOLDER}",
+                (status, error, time.time(), job_id, worker_id, attempt),
+            )
+            return status if cursor.rowcount == 1 else None
+
+        status = self._transaction(work)
+        if status is None:
+            INGEST_JOBS.inc(outcome="lease_lost")
+        else:
+            INGEST_JOBS.inc(outcome="retried" if status == QUEUED else "failed")
+        return status
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Job status as served by the API (no payload)"""
+        row = self._connection().execute(
+            "SELECT job_id, user_id, status, attempts, stages, result, error, enqueued_at, claimed_at, updated_at, "
+            "profile IS NOT NULL AS profiled FROM ingest_jobs WHERE job_id = ?",
+            (job_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            "dream_id": row["job_id"],
+            "user_id": row["user_id"],
+            "status": row["status"],
+            "attempts": row["attempts"],
+            "stages": json.loads(row["stages"]),
+            "result": json.loads(row["result"]) if row["result"] is not None else None,
+            "error": row["error"],
+            "enqueued_at": _iso(row["enqueued_at"]),
+            "claimed_at": _iso(row["claimed_at"]),  # latest attempt
+            "updated_at": _iso(row["updated_at"]),
+            # Span timings of a sampled job (AETHERIA_PROFILING); served with the profile token
+            "profile_url": f"/debug/profile/jobs/{row['job_id']}" if row["profiled"] else None,
+        }
+
+    def changed_since(self, since: float) -> List[Dict[str, Any]]:
+        """Jobs updated after `since` (epoch seconds), oldest change first, with their stages"""
+        rows = self._connection().execute(
+            "SELECT job_id, user_id, status, attempts, stages, error, updated_at FROM ingest_jobs "
+            "WHERE updated_at > ? ORDER BY updated_at",
+            (since,),
+        ).fetchall()
+        return [{**dict(row), "stages": json.loads(row["stages"])} for row in rows]
+
+    def counts(self) -> Dict[str, int]:
+        rows = self._connection().execute("SELECT status, COUNT(*) AS n FROM ingest_jobs GROUP BY status").fetchall()
+        return {status: 0 for status in (QUEUED, RUNNING, SUCCEEDED, FAILED)} | {row["status"]: row["n"] for row in rows}
+
+
+class IngestWorker:
+    """
+    Runs queued jobs on `concurrency` threads; at most that many orchestrations
+    run at once in this worker. `handler(payload)` does the work and returns the
+    JSON-ready result. CloudEvents published for a running job's dream_id are
+    recorded as its completed stages. A heartbeat thread renews the leases of
+    running jobs every lease_seconds / 3, so long orchestrations are not re-run.
+    """
+
+    def __init__(
+        self,
+        queue: IngestJobQueue,
+        handler: Callable[[Dict[str, Any]], Dict[str, Any]],
+        concurrency: int = 2,
+        poll_interval: float = 0.25,
+        worker_id: Optional[str] = None
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.queue = queue
+        self.handler = handler
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:6]}"
+        self._active: Dict[str, int] = {}
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._heartbeat_stop = threading.Event()
+        self._heartbeat_thread: Optional[threading.Thread] = None
+        self._unsubscribe: Optional[Callable[[], None]] = None
+
+    def _on_event(self, event) -> None:
+        dream_id = (event.data or {}).get("dream_id")
+        if dream_id not in self._active:
+            return
+        try:
+            self.queue.record_stage(dream_id, stage_record(event), self.worker_id, self._active[dream_id])
+        except sqlite3.Error as e:
+            logger.warning(f"[INGEST_WORKER] Could not record stage {event.type} for {dream_id}: {e}")
+
+    def run_once(self) -> bool:
+        """Claim and run one job on the calling thread; False if the queue was empty"""
+        job = self.queue.claim(self.worker_id)
+        if job is None:
+            return False
+        job_id, attempt = job["job_id"], job["attempt"]
+        self._active[job_id] = attempt
+        try:
+            # Agent spans (safety, decoder, ...) run on this thread, outside any request profile
+            with profile_job("ingest") as profile:
+                result = self.handler(job["payload"])
+        except Exception as e:
+            self._store_profile(job_id, profile, attempt)
+            status = self.queue.fail(job_id, f"{type(e).__name__}: {e}", self.worker_id, attempt)
+            logger.exception(f"[INGEST_WORKER] Job {job_id} attempt {attempt} failed ({status or 'lease lost'})")
+        else:
+            self._store_profile(job_id, profile, attempt)
+            if not self.queue.complete(job_id, result, self.worker_id, attempt):
+                logger.warning(f"[INGEST_WORKER] Job {job_id} attempt {attempt} lost its lease; result dropped")
+        finally:
+            self._active.pop(job_id, None)
+        return True
+
+    def _store_profile(self, job_id: str, profile: Optional[RequestProfile], attempt: int) -> None:
+        if profile is None:
+            return
+        try:
+            self.queue.record_profile(job_id, profile.to_dict(), self.worker_id, attempt)
+        except sqlite3.Error as e:
+            logger.warning(f"[INGEST_WORKER] Could not store the profile of {job_id}: {e}")
+
+    def _heartbeat_loop(self) -> None:
+        interval = max(self.queue.lease_seconds / 3.0, 0.01)
+        while not self._heartbeat_stop.wait(interval):
+            for job_id, attempt in list(self._active.items()):
+                try:
+                    if not self.queue.heartbeat(job_id, self.worker_id, attempt):
+                        logger.warning(f"[INGEST_WORKER] Job {job_id} attempt {attempt} lost its lease")
+                except sqlite3.Error as e:
+                    logger.warning(f"[INGEST_WORKER] Heartbeat for {job_id} failed: {e}")
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                ran = self.run_once()
+            except sqlite3.Error as e:
+                logger.warning(f"[INGEST_WORKER] Queue error: {e}")
+                ran = False
+            if not ran:
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
+
+    def notify(self) -> None:
+        """A job was just enqueued in this process: skip the rest of the poll interval"""
+        self._wake.set()
+
+    def start(self) -> "IngestWorker":
+        if self._unsubscribe is None:
+            self._unsubscribe = event_publisher.subscribe(self._on_event)
+        self._stop.clear()
+        self._heartbeat_stop.clear()
+        self._heartbeat_thread = threading.Thread(target=self._heartbeat_loop, name="ingest-heartbeat", daemon=True)
+        self._heartbeat_thread.start()
+        self._threads = [
+            threading.Thread(target=self._loop, name=f"ingest-worker-{i}", daemon=True)
+            for i in range(self.concurrency)
+        ]
+        for thread in self._threads:
+            thread.start()
+        logger.info(f"[INGEST_WORKER] {self.worker_id} started with concurrency {self.concurrency}")
+        return self
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop claiming; running jobs finish (a job cut off by exit is re-run after its lease)"""
+        self._stop.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        # Leases are renewed until the running jobs have finished
+        self._heartbeat_stop.set()
+        if self._heartbeat_thread is not None:
+            self._heartbeat_thread.join(timeout)
+            self._heartbeat_thread = None
+        if self._unsubscribe is not None:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+
+def run_ingestion(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Worker handler: the orchestrator workflow plus the growth trigger, as /ingest/dream used to return it"""
+    from apps.backend.src.core.agent_registry import agent_registry
+    from packages.shared_schema.src.schemas import DreamIngestionObject
+
+    dream = DreamIngestionObject.model_validate(payload)
+    result = agent_registry.get("orchestrator").ingest_dream(dream)
+    if result.get("status") == "analyzed":
+        trigger = agent_registry.get("growth_architect").evaluate_engagement_trigger(
+            {"session_count": 1, "last_interaction_days": 0}
+        )
+        result["engagement_trigger"] = trigger
+    return jsonable_encoder(result)
+
+
+_queue: Optional[IngestJobQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> IngestJobQueue:
+    """Process-wide queue on INGEST_QUEUE_PATH"""
+    global _queue
+    if _queue is None:
+        with _queue_lock:
+            if _queue is None:
+                _queue = IngestJobQueue()
+    return _queue
+
+
+# Verification Log
+# - /ingest/dream enqueues here and returns 202; orchestration runs in IngestWorker threads (API-embedded or ingest_worker.py).
+# - SQLite WAL file shared by all processes on the host; claims are BEGIN IMMEDIATE so each job goes to one worker.
+# - Job id = dream_id (idempotent resubmission); a dedupe_key folds duplicates into the unfinished job; leases re-run jobs of crashed workers, max_attempts then failed.
+# - Stages come from CloudEventPublisher.subscribe: every event carrying a running job's dream_id is appended to the row.
+# - Stage/complete/fail writes are fenced on (worker_id, attempt); a heartbeat renews leases of running jobs.
+# - Per-worker concurrency = number of claim threads; enqueue/outcome counts and queue wait exported to /metrics.
+# - Sampled jobs (profile_job) store their agent span timings on the row; job status links them via profile_url.
@@ -0,0 +1,339 @@
+# Verified against Section 9 (Observability) - opt-in request profiling
+
+import hmac
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+from fastapi import FastAPI, Header, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, PlainTextResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from apps.backend.src.core.metrics import STEP_ERRORS, STEP_SECONDS
+
+# AETHERIA_PROFILING=1 enables the middleware, the request header and /debug/profile.
+# AETHERIA_PROFILE_SAMPLE_RATE is the fraction of requests with span timing (0.01 = 1%).
+# AETHERIA_PROFILE_TOKEN guards the client-facing controls: forcing profiling with the header
+# and /debug/profile need it in PROFILE_TOKEN_HEADER; without a token both are refused.
+PROFILING_ENABLED = os.getenv("AETHERIA_PROFILING", "0") == "1"
+PROFILE_TOKEN = os.getenv("AETHERIA_PROFILE_TOKEN", "")
+SAMPLE_RATE = float(os.getenv("AETHERIA_PROFILE_SAMPLE_RATE", "0.01"))
+STACK_INTERVAL_SECONDS = float(os.getenv("AETHERIA_PROFILE_INTERVAL_MS", "5")) / 1000.0
+MAX_STACK_DEPTH = 64
+
+# Per-request override: "spans" (timings only), "stack" (timings + stack sampling) or "off"
+PROFILE_HEADER = "X-Aetheria-Profile"
+PROFILE_TOKEN_HEADER = "X-Aetheria-Profile-Token"
+
+_current_profile: ContextVar[Optional["RequestProfile"]] = ContextVar("aetheria_profile", default=None)
+
+
+class RequestProfile:
+    """Span timings (and optionally sampled stacks) for one request"""
+
+    __slots__ = ("route", "spans", "stack_sampling", "thread_ids", "total_ms", "_open")
+
+    def __init__(self, route: str, stack_sampling: bool = False):
+        self.route = route
+        self.spans: List[tuple] = []  # (path, duration_ms), path = "parent;child"
+        self.stack_sampling = stack_sampling
+        self.thread_ids = {threading.get_ident()}
+        self.total_ms: Optional[float] = None
+        self._open: List[str] = []
+
+    def server_timing(self, total_ms: float) -> str:
+        """Server-Timing header value: top-level spans plus the request total"""
+        entries = [f"{path};dur={duration:.2f}" for path, duration in self.spans if ";" not in path]
+        entries.append(f"total;dur={total_ms:.2f}")
+        return ", ".join(entries)
+
+    def to_dict(self) -> Dict:
+        """Spans in completion order (children before their parent), for storing with a job"""
+        return {
+            "route": self.route,
+            "total_ms": round(self.total_ms or 0.0, 3),
+            "spans": [{"span": path, "ms": round(duration, 3)} for path, duration in self.spans],
+        }
+
+
+@contextmanager
+def span(name: str):
+    """
+    Time a block as a named step: always observed in the step latency metric,
+    and recorded as a span of the current request when it is being profiled.
+    """
+    profile = _current_profile.get()
+    if profile is not None:
+        profile._open.append(name)
+        if profile.stack_sampling:
+            # Sync work may run on a threadpool thread; sample that thread too
+            profile.thread_ids.add(threading.get_ident())
+    started = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        STEP_ERRORS.inc(step=name)
+        raise
+    finally:
+        elapsed = time.perf_counter() - started
+        STEP_SECONDS.observe(elapsed, step=name)
+        if profile is not None:
+            profile.spans.append((";".join(profile._open), elapsed * 1000.0))
+            profile._open.pop()
+
+
+@contextmanager
+def profile_job(kind: str):
+    """
+    Profile one background job (e.g. an ingestion job on an IngestWorker thread),
+    which has no request context for span() to record into. Sampled at
+    AETHERIA_PROFILE_SAMPLE_RATE; yields the RequestProfile (None when not sampled),
+    whose spans are aggregated under the route "job <kind>" once the job is done.
+    """
+    if not PROFILING_ENABLED or random.random() >= SAMPLE_RATE:
+        yield None
+        return
+    profile = RequestProfile(f"job {kind}")
+    token = _current_profile.set(profile)
+    started = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.total_ms = (time.perf_counter() - started) * 1000.0
+        _current_profile.reset(token)
+        profile_store.record(profile, profile.total_ms)
+
+
+class ProfileStore:
+    """Process-wide aggregation of route/span timings and collapsed stacks"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.routes: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0, 0.0])  # count, total_ms, max_ms
+            self.spans: Dict[str, List[float]] = defaultdict(lambda: [0, 0.0, 0.0])
+            self.stacks: Counter = Counter()
+            self.started_at = time.time()
+
+    def record(self, profile: RequestProfile, total_ms: float) -> None:
+        with self._lock:
+            _accumulate(self.routes[profile.route], total_ms)
+            for path, duration in profile.spans:
+                _accumulate(self.spans[f"{profile.route};{path}"], duration)
+
+    def add_stacks(self, stacks: Counter) -> None:
+        with self._lock:
+            self.stacks.update(stacks)
+
+    def summary(self) -> Dict:
+        with self._lock:
+            return {
+                "since": self.started_at,
+                "sample_rate": SAMPLE_RATE,
+                "routes": {name: _stats(values) for name, values in self.routes.items()},
+                "spans": {name: _stats(values) for name, values in self.spans.items()},
+                "stack_samples": sum(self.stacks.values()),
+            }
+
+    def collapsed(self) -> str:
+        """
+        Flame-graph input (flamegraph.pl / speedscope "collapsed" format), one
+        "frame;frame;frame count" line per stack. Span trees are included with
+        microseconds as the count, prefixed "spans;", next to sampled stacks.
+        """
+        with self._lock:
+            lines = [f"{stack} {count}" for stack, count in self.stacks.most_common()]
+            for name, (count, total_ms, _) in self.spans.items():
+                lines.append(f"spans;{name} {int(total_ms * 1000)}")
+        return "\n".join(lines) + "\n"
+
+
+def _accumulate(values: List[float], duration_ms: float) -> None:
+    values[0] += 1
+    values[1] += duration_ms
+    values[2] = max(values[2], duration_ms)
+
+
+def _stats(values: List[float]) -> Dict:
+    count, total_ms, max_ms = values
+    return {
+        "count": int(count),
+        "total_ms": round(total_ms, 3),
+        "mean_ms": round(total_ms / count, 3) if count else 0.0,
+        "max_ms": round(max_ms, 3),
+    }
+
+
+profile_store = ProfileStore()
+
+
+class StackSampler:
+    """
+    Background thread sampling the Python stacks of requests that asked for
+    stack profiling (sys._current_frames every STACK_INTERVAL_SECONDS).
+    Idle (blocked on an Event) whenever no such request is in flight.
+    """
+
+    def __init__(self, store: ProfileStore, interval: float = STACK_INTERVAL_SECONDS):
+        self.store = store
+        self.interval = interval
+        self._active: Dict[int, RequestProfile] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._active[id(profile)] = profile
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="aetheria-stack-sampler", daemon=True)
+                self._thread.start()
+        self._wake.set()
+
+    def stop(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._active.pop(id(profile), None)
+            if not self._active:
+                self._wake.clear()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while True:
+            self._wake.wait()
+            with self._lock:
+                profiles = list(self._active.values())
+            frames = sys._current_frames()
+            samples: Counter = Counter()
+            for profile in profiles:
+                for thread_id in profile.thread_ids:
+                    frame = frames.get(thread_id)
+                    if frame is not None and thread_id != own_id:
+                        samples[_collapse(profile.route, frame)] += 1
+            if samples:
+                self.store.add_stacks(samples)
+            time.sleep(self.interval)
+
+
+def _collapse(route: str, frame) -> str:
+    names = []
+    while frame is not None and len(names) < MAX_STACK_DEPTH:
+        code = frame.f_code
+        names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+        frame = frame.f_back
+    names.append(route)
+    return ";".join(reversed(names))
+
+
+stack_sampler = StackSampler(profile_store)
+
+
+def profile_token_valid(token: Optional[str]) -> bool:
+    """True if `token` is the configured AETHERIA_PROFILE_TOKEN (never when none is configured)"""
+    return bool(PROFILE_TOKEN) and token is not None and hmac.compare_digest(token.encode(), PROFILE_TOKEN.encode())
+
+
+def _profile_mode(request: Request) -> Optional[str]:
+    """None (not profiled), "spans" or "stack" for this request"""
+    override = request.headers.get(PROFILE_HEADER, "").lower()
+    if override in ("stack", "spans"):
+        # Stack sampling stalls every thread: only operators holding the token may force it
+        if profile_token_valid(request.headers.get(PROFILE_TOKEN_HEADER)):
+            return override
+        override = ""
+    if override in ("off", "0"):
+        return None
+    return "spans" if random.random() < SAMPLE_RATE else None
+
+
+class ProfilingMiddleware(BaseHTTPMiddleware):
+    """
+    Profiles a sample of requests: per-route totals, per-agent spans and
+    (on request) sampled stacks. Profiled responses carry a Server-Timing header.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        mode = _profile_mode(request)
+        if mode is None:
+            return await call_next(request)
+
+        profile = RequestProfile(f"{request.method} {request.url.path}", stack_sampling=mode == "stack")
+        token = _current_profile.set(profile)
+        if profile.stack_sampling:
+            stack_sampler.start(profile)
+        started = time.perf_counter()
+        try:
+            response = await call_next(request)
+        finally:
+            total_ms = (time.perf_counter() - started) * 1000.0
+            if profile.stack_sampling:
+                stack_sampler.stop(profile)
+            _current_profile.reset(token)
+
+        # Aggregate by route template (e.g. /api/v1/analyze/{analysis_id}) once routing has matched
+        route = request.scope.get("route")
+        if route is not None:
+            profile.route = f"{request.method} {route.path}"
+        profile_store.record(profile, total_ms)
+        # Keep entries the route set itself (e.g. analysis pipeline timings)
+        existing = response.headers.get("Server-Timing")
+        timing = profile.server_timing(total_ms)
+        response.headers["Server-Timing"] = f"{existing}, {timing}" if existing else timing
+        return response
+
+
+def install_profiling(app: FastAPI) -> bool:
+    """Add the middleware and /debug/profile when AETHERIA_PROFILING=1; returns whether installed"""
+    if not PROFILING_ENABLED:
+        return False
+
+    app.add_middleware(ProfilingMiddleware)
+
+    @app.get("/debug/profile", include_in_schema=False)
+    async def debug_profile(
+        format: str = "json",
+        reset: bool = False,
+        x_aetheria_profile_token: Optional[str] = Header(None)
+    ):
+        """Aggregated timings (json) or flame-graph-compatible collapsed stacks (format=collapsed)"""
+        if not profile_token_valid(x_aetheria_profile_token):
+            raise HTTPException(status_code=403, detail=f"{PROFILE_TOKEN_HEADER} required")
+        if format == "collapsed":
+            response = PlainTextResponse(profile_store.collapsed())
+        else:
+            response = JSONResponse(profile_store.summary())
+        if reset:
+            profile_store.reset()
+        return response
+
+    @app.get("/debug/profile/jobs/{job_id}", include_in_schema=False)
+    async def debug_job_profile(job_id: str, x_aetheria_profile_token: Optional[str] = Header(None)):
+        """Span timings of a profiled ingestion job (stored on the job, whichever worker process ran it)"""
+        from apps.backend.src.core.job_queue import get_job_queue
+
+        if not profile_token_valid(x_aetheria_profile_token):
+            raise HTTPException(status_code=403, detail=f"{PROFILE_TOKEN_HEADER} required")
+        profile = await run_in_threadpool(get_job_queue().get_profile, job_id)
+        if profile is None:
+            raise HTTPException(status_code=404, detail=f"No profile for job {job_id}")
+        return profile
+
+    return True
+
+# Verification Log
+# - Opt-in (AETHERIA_PROFILING=1); requests sampled at AETHERIA_PROFILE_SAMPLE_RATE (default 1%).
+# - X-Aetheria-Profile header forces spans/stack/off per request; profiled responses get Server-Timing.
+# - Forcing spans/stack and /debug/profile require X-Aetheria-Profile-Token = AETHERIA_PROFILE_TOKEN ("off" is free).
+# - span() costs a ContextVar lookup plus one histogram observation when not profiling.
+# - Stack sampler only runs while a stack-profiled request is in flight; output is collapsed-stack format.
+# - Ingestion jobs run on worker threads without a request: profile_job samples them, aggregates their agent
+#   spans under "job ingest" and the worker stores each sampled job's spans on its row (/debug/profile/jobs/{id}).
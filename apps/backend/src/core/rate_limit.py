@@ -0,0 +1,287 @@
+# Verified against Section 8 (Safety & Guardrails) - per-user limits on LLM-backed endpoints
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+import redis
+from fastapi import HTTPException
+
+from apps.backend.src.core.metrics import REDIS_ERRORS, REDIS_ROUND_TRIPS, metrics
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_DECISIONS = metrics.counter(
+    "aetheria_rate_limit_decisions", "Rate limiter decisions per scope", ["scope", "outcome"]
+)
+SINGLE_FLIGHT_CALLS = metrics.counter(
+    "aetheria_single_flight_calls", "Coalescable calls: led (ran the work) or joined (shared a result)", ["scope", "role"]
+)
+
+# Buckets idle long enough to have refilled are forgotten once the table grows past this
+MAX_MEMORY_BUCKETS = 100_000
+
+
+@dataclass(frozen=True)
+class RateDecision:
+    allowed: bool
+    remaining: float
+    retry_after: float  # seconds until one token is available (0 when allowed)
+
+
+class InMemoryTokenBucket:
+    """
+    Token bucket per key in this process: `burst` tokens, refilled at
+    `rate_per_second`. With several workers each enforces its own budget;
+    use RedisTokenBucket for one budget across processes.
+    """
+
+    def __init__(self, rate_per_second: float, burst: float):
+        self.rate = rate_per_second
+        self.burst = burst
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # key -> (tokens, monotonic time of last refill)
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, cost: float = 1.0) -> RateDecision:
+        """Take `cost` tokens if available; a negative cost refunds (capped at burst)"""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            allowed = tokens >= cost
+            if allowed:
+                tokens = min(self.burst, tokens - cost)
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > MAX_MEMORY_BUCKETS:
+                self._prune(now)
+        retry_after = 0.0 if allowed else (cost - tokens) / self.rate
+        return RateDecision(allowed, tokens, retry_after)
+
+    def _prune(self, now: float) -> None:
+        full_after = self.burst / self.rate
+        self._buckets = {key: value for key, value in self._buckets.items() if now - value[1] < full_after}
+
+
+# KEYS[1] bucket hash; ARGV: rate per second, burst, cost (negative refunds). Redis' clock, so all workers agree.
+TOKEN_BUCKET_LUA = """
+redis.replicate_commands()
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+if tokens >= cost then
+    tokens = math.min(burst, tokens - cost)
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisTokenBucket:
+    """
+    Token bucket shared by every worker: one atomic Lua script (EVALSHA) per
+    decision, keys expire once the bucket would be full again. If Redis
+    fails, decisions fall back to a local InMemoryTokenBucket rather than
+    rejecting or waving through everything.
+    """
+
+    def __init__(self, client: "redis.Redis", rate_per_second: float, burst: float, prefix: str = "ratelimit:"):
+        self.client = client
+        self.rate = rate_per_second
+        self.burst = burst
+        self.prefix = prefix
+        self._script = client.register_script(TOKEN_BUCKET_LUA)
+        self._fallback = InMemoryTokenBucket(rate_per_second, burst)
+
+    def acquire(self, key: str, cost: float = 1.0) -> RateDecision:
+        REDIS_ROUND_TRIPS.inc(client="rate_limit", op="evalsha")
+        try:
+            allowed, tokens = self._script(keys=[self.prefix + key], args=[self.rate, self.burst, cost])
+        except redis.exceptions.RedisError as e:
+            REDIS_ERRORS.inc(client="rate_limit", op="evalsha")
+            logger.warning(f"[RATE_LIMIT] Redis unavailable, using local bucket: {e}")
+            return self._fallback.acquire(key, cost)
+        tokens = float(tokens)
+        allowed = bool(int(allowed))
+        return RateDecision(allowed, tokens, 0.0 if allowed else (cost - tokens) / self.rate)
+
+
+_redis_lock = threading.Lock()
+_redis_resolved = False
+_redis: Optional["redis.Redis"] = None
+
+
+def _shared_redis() -> Optional["redis.Redis"]:
+    """Client for RATE_LIMIT_REDIS_URL (or REDIS_URL) if set and reachable; resolved once per process"""
+    global _redis_resolved, _redis
+    with _redis_lock:
+        if not _redis_resolved:
+            _redis_resolved = True
+            url = os.getenv("RATE_LIMIT_REDIS_URL") or os.getenv("REDIS_URL")
+            if url:
+                try:
+                    _redis = redis.Redis.from_url(url, decode_responses=True, socket_connect_timeout=1, socket_timeout=1)
+                    _redis.ping()
+                except (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError):
+                    logger.warning("[RATE_LIMIT] Redis unreachable; rate limits are per process")
+                    _redis = None
+    return _redis
+
+
+class RateLimiter:
+    """
+    Named per-user limit (e.g. "ingest"): `per_minute` sustained, `burst` at once.
+    The backend is chosen on first use (no I/O at import): RedisTokenBucket,
+    shared by all workers, when Redis is configured and reachable, else in-process.
+    """
+
+    def __init__(self, scope: str, per_minute: float, burst: float, backend=None):
+        self.scope = scope
+        self.rate = per_minute / 60.0
+        self.burst = burst
+        self._backend = backend
+        self._backend_lock = threading.Lock()
+
+    @property
+    def backend(self):
+        if self._backend is None:
+            with self._backend_lock:
+                if self._backend is None:
+                    client = _shared_redis()
+                    if client is not None:
+                        self._backend = RedisTokenBucket(client, self.rate, self.burst)
+                    else:
+                        self._backend = InMemoryTokenBucket(self.rate, self.burst)
+        return self._backend
+
+    def check(self, user_key: str, cost: float = 1.0) -> RateDecision:
+        decision = self.backend.acquire(f"{self.scope}:{user_key}", cost)
+        RATE_LIMIT_DECISIONS.inc(scope=self.scope, outcome="allowed" if decision.allowed else "limited")
+        return decision
+
+    def refund(self, user_key: str, cost: float = 1.0) -> None:
+        """Give back tokens taken by an allowed check() whose call did not go ahead"""
+        self.backend.acquire(f"{self.scope}:{user_key}", -cost)
+        RATE_LIMIT_DECISIONS.inc(scope=self.scope, outcome="refunded")
+
+    def enforce(self, user_key: str, cost: float = 1.0) -> RateDecision:
+        """check(), raising 429 with Retry-After when the user is over the limit"""
+        decision = self.check(user_key, cost)
+        if not decision.allowed:
+            retry_after = max(1, int(decision.retry_after + 0.999))
+            raise HTTPException(
+                status_code=429,
+                detail=f"Rate limit exceeded for {self.scope}; retry in {retry_after} s",
+                headers={"Retry-After": str(retry_after)},
+            )
+        return decision
+
+
+def enforce_all(limits: Sequence[Tuple[RateLimiter, str]], cost: float = 1.0) -> None:
+    """
+    Enforce several limits on one call (e.g. per address and per user): the call
+    is charged only if every limit allows it. When a later limit refuses, tokens
+    already taken from the earlier ones are refunded before the 429 is raised, so
+    a rejected call never spends another bucket's budget.
+    """
+    charged = []
+    for limiter, key in limits:
+        try:
+            limiter.enforce(key, cost)
+        except HTTPException:
+            for taken, taken_key in charged:
+                taken.refund(taken_key, cost)
+            raise
+        charged.append((limiter, key))
+
+
+class _Call:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent calls: while `fn` runs for a key, further
+    do(key, ...) calls wait for it and get the same result (or exception)
+    instead of running their own. Nothing is cached once the call returns.
+    Blocking; call it from worker threads (run_in_threadpool in async routes).
+    """
+
+    def __init__(self, scope: str):
+        self.scope = scope
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._calls
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Returns (value, shared): shared is True if the value came from another caller's run"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            SINGLE_FLIGHT_CALLS.inc(scope=self.scope, role="joined")
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value, True
+
+        SINGLE_FLIGHT_CALLS.inc(scope=self.scope, role="led")
+        try:
+            call.value = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.value, False
+
+
+def client_address(request: Any) -> str:
+    """
+    Peer address of a request, the key of per-address limits. Behind a proxy this is
+    the proxy unless uvicorn trusts its forwarded headers (--forwarded-allow-ips);
+    X-Forwarded-For is not read here, since any client can set it.
+    """
+    return request.client.host if request.client is not None else "unknown"
+
+
+def request_key(*parts: Any) -> str:
+    """Stable key for identical requests (hash of the parts, so prompts are not kept as dict keys)"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+# Verification Log
+# - Token buckets keyed by scope + user; user ids are client-supplied, so endpoints also enforce a per-address bucket.
+# - enforce_all charges several buckets only when all allow: a refusal refunds the tokens already taken.
+# - Token buckets: in-process (dict + lock) or Redis (one atomic Lua script, Redis clock).
+# - Redis is used when RATE_LIMIT_REDIS_URL / REDIS_URL is reachable; Redis errors fall back to a local bucket.
+# - Over-limit requests get 429 with Retry-After; decisions counted per scope on /metrics.
+# - SingleFlight shares one in-flight call (one LLM round trip) and its result between identical concurrent requests.
@@ -1,7 +1,7 @@
 # Verified against Section 3 and Phase 1: Persistent models for User and Dream
 
 import uuid
-from sqlalchemy import Column, String, DateTime, JSON, ForeignKey
+from sqlalchemy import Column, String, DateTime, JSON, ForeignKey, Float, Index
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -14,6 +14,10 @@ class User(Base):
     email = Column(String(320), unique=True, nullable=False)
     password_hash = Column(String, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Birth data for DecagonAnalysis (UT); null until the user saves a birth chart
+    birth_datetime = Column(DateTime(timezone=True), nullable=True)
+    birth_latitude = Column(Float, nullable=True)
+    birth_longitude = Column(Float, nullable=True)
 
     dreams = relationship("Dream", back_populates="user")
 
@@ -31,7 +35,22 @@ class Dream(Base):
 
     user = relationship("User", back_populates="dreams")
 
+    __table_args__ = (Index("ix_dreams_user_id_dream_id", "user_id", "dream_id"),)
+
+class DreamAnalysis(Base):
+    """Stored DecagonAnalysisObject per dream (written by backfill_analyses.py)"""
+    __tablename__ = "dream_analyses"
+
+    dream_id = Column(PGUUID(as_uuid=True), ForeignKey("dreams.dream_id"), primary_key=True)
+    analysis_id = Column(String(32), nullable=False)
+    analyzer_version = Column(String(32), nullable=False)
+    analysis = Column(JSON, nullable=False)
+    computed_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (Index("ix_dream_analyses_analyzer_version", "analyzer_version"),)
+
 # Verification Log
 # - Models implement required fields from DreamIngestionObject and user model for auth.
 # - Use UUID PKs and JSON column for biometric_context.
-# - Assumption: archetype linkage stored as string; vector references kept in Pinecone.
\ No newline at end of file
+# - Assumption: archetype linkage stored as string; vector references kept in Pinecone.
+# - Birth data lives on users; dream_analyses keeps one analysis per dream, tagged with the analyzer version.
\ No newline at end of file
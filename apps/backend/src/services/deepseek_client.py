@@ -2,10 +2,13 @@ from __future__ import annotations
 
 import json
 import os
+import time
 import urllib.error
 import urllib.request
 from typing import Any, Dict, List, Optional
 
+from apps.backend.src.core.metrics import DEEPSEEK_LAST_SUCCESS, DEEPSEEK_REQUESTS, DEEPSEEK_SECONDS, DEEPSEEK_TOKENS
+
 
 class DeepSeekClient:
     """Minimal DeepSeek client using the OpenAI-compatible Chat Completions API."""
@@ -32,8 +35,11 @@ class DeepSeekClient:
         temperature: float = 0.3,
         max_tokens: Optional[int] = None,
     ) -> str:
+        """Single chat completion; latency, outcome and token usage are recorded as metrics"""
         if not self.api_key:
             # Offline mode: return deterministic fallback instead of raising exception
+            # Counted, not timed: zero-latency samples would drag the latency histogram down
+            DEEPSEEK_REQUESTS.inc(outcome="offline")
             return "[OFFLINE_MODE] DeepSeek API key not configured. Using deterministic fallback response."
 
         url = f"{self.base_url}/v1/chat/completions"
@@ -56,6 +62,20 @@ class DeepSeekClient:
             method="POST",
         )
 
+        started = time.perf_counter()
+        try:
+            content = self._send(request)
+        except Exception:
+            DEEPSEEK_SECONDS.observe(time.perf_counter() - started, outcome="error")
+            DEEPSEEK_REQUESTS.inc(outcome="error")
+            DEEPSEEK_LAST_SUCCESS.set(0)
+            raise
+        DEEPSEEK_SECONDS.observe(time.perf_counter() - started, outcome="ok")
+        DEEPSEEK_REQUESTS.inc(outcome="ok")
+        DEEPSEEK_LAST_SUCCESS.set(1)
+        return content
+
+    def _send(self, request: urllib.request.Request) -> str:
         try:
             with urllib.request.urlopen(request, timeout=self.timeout_s) as response:
                 raw = response.read().decode("utf-8", errors="replace")
@@ -69,6 +89,11 @@ class DeepSeekClient:
             data = json.loads(raw)
         except json.JSONDecodeError as exc:
             raise RuntimeError(f"DeepSeek response was not valid JSON: {raw[:500]}") from exc
+        usage = data.get("usage") or {}
+        for kind in ("prompt_tokens", "completion_tokens"):
+            if isinstance(usage.get(kind), (int, float)):
+                DEEPSEEK_TOKENS.inc(usage[kind], kind=kind.replace("_tokens", ""))
+
         choices = data.get("choices") or []
         if not choices:
             raise RuntimeError(f"DeepSeek response missing choices: {data}")
@@ -0,0 +1,128 @@
+"""
+Cold-start profile for the backend apps.
+
+Runs fresh interpreters so nothing is already imported:
+  1. `python -X importtime -c "import <app>"`: total import time plus the
+     slowest modules (cumulative and self time)
+  2. import + lifespan startup (analyzer build, ephemeris warm-up) + building
+     every lazily registered agent, each timed separately
+
+Usage:
+    python startup_profile.py [main|main_minimal|mcp_server] [--top 20] [--json]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(os.path.dirname(BACKEND_DIR))
+
+# Runs in the child interpreter; prints one JSON line with phase timings
+_PHASES_SCRIPT = """
+import json, sys, time
+started = time.perf_counter()
+import {module} as app_module
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(app_module.app):
+    ready = time.perf_counter()
+from apps.backend.src.core.agent_registry import agent_registry
+agent_registry.warm()
+print(json.dumps({{
+    "import_ms": (imported - started) * 1000,
+    "lifespan_ms": (ready - imported) * 1000,
+    "agents": agent_registry.stats()["build_ms"],
+}}))
+"""
+
+
+def parse_importtime(stderr: str) -> List[Dict]:
+    """Parse `-X importtime` lines into {module, self_us, cumulative_us, depth}"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_part, cumulative_us, name = line.split("|", 2)
+        self_us = int(self_part.split(":")[1])
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        rows.append({
+            "module": name.strip(),
+            "self_us": self_us,
+            "cumulative_us": int(cumulative_us),
+            "depth": depth,
+        })
+    return rows
+
+
+def profile_imports(module: str) -> List[Dict]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    return parse_importtime(result.stderr)
+
+
+def profile_phases(module: str) -> Dict:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([REPO_ROOT, BACKEND_DIR]))
+    result = subprocess.run(
+        [sys.executable, "-c", _PHASES_SCRIPT.format(module=module)],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"Starting {module} failed:\n{result.stderr[-2000:]}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def build_report(module: str, top: int) -> Dict:
+    rows = profile_imports(module)
+    total = next(row for row in rows if row["module"] == module)
+    return {
+        "module": module,
+        "import_total_ms": total["cumulative_us"] / 1000,
+        "slowest_cumulative": sorted(rows, key=lambda r: r["cumulative_us"], reverse=True)[1:top + 1],
+        "slowest_self": sorted(rows, key=lambda r: r["self_us"], reverse=True)[:top],
+        "phases": profile_phases(module),
+    }
+
+
+def print_report(report: Dict) -> None:
+    print("=" * 80)
+    print(f"STARTUP PROFILE: {report['module']}")
+    print("=" * 80)
+    print(f"Import (importtime total): {report['import_total_ms']:8.1f} ms")
+    phases = report["phases"]
+    print(f"Import (wall clock):       {phases['import_ms']:8.1f} ms")
+    print(f"Lifespan to ready:         {phases['lifespan_ms']:8.1f} ms")
+    for name, build_ms in sorted(phases["agents"].items(), key=lambda item: -item[1]):
+        print(f"  agent {name:<24} {build_ms:8.1f} ms")
+
+    print("\nSlowest imports (cumulative):")
+    for row in report["slowest_cumulative"]:
+        print(f"  {row['cumulative_us'] / 1000:8.1f} ms  {row['module']}")
+    print("\nSlowest imports (self):")
+    for row in report["slowest_self"]:
+        print(f"  {row['self_us'] / 1000:8.1f} ms  {row['module']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import-time and startup profile for backend apps")
+    parser.add_argument("module", nargs="?", default="main", help="main, main_minimal or mcp_server")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report = build_report(args.module, args.top)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
@@ -0,0 +1,68 @@
+# apps/backend/test_aspect_timeline.py
+"""
+Tests for transit-to-natal aspect timelines: enter/exact/exit ordering,
+retrograde multi-pass perfection and the per-window cache
+"""
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from apps.backend.src.agents.aspect_timeline import (
+    EVENT_ENTER_ORB,
+    EVENT_EXACT,
+    EVENT_EXIT_ORB,
+    AspectTimelineInput,
+    _cached_aspect_events,
+    calculate_aspect_timeline,
+)
+from packages.shared_schema.src.schemas import AspectType, Planet
+
+NATAL = {"birth_time_utc": datetime(1990, 5, 15, 3, 30), "latitude": 28.6139, "longitude": 77.2090}
+
+
+def _events(start, end, planet, natal_planet, aspect=AspectType.CONJUNCTION):
+    timeline = calculate_aspect_timeline(AspectTimelineInput(
+        natal_coordinates=NATAL, window_start=start, window_end=end, transit_planets=[planet]
+    ))
+    return [e for e in timeline.events if e.natal_planet == natal_planet and e.aspect_type == aspect]
+
+
+def test_direct_pass_enters_perfects_then_exits():
+    # Solar return: the Sun is never retrograde
+    events = _events(datetime(2026, 4, 1), datetime(2026, 7, 1), Planet.SUN, Planet.SUN)
+    assert [e.event_type for e in events] == [EVENT_ENTER_ORB, EVENT_EXACT, EVENT_EXIT_ORB]
+    assert events[0].julian_day < events[1].julian_day < events[2].julian_day
+    assert events[1].pass_number == 1 and events[1].timestamp.date() == datetime(2026, 5, 14).date()
+
+
+def test_retrograde_loop_perfects_three_times():
+    # Mercury stations retrograde and direct again across natal Mars (Feb-Apr 2026)
+    events = _events(datetime(2026, 2, 1), datetime(2026, 5, 1), Planet.MERCURY, Planet.MARS)
+    exact = [e for e in events if e.event_type == EVENT_EXACT]
+    assert [e.pass_number for e in exact] == [1, 2, 3]
+    assert [e.retrograde for e in exact] == [False, True, False]
+    assert [e.event_type for e in events] == [EVENT_ENTER_ORB, EVENT_EXACT, EVENT_EXIT_ORB] * 3
+    assert all(a.julian_day < b.julian_day for a, b in zip(events, events[1:]))
+
+
+def test_cache_key_is_the_instant():
+    _cached_aspect_events.cache_clear()
+    naive = AspectTimelineInput(
+        natal_coordinates=NATAL, window_start=datetime(2026, 1, 1), window_end=datetime(2026, 2, 1),
+        transit_planets=[Planet.MARS]
+    )
+    first = calculate_aspect_timeline(naive)
+    # Same instants with an offset, and a mixed naive/aware window: one cache entry
+    plus3 = timezone(timedelta(hours=3))
+    aware = naive.model_copy(update={"window_start": datetime(2026, 1, 1, 3, 0, tzinfo=plus3)})
+    second = calculate_aspect_timeline(aware)
+    assert _cached_aspect_events.cache_info().hits == 1
+    assert second.window_start == datetime(2026, 1, 1) and second.events == first.events
+
+    # Callers get copies: mutating a result does not touch the cache
+    second.events[0].transit_longitude = -1.0
+    assert calculate_aspect_timeline(naive).events[0].transit_longitude == first.events[0].transit_longitude
+    longer = calculate_aspect_timeline(naive.model_copy(update={"orb_degrees": 5.0}))
+    assert _cached_aspect_events.cache_info().misses == 2 and len(longer.events) >= len(first.events)
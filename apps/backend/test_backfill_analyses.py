@@ -0,0 +1,76 @@
+# apps/backend/test_backfill_analyses.py
+"""
+Tests for the analysis backfill: in-order writes and checkpoints, failure
+accounting, and the keyset-resumed dream stream
+"""
+import asyncio
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import backfill_analyses
+from backfill_analyses import analyze_batch, process, stream_query
+from analysis_engine import DecagonAnalyzer
+
+
+def _row(user: str, dream: str, content: str = "I saw a black serpent", lat: float = 28.6139):
+    return (dream, user, content, datetime(2026, 1, 3, 6, 45), datetime(1990, 5, 15, 3, 30), lat, 77.2090)
+
+
+def test_process_writes_in_stream_order(monkeypatch):
+    rows = [_row("u1", "d1"), _row("u1", "d2"), _row("u2", "d3", "bad"), _row("u2", "d4"), _row("u3", "d5")]
+
+    def fake_batch(batch):
+        # Earlier batches finish last: writes must still follow the stream
+        time.sleep(0.05 if batch[0][0] == "d1" else 0)
+        written = [{"dream_id": row[0]} for row in batch if row[2] != "bad"]
+        failed = [(row[0], "ValueError: bad") for row in batch if row[2] == "bad"]
+        return written, failed
+
+    monkeypatch.setattr(backfill_analyses, "analyze_batch", fake_batch)
+    writes, checkpoints, failures = [], [], []
+
+    async def stream():
+        for row in rows:
+            yield row
+
+    async def write(written):
+        writes.append([params["dream_id"] for params in written])
+
+    def on_progress(batch, failed):
+        checkpoints.append((batch[-1][1], batch[-1][0]))
+        failures.extend(failed)
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        asyncio.run(process(stream(), write, pool, batch_size=2, max_in_flight=3, on_progress=on_progress))
+
+    assert writes == [["d1", "d2"], ["d4"], ["d5"]]
+    assert checkpoints == [("u1", "d2"), ("u2", "d4"), ("u3", "d5")]
+    assert failures == [("d3", "ValueError: bad")]
+
+
+def test_analyze_batch_reports_failed_rows():
+    written, failed = analyze_batch([_row("u1", "d1"), _row("u2", "d2", lat=89.9)])
+    assert [params["dream_id"] for params in written] == ["d1"]
+    assert written[0]["analyzer_version"] == DecagonAnalyzer().version
+    assert "pipeline" not in json.loads(written[0]["analysis"])
+    assert [dream_id for dream_id, _ in failed] == ["d2"]
+
+
+def test_stream_query_resume_and_version_skip():
+    sql, params = stream_query(None, recompute_all=False, limit=None)
+    assert "(d.user_id, d.dream_id) >" not in sql and "LIMIT" not in sql
+    assert "a.analyzer_version IS DISTINCT FROM :version" in sql
+    assert params == {"version": DecagonAnalyzer().version}
+
+    sql, params = stream_query(["u2", "d4"], recompute_all=True, limit=10)
+    assert "(d.user_id, d.dream_id) > (CAST(:after_user AS uuid), CAST(:after_dream AS uuid))" in sql
+    assert "analyzer_version IS DISTINCT" not in sql
+    assert sql.index("ORDER BY d.user_id, d.dream_id") < sql.index("LIMIT :limit")
+    assert (params["after_user"], params["after_dream"], params["limit"]) == ("u2", "d4", 10)
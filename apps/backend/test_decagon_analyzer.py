@@ -12,6 +12,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../packages/shared-s
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'services'))
 
 from analysis_engine import DecagonAnalyzer
+from schemas import DecagonAnalysisObject
 
 def test_decagon_analysis():
     """Test the complete analysis pipeline"""
@@ -138,5 +139,83 @@ def test_decagon_analysis():
         return None
 
 
+def test_sparse_fields_match_full_analysis():
+    """fields= computes the same dimensions as the full analysis, with fewer ephemeris calls"""
+    from time_keeper import get_ephemeris_call_count
+
+    analyzer = DecagonAnalyzer()
+    args = ("I saw a black serpent", datetime(1990, 5, 15, 3, 30), 28.6139, 77.2090, datetime(2026, 1, 3, 6, 45), "user")
+    full = analyzer.analyze(*args).model_dump()
+
+    sparse = analyzer.analyze_fields(*args, fields=["firdaria_phase", "nakshatra_snapshot"])
+    assert list(sparse) == ["analysis_id", "timestamp", "nakshatra_snapshot", "firdaria_phase"]
+    assert sparse["analysis_id"] == full["analysis_id"]
+    assert sparse["nakshatra_snapshot"].model_dump() == full["nakshatra_snapshot"]
+    assert sparse["firdaria_phase"].model_dump() == full["firdaria_phase"]
+
+    # A fresh dream time: Moon for the nakshatra, natal Sun for the birth sect (firdaria) - no full sweep
+    calls_before = get_ephemeris_call_count()
+    analyzer.analyze_fields(*args[:4], datetime(2026, 1, 3, 7, 45), "user", fields=["nakshatra_snapshot", "firdaria_phase"])
+    assert get_ephemeris_call_count() - calls_before == 2
+
+
+def test_pipeline_workers_and_day_cache():
+    """Thread-pool builds match inline builds; per-day dimensions are reused within the UT day"""
+    args = ("I saw a black serpent", datetime(1990, 5, 15, 3, 30), 28.6139, 77.2090, datetime(2026, 1, 3, 6, 45), "user")
+    inline = DecagonAnalyzer(workers=0).analyze(*args)
+    pooled, pipeline = DecagonAnalyzer(workers=4).analyze_with_timings(*args)
+    assert DecagonAnalyzer.DIMENSIONS.keys() <= pooled.keys()
+    assert DecagonAnalysisObject(**pooled) == inline
+    assert pipeline["workers"] == 4
+    assert list(pipeline["dimensions"]) == list(DecagonAnalyzer.DIMENSIONS)
+
+    # A per-day hit is the same value a fresh build gives (no clock reads in the dasha)
+    analyzer = DecagonAnalyzer()
+    first, _ = analyzer.analyze_with_timings(*args, fields=["dasha_period"])
+    later, pipeline = analyzer.analyze_with_timings(*args[:4], datetime(2026, 1, 3, 22, 0), "user", fields=["dasha_period"])
+    assert pipeline["dimensions"]["dasha_period"]["cache"] == "hit"
+    fresh = DecagonAnalyzer().analyze_fields(*args[:4], datetime(2026, 1, 3, 22, 0), "user", fields=["dasha_period"])
+    assert later["dasha_period"] == fresh["dasha_period"] == first["dasha_period"]
+    assert first["dasha_period"].start_date < datetime(2026, 1, 3) < first["dasha_period"].end_date
+    _, pipeline = analyzer.analyze_with_timings(*args[:4], datetime(2026, 1, 4, 0, 30), "user", fields=["dasha_period"])
+    assert pipeline["dimensions"]["dasha_period"]["cache"] == "miss"
+
+
+def test_firdaria_phase_matches_period_calendar():
+    """The analysis sub-period is the calendar period containing the dream (natal sect, cached timeline)"""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+    from apps.backend.routes.analysis_routes import router
+
+    args = ("I saw a black serpent", datetime(1990, 5, 15, 3, 30), 28.6139, 77.2090, datetime(2026, 1, 3, 6, 45), "user")
+    phase = DecagonAnalyzer().analyze_fields(*args, fields=["firdaria_phase"])["firdaria_phase"]
+
+    app = FastAPI()
+    app.include_router(router)
+    response = TestClient(app).get("/api/v1/firdaria/periods", params={
+        "birth_datetime": "1990-05-15T09:00:00+05:30",
+        "birth_latitude": 28.6139,
+        "birth_longitude": 77.2090,
+        "start": "2026-01-03T06:45:00",
+        "end": "2026-01-03T06:46:00",
+    })
+    assert response.status_code == 200
+    [period] = response.json()["periods"]
+    assert period["ruling_planet"] == phase.ruling_planet.value
+    assert period["sub_planet"] == phase.sub_period_lord.value
+
+    majors = TestClient(app).get("/api/v1/firdaria/periods", params={
+        "birth_datetime": "1990-05-15T03:30:00",
+        "birth_latitude": 28.6139,
+        "birth_longitude": 77.2090,
+        "start": "2026-01-03T06:45:00",
+        "end": "2026-01-03T06:46:00",
+        "sub_periods": False,
+    }).json()["periods"]
+    assert [(p["start_age"], p["end_age"]) for p in majors] == [(phase.start_age, phase.end_age)]
+
+
 if __name__ == "__main__":
     test_decagon_analysis()
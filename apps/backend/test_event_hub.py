@@ -0,0 +1,69 @@
+# apps/backend/test_event_hub.py
+"""
+Tests for the WebSocket event hub: cross-thread publish, burst coalescing,
+duplicate suppression and backpressure on slow clients
+"""
+import asyncio
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from apps.backend.src.core.cloud_events import CloudEventPublisher
+from apps.backend.src.core.event_hub import EventHub, SlowConsumerError
+
+
+def test_coalesce_dedupe_and_thread_publish():
+    async def scenario():
+        hub = EventHub(coalesce_seconds=0.02, max_pending=8)
+        subscription = hub.connect("u1")
+        other_dream = hub.connect("u1", dream_id="d2")
+        publisher = CloudEventPublisher()
+        publisher.subscribe(hub.on_cloud_event)
+
+        def worker():
+            publisher.publish_dream_logged("d1", "u1")
+            publisher.publish_narrative_synthesized("d1", "u1")
+            publisher.publish_dream_logged("d1", "nobody-connected")
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        frames = []
+
+        async def send(frame):
+            frames.append(frame)
+            # The relay delivering an event already pushed is ignored
+            hub.publish("u1", frame["events"][0])
+            subscription.close()
+
+        await hub.stream(subscription, send)
+        assert len(frames) == 1 and frames[0]["dropped"] == 0
+        assert [e["stage"] for e in frames[0]["events"]] == ["dream.logged", "narrative.synthesized"]
+        assert not other_dream.pending
+
+    asyncio.run(scenario())
+
+
+def test_slow_client_drops_oldest_then_closes():
+    async def scenario():
+        hub = EventHub(coalesce_seconds=0, max_pending=3, send_timeout=0.05)
+        subscription = hub.connect("u1")
+        for i in range(5):
+            hub.publish("u1", {"type": "stage", "dream_id": "d1", "event_id": str(i)})
+        assert [e["event_id"] for e in subscription.pending] == ["2", "3", "4"] and subscription.dropped == 2
+
+        async def stalled(frame):
+            await asyncio.sleep(1)
+        try:
+            await hub.stream(subscription, stalled)
+        except SlowConsumerError:
+            pass
+        else:
+            raise AssertionError("stalled client was not cut off")
+        hub.disconnect(subscription)
+        hub.disconnect(subscription)
+        assert hub.stats() == {"users": 0, "connections": 0}
+
+    asyncio.run(scenario())
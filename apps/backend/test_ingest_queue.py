@@ -0,0 +1,108 @@
+# apps/backend/test_ingest_queue.py
+"""
+Tests for the durable ingestion queue: idempotent enqueue, retries,
+lease expiry and fencing, stage recording from CloudEvents and sampled
+job profiles
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from apps.backend.src.core.cloud_events import event_publisher
+from apps.backend.src.core.job_queue import FAILED, QUEUED, SUCCEEDED, IngestJobQueue, IngestWorker
+
+
+def test_retry_lease_and_idempotent_enqueue(tmp_path):
+    queue = IngestJobQueue(str(tmp_path / "queue.sqlite3"), lease_seconds=60, max_attempts=2)
+    job, created = queue.enqueue("d1", "u1", {"content_raw": "a"})
+    assert created and job["status"] == QUEUED
+    assert queue.enqueue("d1", "u1", {"content_raw": "changed"}) == (job, False)
+
+    assert queue.claim("w1")["payload"] == {"content_raw": "a"}
+    assert queue.claim("w2") is None
+    assert queue.fail("d1", "boom", "w1", 1) == QUEUED
+
+    # Second attempt's worker dies: the lease lapses and max_attempts is spent
+    assert queue.claim("w1")["attempt"] == 2
+    queue.lease_seconds = -1
+    assert queue.record_stage("d1", {"stage": "dream.logged"}, "w1", 2)
+    assert queue.claim("w2") is None
+    assert queue.get("d1")["status"] == FAILED
+
+
+def test_writes_fenced_to_current_claim(tmp_path):
+    queue = IngestJobQueue(str(tmp_path / "queue.sqlite3"), lease_seconds=-1, max_attempts=3)
+    queue.enqueue("d1", "u1", {})
+    queue.claim("w1")
+    # w1 stalls past its lease; w2 takes over
+    assert queue.claim("w2")["attempt"] == 2
+    queue.lease_seconds = 60
+    assert not queue.heartbeat("d1", "w1", 1) and queue.heartbeat("d1", "w2", 2)
+    assert not queue.record_stage("d1", {"stage": "dream.logged"}, "w1", 1)
+    assert not queue.complete("d1", {"from": "w1"}, "w1", 1)
+    assert queue.fail("d1", "late", "w1", 1) is None
+    assert queue.get("d1")["status"] == "running" and queue.get("d1")["stages"] == []
+    assert queue.complete("d1", {"from": "w2"}, "w2", 2)
+    assert queue.get("d1")["result"] == {"from": "w2"}
+
+
+def test_worker_records_stages(tmp_path):
+    queue = IngestJobQueue(str(tmp_path / "queue.sqlite3"))
+    queue.enqueue("d2", "u2", {"dream_id": "d2"})
+
+    def handler(payload):
+        event_publisher.publish_dream_logged(payload["dream_id"], "u2")
+        event_publisher.publish_dream_logged("someone-else", "u3")
+        event_publisher.publish_narrative_synthesized(payload["dream_id"], "u2")
+        return {"status": "analyzed"}
+
+    worker = IngestWorker(queue, handler, concurrency=1)
+    unsubscribe = event_publisher.subscribe(worker._on_event)
+    try:
+        assert worker.run_once() and not worker.run_once()
+    finally:
+        unsubscribe()
+
+    job = queue.get("d2")
+    assert job["status"] == SUCCEEDED and job["result"] == {"status": "analyzed"}
+    assert [stage["stage"] for stage in job["stages"]] == ["dream.logged", "narrative.synthesized"]
+
+
+def test_worker_profiles_agent_spans(tmp_path, monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from apps.backend.src.core import job_queue, profiling
+
+    monkeypatch.setattr(profiling, "PROFILING_ENABLED", True)
+    monkeypatch.setattr(profiling, "PROFILE_TOKEN", "secret")
+    monkeypatch.setattr(profiling, "SAMPLE_RATE", 1.0)
+    queue = IngestJobQueue(str(tmp_path / "queue.sqlite3"))
+    monkeypatch.setattr(job_queue, "_queue", queue)
+    queue.enqueue("d3", "u3", {})
+    profiling.profile_store.reset()
+
+    def handler(payload):
+        with profiling.span("safety"):
+            with profiling.span("llm"):
+                pass
+        return {"status": "analyzed"}
+
+    assert IngestWorker(queue, handler, concurrency=1).run_once()
+    assert queue.get("d3")["profile_url"] == "/debug/profile/jobs/d3"
+    assert "job ingest;safety;llm" in profiling.profile_store.summary()["spans"]
+
+    app = FastAPI()
+    profiling.install_profiling(app)
+    client = TestClient(app)
+    assert client.get("/debug/profile/jobs/d3").status_code == 403
+    profile = client.get("/debug/profile/jobs/d3", headers={profiling.PROFILE_TOKEN_HEADER: "secret"}).json()
+    assert [span["span"] for span in profile["spans"]] == ["safety;llm", "safety"]
+    assert profile["route"] == "job ingest" and profile["total_ms"] >= profile["spans"][1]["ms"]
+
+    # Unsampled jobs store nothing
+    monkeypatch.setattr(profiling, "SAMPLE_RATE", 0.0)
+    queue.enqueue("d4", "u4", {})
+    assert IngestWorker(queue, handler, concurrency=1).run_once()
+    assert queue.get("d4")["profile_url"] is None
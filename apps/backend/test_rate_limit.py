@@ -0,0 +1,90 @@
+# apps/backend/test_rate_limit.py
+"""
+Tests for per-user token buckets (in-memory, Redis fallback) and
+single-flight coalescing of identical in-flight calls
+"""
+import os
+import sys
+import threading
+
+import pytest
+import redis
+from fastapi import HTTPException
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from apps.backend.src.core import rate_limit
+from apps.backend.src.core.rate_limit import InMemoryTokenBucket, RateLimiter, RedisTokenBucket, SingleFlight, enforce_all
+
+
+def test_token_bucket_per_user_and_redis_fallback():
+    limiter = RateLimiter("ingest", per_minute=60, burst=2, backend=InMemoryTokenBucket(1.0, 2))
+    assert limiter.check("alice").allowed and limiter.check("alice").allowed
+    blocked = limiter.check("alice")
+    assert not blocked.allowed and 0 < blocked.retry_after <= 1.0
+    assert limiter.check("bob").allowed
+
+    class DownRedis:
+        def register_script(self, script):
+            def run(keys, args):
+                raise redis.exceptions.ConnectionError("down")
+            return run
+
+    bucket = RedisTokenBucket(DownRedis(), rate_per_second=1.0, burst=1)
+    assert bucket.acquire("k").allowed and not bucket.acquire("k").allowed
+
+
+def test_enforce_all_charges_only_when_every_limit_allows():
+    address = RateLimiter("address", per_minute=60, burst=2, backend=InMemoryTokenBucket(1e-6, 2))
+    user = RateLimiter("user", per_minute=60, burst=1, backend=InMemoryTokenBucket(1e-6, 1))
+    enforce_all([(address, "10.0.0.1"), (user, "alice")])
+
+    # alice is out of tokens: the address token taken for her refused call is given back
+    for _ in range(3):
+        with pytest.raises(HTTPException) as refused:
+            enforce_all([(address, "10.0.0.1"), (user, "alice")])
+        assert refused.value.status_code == 429
+    enforce_all([(address, "10.0.0.1"), (user, "bob")])
+    assert not address.check("10.0.0.1").allowed
+
+    # Refunds never lift a bucket past its burst
+    bucket = InMemoryTokenBucket(1.0, 2)
+    bucket.acquire("k", -5)
+    assert bucket.acquire("k").remaining == 1
+
+
+def test_single_flight_shares_one_call(monkeypatch):
+    flights = SingleFlight("test")
+    calls = []
+    # The leader's call and the four joiners meet here, so the call only
+    # returns once every other caller is waiting for its result
+    arrived = threading.Barrier(5, timeout=5)
+
+    class JoinAwareEvent(threading.Event):
+        def wait(self, timeout=None):
+            arrived.wait()
+            return super().wait(timeout)
+
+    class TracedCall(rate_limit._Call):
+        def __init__(self):
+            super().__init__()
+            self.done = JoinAwareEvent()
+
+    monkeypatch.setattr(rate_limit, "_Call", TracedCall)
+
+    def slow_llm_call():
+        calls.append(1)
+        arrived.wait()
+        return {"archetype": "shadow"}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(flights.do("same", slow_llm_call))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert [value for value, _ in results] == [{"archetype": "shadow"}] * 5
+    assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+    assert not flights.in_flight("same")
@@ -0,0 +1,71 @@
+# apps/backend/test_response_encoding.py
+"""
+Tests for response content negotiation (JSON / MessagePack), per-encoding
+ETags and the Vary header on analysis responses
+"""
+import os
+import sys
+
+import msgpack
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'services'))
+
+from response_encoding import ETAG_VARIANTS, JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, encode, negotiate
+from result_cache import etag_for, etag_matches
+
+
+def test_negotiate_honours_quality_values():
+    assert negotiate(None) == JSON_MEDIA_TYPE
+    assert negotiate("application/msgpack") == MSGPACK_MEDIA_TYPE
+    assert negotiate("application/json;q=1, application/msgpack;q=0.5") == JSON_MEDIA_TYPE
+    assert negotiate("application/json;q=0.5, application/x-msgpack") == MSGPACK_MEDIA_TYPE
+    assert negotiate("*/*, application/msgpack;q=0.9") == JSON_MEDIA_TYPE
+    assert negotiate("application/msgpack;q=0") == JSON_MEDIA_TYPE
+
+    body, media_type = encode('{"analysis_id":"DEC-1","values":[1.5,2]}', MSGPACK_MEDIA_TYPE)
+    assert media_type == MSGPACK_MEDIA_TYPE
+    assert msgpack.unpackb(body) == {"analysis_id": "DEC-1", "values": [1.5, 2]}
+
+
+def test_etag_variant_per_encoding():
+    msgpack_variant = ETAG_VARIANTS[MSGPACK_MEDIA_TYPE]
+    assert etag_for("DEC-1", msgpack_variant) == '"DEC-1-msgpack"'
+    assert etag_matches('"DEC-1-msgpack"', "DEC-1", msgpack_variant)
+    assert etag_matches('W/"DEC-0", "DEC-1-msgpack"', "DEC-1", msgpack_variant)
+    # A JSON validator must not revalidate the MessagePack body, and vice versa
+    assert not etag_matches('"DEC-1"', "DEC-1", msgpack_variant)
+    assert not etag_matches('"DEC-1-msgpack"', "DEC-1", ETAG_VARIANTS[JSON_MEDIA_TYPE])
+    assert etag_matches("*", "DEC-1", msgpack_variant)
+
+
+def test_responses_vary_on_accept():
+    from apps.backend.routes.analysis_routes import router
+
+    app = FastAPI()
+    app.include_router(router)
+    client = TestClient(app)
+    body = {
+        "dream_content": "I saw a black serpent",
+        "user_id": "550e8400-e29b-41d4-a716-446655440000",
+        "birth_datetime": "1990-05-15T03:30:00Z",
+        "birth_latitude": 28.6139,
+        "birth_longitude": 77.2090,
+        "dream_datetime": "2026-01-03T06:45:00Z",
+    }
+    as_json = client.post("/api/v1/analyze", json=body)
+    as_msgpack = client.post("/api/v1/analyze", json=body, headers={"Accept": MSGPACK_MEDIA_TYPE})
+    assert as_json.headers["vary"] == as_msgpack.headers["vary"] == "Accept"
+    assert as_msgpack.headers["content-type"] == MSGPACK_MEDIA_TYPE
+    assert as_msgpack.headers["etag"] == as_json.headers["etag"][:-1] + '-msgpack"'
+    assert msgpack.unpackb(as_msgpack.content) == as_json.json()
+
+    # The JSON ETag does not turn a MessagePack request into a 304
+    revalidated = client.post(
+        "/api/v1/analyze", json=body, headers={"Accept": MSGPACK_MEDIA_TYPE, "If-None-Match": as_json.headers["etag"]}
+    )
+    assert revalidated.status_code == 200
+    not_modified = client.post("/api/v1/analyze", json=body, headers={"If-None-Match": as_json.headers["etag"]})
+    assert not_modified.status_code == 304 and not_modified.headers["vary"] == "Accept"
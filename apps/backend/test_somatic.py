@@ -0,0 +1,67 @@
+# apps/backend/test_somatic.py
+"""
+Tests for the RR-interval HRV pipeline
+"""
+import sys
+import os
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+# Add packages to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../packages/shared-schema/src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'services'))
+
+from analysis_engine import DecagonAnalyzer
+from somatic import HRVAccumulator, NoValidBeatsError, SNAPSHOT_POINTS, decode_rr, encode_rr, summarize_rr
+
+
+def _recording(beats: int = 20000, seed: int = 7) -> np.ndarray:
+    """~0.1 Hz (LF) and ~0.25 Hz (HF) modulation of a 900 ms rhythm, plus three artifacts"""
+    index = np.arange(beats)
+    rr = 900 + 40 * np.sin(0.2 * np.pi * index * 0.9) + 25 * np.sin(0.5 * np.pi * index * 0.9)
+    rr += np.random.default_rng(seed).normal(0, 5, beats)
+    rr[[50, 5000, 12000]] = [3000.0, 200.0, 1500.0]
+    return rr
+
+
+def test_time_and_frequency_domain_metrics():
+    rr = _recording()
+    summary = summarize_rr(rr)
+
+    assert summary.beats + summary.rejected == rr.size
+    assert summary.rejected >= 3
+    clean = np.delete(rr, [50, 51, 5000, 5001, 12000, 12001])
+    assert abs(summary.sdnn_ms - clean.std(ddof=1)) < 0.5
+    assert abs(summary.heart_rate_avg - 60000.0 / clean.mean()) < 0.1
+    assert summary.lf_hf > 1.0  # the LF component is the stronger one
+    assert 600 < summary.lf_ms2 < 900  # 40 ms amplitude -> ~800 ms^2
+    assert len(summary.series) == SNAPSHOT_POINTS
+    assert all(0.85 < value < 0.95 for value in summary.series)
+
+
+def test_chunked_bytes_match_single_pass():
+    rr = _recording()
+    payload = encode_rr(rr, "f32")
+    assert np.allclose(decode_rr(payload, "f32"), rr, atol=1e-3)
+
+    accumulator = HRVAccumulator()
+    for start in range(0, len(payload), 4093):  # odd chunk size splits samples across chunks
+        accumulator.add_bytes(payload[start:start + 4093], "f32")
+    assert not accumulator.has_pending_bytes
+
+    streamed = accumulator.summary()
+    whole = summarize_rr(decode_rr(payload, "f32"))
+    assert streamed.biometric_context() == whole.biometric_context()
+    assert streamed.series == whole.series
+
+
+def test_recording_of_only_artifacts_is_rejected():
+    assert summarize_rr(np.array([100.0, 100.0])).beats == 0
+    analyzer = DecagonAnalyzer()
+    args = ("I saw a black serpent", datetime(1990, 5, 15, 3, 30), 28.6139, 77.2090, datetime(2026, 1, 3, 6, 45), "user")
+    with pytest.raises(NoValidBeatsError):
+        analyzer.analyze(*args, rr_intervals=np.array([100.0, 100.0]))
+    # Dimensions that do not read the recording are unaffected
+    assert analyzer.analyze_fields(*args, fields=["firdaria_phase"], rr_intervals=np.array([100.0, 100.0]))
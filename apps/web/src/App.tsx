@@ -11,6 +11,20 @@ type DreamIngestionObject = {
   content_raw: string
 }
 
+type IngestJobAccepted = {
+  status: string
+  dream_id: string
+  coalesced: boolean
+  status_url: string
+}
+
+type IngestJob = {
+  status: 'queued' | 'running' | 'succeeded' | 'failed'
+  stages: { stage: string }[]
+  result: IngestDreamResponse | null
+  error: string | null
+}
+
 type IngestDreamResponse = {
   status?: string
   archetype?: unknown
@@ -24,7 +38,49 @@ function makeDreamId(): string {
   if (typeof crypto !== 'undefined' && 'randomUUID' in crypto) {
     return crypto.randomUUID()
   }
-  return '00000000-0000-4000-8000-000000000000'
+  // randomUUID is missing outside secure contexts; build a v4 UUID from getRandomValues
+  const bytes = crypto.getRandomValues(new Uint8Array(16))
+  bytes[6] = (bytes[6] & 0x0f) | 0x40
+  bytes[8] = (bytes[8] & 0x3f) | 0x80
+  const hex = Array.from(bytes, (b) => b.toString(16).padStart(2, '0')).join('')
+  return `${hex.slice(0, 8)}-${hex.slice(8, 12)}-${hex.slice(12, 16)}-${hex.slice(16, 20)}-${hex.slice(20)}`
+}
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms))
+
+async function fetchIngestJob(apiBaseUrl: string, statusUrl: string): Promise<IngestJob> {
+  const resp = await fetch(`${apiBaseUrl}${statusUrl}`)
+  const job = (await resp.json()) as IngestJob
+  if (!resp.ok) throw new Error(JSON.stringify(job))
+  return job
+}
+
+// Fallback when the event socket cannot be opened: poll the job until it finishes
+async function pollIngestJob(apiBaseUrl: string, statusUrl: string): Promise<IngestJob> {
+  for (;;) {
+    const job = await fetchIngestJob(apiBaseUrl, statusUrl)
+    if (job.status === 'succeeded' || job.status === 'failed') return job
+    await sleep(1000)
+  }
+}
+
+// Stage events for one dream are pushed on /events/ws; resolves when its job ends
+function openDreamEvents(apiBaseUrl: string, userId: string, dreamId: string) {
+  const wsUrl = `${apiBaseUrl.replace(/^http/, 'ws')}/events/ws?user_id=${userId}&dream_id=${dreamId}`
+  const socket = new WebSocket(wsUrl)
+  const opened = new Promise<void>((resolve, reject) => {
+    socket.onopen = () => resolve()
+    socket.onerror = () => reject(new Error('event socket unavailable'))
+  })
+  const finished = new Promise<void>((resolve, reject) => {
+    socket.onmessage = (message) => {
+      const frame = JSON.parse(message.data) as { events: { type: string }[]; dropped: number }
+      if (frame.dropped > 0 || frame.events.some((event) => event.type === 'job')) resolve()
+    }
+    socket.onclose = () => reject(new Error('event socket closed'))
+  })
+  finished.catch(() => undefined)
+  return { opened, finished, close: () => socket.close() }
 }
 
 function App() {
@@ -51,6 +107,10 @@ function App() {
       content_raw: dreamText,
     }
 
+    // Subscribe before queueing so no stage event is missed
+    const events = openDreamEvents(apiBaseUrl, dream.user_id, dream.dream_id)
+    const pushed = await events.opened.then(() => true, () => false)
+
     try {
       const resp = await fetch(`${apiBaseUrl}/ingest/dream`, {
         method: 'POST',
@@ -58,17 +118,28 @@ function App() {
         body: JSON.stringify(dream),
       })
 
-      const data = (await resp.json()) as IngestDreamResponse
+      const data = (await resp.json()) as IngestJobAccepted
       if (!resp.ok) {
         setError(typeof data === 'object' ? JSON.stringify(data) : String(data))
         return
       }
 
-      setResult(data)
+      // A coalesced submission follows another dream_id than the one subscribed to
+      const done = pushed && !data.coalesced && (await events.finished.then(() => true, () => false))
+      const job = done
+        ? await fetchIngestJob(apiBaseUrl, data.status_url)
+        : await pollIngestJob(apiBaseUrl, data.status_url)
+      if (job.status === 'failed' || !job.result) {
+        setError(job.error ?? 'Dream analysis failed')
+        return
+      }
+
+      setResult(job.result)
       setView('analysis')
     } catch (e) {
       setError(e instanceof Error ? e.message : String(e))
     } finally {
+      events.close()
       setIsSubmitting(false)
     }
   }
@@ -12,6 +12,7 @@ class SleepPhase(str, Enum):
     NREM1 = "NREM1"
     NREM2 = "NREM2"
     NREM3 = "NREM3"
+    WAKE = "WAKE"
 
 # Section 3.1: Input modality types
 class InputModality(str, Enum):
@@ -128,6 +129,7 @@ class DreamIngestionObject(BaseModel):
     input_modality: InputModality = Field(description="Source of the input data.")
     content_raw: str = Field(description="Unprocessed user narrative.")
     biometric_context: Optional[BiometricContext] = Field(None, description="Correlated health data from Apple HealthKit.")
+    biometric_session_id: Optional[UUID] = Field(None, description="Overnight biometric upload session; fills timestamp_experience from its last REM window.")
 
     class Config:
         json_encoders = {
@@ -265,6 +267,7 @@ class DigitalDoppelganger(BaseModel):
 class FirdariaPhase(BaseModel):
     """Persian Firdaria planetary period"""
     ruling_planet: Planet = Field(description="Current Firdaria lord")
+    sub_period_lord: Optional[Planet] = Field(None, description="Current sub-period lord (nodal periods are undivided)")
     start_age: float = Field(description="Start age of this period")
     end_age: float = Field(description="End age of this period")
     current_phase: bool = Field(description="Whether this is the active period")
@@ -3,7 +3,7 @@
 import { z } from 'zod';
 
 // Assumption: Same enums as Python version
-export const SleepPhaseEnum = z.enum(['REM', 'NREM1', 'NREM2', 'NREM3']);
+export const SleepPhaseEnum = z.enum(['REM', 'NREM1', 'NREM2', 'NREM3', 'WAKE']);
 export const ArchetypeIdEnum = z.enum(['SELF', 'SHADOW', 'ANIMA', 'ANIMUS', 'PERSONA', 'HERO', 'WISE_OLD_MAN', 'GREAT_MOTHER', 'PUER_AETERNUS', 'TRICKSTER']);
 export const IntegrationStatusEnum = z.enum(['unconscious', 'confrontation', 'assimilation', 'integrated']);
 export const PlanetEnum = z.enum(['Sun', 'Moon', 'Mercury', 'Venus', 'Mars', 'Jupiter', 'Saturn', 'Uranus', 'Neptune', 'Pluto']);
@@ -19,6 +19,7 @@ export const DreamIngestionObjectSchema = z.object({
   input_modality: InputModalityEnum,
   content_raw: z.string(),
   biometric_context: z.record(z.any()).optional(),
+  biometric_session_id: z.string().uuid().optional(),
 });
 
 export const ArchetypalNodeSchema = z.object({